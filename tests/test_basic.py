@@ -33,7 +33,35 @@ class Test2DO(unittest.TestCase):
         # Test preferences
         config.set_preference("test_pref", "test_value")
         self.assertEqual(config.get_preference("test_pref"), "test_value")
-    
+
+    def test_config_yaml_cache(self):
+        """Test parsed YAML cache is reused and refreshed when the file changes"""
+        from twodo.config import _load_yaml_cached, _yaml_cache_file
+
+        config_file = Path(self.temp_dir) / "config.yaml"
+        cache_dir = Path(self.temp_dir) / "cache"
+        config_file.write_text("api_keys:\n  openai: key-1\n")
+
+        self.assertEqual(_load_yaml_cached(config_file, cache_dir), {"api_keys": {"openai": "key-1"}})
+        self.assertTrue(_yaml_cache_file(config_file, cache_dir).exists())
+        self.assertEqual(_load_yaml_cached(config_file, cache_dir), {"api_keys": {"openai": "key-1"}})
+
+        # Changing the file invalidates the cached copy
+        config_file.write_text("api_keys:\n  openai: key-22\n")
+        self.assertEqual(_load_yaml_cached(config_file, cache_dir), {"api_keys": {"openai": "key-22"}})
+
+    def test_setup_batch_prompts(self):
+        """Test setup picks providers in one answer and only asks for chosen keys"""
+        from unittest.mock import patch
+        from twodo import cli
+
+        with patch.object(cli, "_safe_prompt", side_effect=["2, 4, 9", "anthropic-key", ""]) as prompt, \
+                patch.object(cli, "console"):
+            answers = cli._batch_prompts(cli._SETUP_API_KEY_PROMPTS)
+
+        self.assertEqual(answers, {"anthropic": "anthropic-key"})
+        self.assertEqual(prompt.call_count, 3)
+
     def test_todo_manager(self):
         """Test todo management functionality"""
         # Use temporary directory to avoid test interference
@@ -61,6 +89,86 @@ class Test2DO(unittest.TestCase):
         self.assertEqual(updated_todo["status"], "completed")
         self.assertEqual(updated_todo["result"], "Test result")
     
+    def test_todo_manager_cached_views(self):
+        """Test cached todo views are refreshed after every change"""
+        todo_manager = TodoManager(Path(self.temp_dir) / "views_config")
+        low_id = todo_manager.add_todo("Low", "", "general", "low")
+        high_id = todo_manager.add_todo("High", "", "general", "high")
+        
+        self.assertEqual([t["id"] for t in todo_manager.get_top_todos(1)], [high_id])
+        self.assertEqual([t["id"] for t in todo_manager.get_sorted_todos()], [high_id, low_id])
+        self.assertEqual([t["id"] for t in todo_manager.get_top_todos(1)], [high_id])
+        self.assertEqual(len(todo_manager.get_pending_todos()), 2)
+        self.assertIs(todo_manager.get_pending_todos(), todo_manager.get_pending_todos())
+        
+        todo_manager.update_todo_status(high_id, "in_progress")
+        self.assertEqual([t["id"] for t in todo_manager.get_todos_by_status("in_progress")], [high_id])
+        self.assertEqual(todo_manager.get_todos_by_status("failed"), [])
+        
+        todo_manager.update_todo_status(high_id, "completed")
+        self.assertEqual(todo_manager.get_todo_by_id(high_id)["status"], "completed")
+        self.assertEqual([t["id"] for t in todo_manager.get_pending_todos()], [low_id])
+        self.assertEqual([t["id"] for t in todo_manager.get_completed_todos()], [high_id])
+        self.assertEqual(todo_manager.get_completion_stats()["completed"], 1)
+        
+        todo_manager.delete_todo(high_id)
+        self.assertEqual(todo_manager.get_completed_todos(), [])
+        self.assertEqual(todo_manager.get_completion_stats()["total"], 1)
+        
+        other_id = todo_manager.add_todo("Other", "", "general", "medium")
+        self.assertEqual(todo_manager.delete_todos([low_id, other_id, "missing"]), 2)
+        self.assertEqual(todo_manager.get_todos(), [])
+    
+    def test_list_todos_prints_everything_when_not_interactive(self):
+        """Test piped todo listings are not cut off after the first page"""
+        from unittest.mock import patch
+        from twodo import cli
+
+        todo_manager = TodoManager(Path(self.temp_dir) / "list_config")
+        todo_manager.add_todos_bulk([
+            {"title": f"Todo {i}", "description": "", "todo_type": "general", "priority": "medium"}
+            for i in range(cli._TODO_PAGE_SIZE + 10)
+        ])
+
+        with patch.object(cli, "_is_terminal_interactive", return_value=False), \
+                patch.object(cli, "_build_todo_table") as build_table, \
+                patch.object(cli, "console"):
+            cli.handle_list_todos(todo_manager)
+
+        build_table.assert_called_once()
+        self.assertEqual(len(build_table.call_args[0][0]), cli._TODO_PAGE_SIZE + 10)
+
+    def test_pick_todo_reprompts_on_empty_answer(self):
+        """Test an empty answer doesn't select a todo by matching every title"""
+        from unittest.mock import patch
+        from twodo import cli
+
+        todo_manager = TodoManager(Path(self.temp_dir) / "pick_config")
+        todo_manager.add_todo("Only todo", "", "general", "medium")
+
+        with patch.object(cli.Prompt, "ask", side_effect=["", "cancel"]) as ask, \
+                patch.object(cli, "console"):
+            self.assertIsNone(cli._pick_todo(todo_manager, "remove"))
+
+        self.assertEqual(ask.call_count, 2)
+
+    def test_todo_manager_add_todos_bulk(self):
+        """Test adding several todos with a single save"""
+        todo_manager = TodoManager(Path(self.temp_dir) / "bulk_config")
+        parent_id = todo_manager.add_todo("Parent", "", "general", "high")
+        
+        ids = todo_manager.add_todos_bulk([
+            {"title": "First", "description": "", "todo_type": "general", "priority": "low"},
+            {"title": "Second", "description": "", "todo_type": "code", "priority": "medium",
+             "parent_id": parent_id},
+        ])
+        
+        self.assertEqual(len(ids), 2)
+        self.assertEqual([t["title"] for t in todo_manager.get_todos()], ["Parent", "First", "Second"])
+        self.assertEqual(todo_manager.get_todo_by_id(ids[1])["parent_id"], parent_id)
+        self.assertEqual(TodoManager(Path(self.temp_dir) / "bulk_config").get_todo_by_id(ids[0])["title"], "First")
+        self.assertEqual(todo_manager.add_todos_bulk([]), [])
+    
     def test_tech_stack_detection(self):
         """Test technology stack detection"""
         detector = TechStackDetector()
@@ -148,6 +256,24 @@ class Test2DO(unittest.TestCase):
         config2 = ConfigManager(str(non_git_repo), suppress_prompts=True)
         self.assertFalse(config2.is_local_project)
         self.assertFalse(str(config2.config_dir).endswith("2DO"))
+        
+        # exists() predicts local configuration without constructing a manager
+        self.assertTrue(ConfigManager.exists(str(git_repo)))
+        self.assertFalse(ConfigManager.exists(str(non_git_repo)))
+        self.assertFalse(ConfigManager.exists(None))
+    
+    def test_config_analysis_buffered_until_flush(self):
+        """Test analysis results are only written when flushed"""
+        git_repo = Path(self.temp_dir) / "analysis_repo"
+        (git_repo / ".git").mkdir(parents=True)
+        config = ConfigManager(str(git_repo), suppress_prompts=True)
+        
+        config.mark_analysis_dirty(["python"], memory_files_created=True)
+        self.assertTrue(config.has_been_analyzed())
+        self.assertNotIn("python", config.config_file.read_text() if config.config_file.exists() else "")
+        
+        config.flush_analysis()
+        self.assertIn("python", config.config_file.read_text())
     
     def test_markdown_task_parsing(self):
         """Test markdown task parsing functionality"""
@@ -246,6 +372,54 @@ class Test2DO(unittest.TestCase):
         self.assertEqual(project_info['server_port'], 3000)
         self.assertEqual(project_info['server_command'], ['npm', 'start'])
     
+    def test_priority_keywords_match_whole_words(self):
+        """Test priority detection ignores keywords embedded in other words"""
+        from twodo.cli import _PRIORITY_PATTERN, _mentioned_groups
+
+        for text in ("update markdown docs, low priority",
+                     "add a dropdown menu later",
+                     "fix countdown timer, minor"):
+            self.assertEqual(_mentioned_groups(_PRIORITY_PATTERN, text), {'low'})
+
+        self.assertEqual(_mentioned_groups(_PRIORITY_PATTERN, "the site is down"), {'critical'})
+        self.assertEqual(_mentioned_groups(_PRIORITY_PATTERN, "urgent: login is broken"), {'critical', 'high'})
+
+    def test_browser_integration_null_package_fields(self):
+        """Test browser integration tolerates null package.json fields"""
+        from twodo.browser_integration import BrowserIntegration
+
+        test_repo = Path(self.temp_dir) / "null_fields_project"
+        test_repo.mkdir()
+
+        package_json = test_repo / "package.json"
+        package_json.write_text('''{
+            "dependencies": null,
+            "devDependencies": null,
+            "scripts": null
+        }''')
+
+        browser_integration = BrowserIntegration(str(test_repo))
+        project_info = browser_integration.detect_project_type()
+
+        self.assertEqual(project_info['type'], 'unknown')
+        self.assertIsNone(project_info['server_command'])
+
+    def test_browser_integration_list_package_fields(self):
+        """Test browser integration tolerates package.json fields that aren't objects"""
+        from twodo.browser_integration import BrowserIntegration
+
+        test_repo = Path(self.temp_dir) / "list_fields_project"
+        test_repo.mkdir()
+
+        package_json = test_repo / "package.json"
+        package_json.write_text('{"dependencies": ["react"], "scripts": ["start"]}')
+
+        browser_integration = BrowserIntegration(str(test_repo))
+        project_info = browser_integration.detect_project_type()
+
+        self.assertEqual(project_info['type'], 'unknown')
+        self.assertIsNone(project_info['server_command'])
+
     def test_browser_integration_static_detection(self):
         """Test browser integration static HTML detection"""
         from twodo.browser_integration import BrowserIntegration
@@ -262,7 +436,69 @@ class Test2DO(unittest.TestCase):
         
         self.assertEqual(project_info['type'], 'static')
         self.assertEqual(project_info['server_port'], 8080)
-    
+
+    def test_browser_integration_flask_detection(self):
+        """Test browser integration Flask detection"""
+        from twodo.browser_integration import BrowserIntegration
+
+        # Test with a Flask app next to an empty entry point
+        test_repo = Path(self.temp_dir) / "flask_project"
+        test_repo.mkdir()
+        (test_repo / "app.py").write_text('')
+        (test_repo / "main.py").write_text('from FLASK import Flask\napp = Flask(__name__)\n')
+
+        browser_integration = BrowserIntegration(str(test_repo))
+        project_info = browser_integration.detect_project_type()
+
+        self.assertEqual(project_info['type'], 'flask')
+        self.assertEqual(project_info['server_command'], ['python', 'main.py'])
+        self.assertEqual(project_info['server_port'], 5000)
+
+    def test_browser_integration_await_port_ipv6(self):
+        """Test readiness probing finds a dev server listening only on ::1"""
+        import socket
+        from unittest.mock import Mock
+        from twodo.browser_integration import BrowserIntegration
+
+        try:
+            server = socket.socket(socket.AF_INET6, socket.SOCK_STREAM)
+            server.bind(("::1", 0))
+        except OSError:
+            self.skipTest("IPv6 loopback not available")
+        with server:
+            server.listen()
+            browser_integration = BrowserIntegration(self.temp_dir)
+            browser_integration.dev_server_process = Mock(**{"poll.return_value": None})
+
+            self.assertTrue(browser_integration._await_port("localhost", server.getsockname()[1], timeout=1.0))
+
+    @unittest.skipUnless(hasattr(os, "posix_spawn"), "requires posix_spawn")
+    def test_browser_integration_opener_fallback(self):
+        """Test a failing URL opener or $BROWSER falls back to webbrowser"""
+        import shutil
+        from unittest.mock import patch
+        from twodo.browser_integration import BrowserIntegration
+
+        browser_integration = BrowserIntegration(self.temp_dir)
+
+        # A generous grace period keeps the immediate-failure check reliable on busy machines
+        with patch.dict(os.environ), patch("webbrowser.open") as webbrowser_open, \
+                patch("twodo.browser_integration.URL_OPENER_GRACE", 0.5):
+            os.environ.pop("BROWSER", None)
+            browser_integration._browser_cmd = shutil.which("true")
+            self.assertTrue(browser_integration.open_browser("http://localhost:1"))
+            webbrowser_open.assert_not_called()
+
+            browser_integration._browser_cmd = shutil.which("false")
+            self.assertTrue(browser_integration.open_browser("http://localhost:2"))
+            webbrowser_open.assert_called_once_with("http://localhost:2")
+
+            webbrowser_open.reset_mock()
+            os.environ["BROWSER"] = "firefox"
+            browser_integration._browser_cmd = shutil.which("true")
+            browser_integration.open_browser("http://localhost:3")
+            webbrowser_open.assert_called_once_with("http://localhost:3")
+
     def test_browser_integration_status(self):
         """Test browser integration status tracking"""
         from twodo.browser_integration import BrowserIntegration
@@ -280,6 +516,30 @@ class Test2DO(unittest.TestCase):
         self.assertIsInstance(port, int)
         self.assertGreaterEqual(port, 8080)
     
+    def test_github_create_issues_bulk(self):
+        """Test bulk issue creation keeps results aligned with the specs"""
+        from unittest.mock import MagicMock
+        from twodo.github_integration import GitHubIntegration
+        
+        github_integration = GitHubIntegration()  # No token for testing
+        self.assertEqual(
+            github_integration.create_issues_bulk("owner", "repo", [{"title": "A", "body": ""}]),
+            [None]
+        )
+        
+        def create_issue(title, body, labels):
+            issue = MagicMock(number=len(title), title=title, html_url=f"https://example.com/{title}")
+            issue.created_at.isoformat.return_value = "2024-01-01T00:00:00"
+            return issue
+        
+        github_integration.github = MagicMock()
+        github_integration.github.get_repo.return_value.create_issue.side_effect = create_issue
+        results = github_integration.create_issues_bulk(
+            "owner", "repo", [{"title": "A", "body": ""}, {"title": "BB", "body": "", "labels": ["x"]}]
+        )
+        self.assertEqual([r["number"] for r in results], [1, 2])
+        github_integration.github.get_repo.assert_called_once_with("owner/repo")
+    
     def test_branch_name_sanitization(self):
         """Test branch name sanitization for GitHub issues"""
         from twodo.github_integration import GitHubIntegration
@@ -300,7 +560,35 @@ class Test2DO(unittest.TestCase):
         title = "Update   documentation    files"
         sanitized = github_integration._sanitize_branch_name(title)
         self.assertEqual(sanitized, "update-documentation-files")
-    
+
+    def test_automation_branch_name_generation(self):
+        """Test GitHub Pro mode branch names generated from todo titles"""
+        from twodo.automation_engine import AutomationEngine
+
+        automation_engine = AutomationEngine(None, None)
+
+        self.assertEqual(automation_engine._generate_branch_name("Fix login bug"), "todo/fix-login-bug")
+        self.assertEqual(
+            automation_engine._generate_branch_name("  Add feature: auth (OAuth2)  "),
+            "todo/add-feature-auth-oauth2"
+        )
+        self.assertEqual(len(automation_engine._generate_branch_name("x" * 80)), len("todo/") + 50)
+
+    def test_automation_run_all_uses_given_runner(self):
+        """Test run-all executes on the caller's event loop runner"""
+        from twodo.automation_engine import AutomationEngine
+
+        automation_engine = AutomationEngine(None, None)
+        coroutines = []
+
+        def run(coro):
+            coroutines.append(coro)
+            coro.close()
+            return "ran"
+
+        self.assertEqual(automation_engine.run_all_todos_sync(self.temp_dir, run=run), "ran")
+        self.assertEqual(len(coroutines), 1)
+
     def test_image_handler(self):
         """Test image handling functionality"""
         handler = ImageHandler()
@@ -329,6 +617,24 @@ class Test2DO(unittest.TestCase):
         # This should return None in test environment
         self.assertIsNone(clipboard_image)
         
+        # Checks reuse the previous result only while the clipboard sequence is unchanged
+        from unittest.mock import patch
+        with patch.object(handler, "_read_clipboard_image", return_value=test_image) as read, \
+                patch.object(handler, "_get_clipboard_sequence", return_value=7) as sequence:
+            self.assertIs(handler.check_clipboard_for_image(), test_image)
+            self.assertIs(handler.check_clipboard_for_image(), test_image)
+            self.assertEqual(read.call_count, 1)
+            
+            sequence.return_value = 8
+            handler.check_clipboard_for_image()
+            self.assertEqual(read.call_count, 2)
+            
+            # Without a sequence number every check reads the clipboard
+            sequence.return_value = None
+            handler.check_clipboard_for_image()
+            handler.check_clipboard_for_image()
+            self.assertEqual(read.call_count, 4)
+        
         # Test file path detection
         self.assertTrue(handler._is_image_file_path(temp_path))
         self.assertFalse(handler._is_image_file_path("not_an_image.txt"))
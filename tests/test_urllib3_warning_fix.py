@@ -7,8 +7,10 @@ This test verifies that the CLI properly suppresses urllib3 warnings on macOS/Li
 import unittest
 import warnings
 import urllib3
+import subprocess
 import sys
 import os
+import textwrap
 
 # Add the project root to the path
 sys.path.insert(0, '/home/runner/work/2do-developer/2do-developer')
@@ -17,27 +19,35 @@ class TestUrllib3WarningSuppression(unittest.TestCase):
     """Test that urllib3 NotOpenSSLWarning is properly suppressed"""
     
     def test_cli_import_suppresses_warnings(self):
-        """Test that importing CLI suppresses urllib3 NotOpenSSLWarning"""
+        """Test that importing CLI suppresses only the urllib3 LibreSSL warning"""
         
-        # Test the real scenario: import CLI and see if it suppresses future urllib3 warnings
-        # Note: We don't override warnings filters in this test to simulate real usage
-        with warnings.catch_warnings(record=True) as captured_warnings:
-            warnings.simplefilter("default")  # Use default warning behavior
-            
-            # Import the CLI module (this should call urllib3.disable_warnings)
+        # Run in a fresh interpreter: warning filters installed by an earlier import
+        # of the CLI in this process may already have been reset by the test runner
+        script = textwrap.dedent("""
+            import warnings
             import twodo.cli
+            from urllib3.exceptions import InsecureRequestWarning, NotOpenSSLWarning
             
-            # Test that urllib3 warnings are now filtered
-            # Check the current warning filters
-            openssl_filters = [
-                f for f in warnings.filters 
-                if f[2] == urllib3.exceptions.NotOpenSSLWarning and f[0] == 'ignore'
-            ]
-            
-            self.assertGreater(
-                len(openssl_filters), 0,
-                "urllib3.disable_warnings should have added an 'ignore' filter for NotOpenSSLWarning"
-            )
+            with warnings.catch_warnings(record=True) as captured:
+                warnings.warn_explicit(
+                    "urllib3 v2 only supports OpenSSL 1.1.1+, currently the 'ssl' module "
+                    "is compiled with 'LibreSSL 2.8.3'",
+                    NotOpenSSLWarning, "urllib3/__init__.py", 1, module="urllib3"
+                )
+                warnings.warn_explicit(
+                    "Unverified HTTPS request", InsecureRequestWarning,
+                    "urllib3/connectionpool.py", 1, module="urllib3.connectionpool"
+                )
+            print(",".join(w.category.__name__ for w in captured))
+        """)
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        
+        # The LibreSSL warning is filtered, other urllib3 warnings still show
+        self.assertEqual(result.stdout.strip(), "InsecureRequestWarning")
     
     def test_cli_functionality_preserved(self):
         """Test that CLI functionality is preserved after warning suppression"""
@@ -50,12 +50,16 @@ def _safe_prompt(message, default="", timeout=30):
             # Use Rich's Prompt.ask with timeout handling
             try:
                 import signal
+                import threading
                 
                 def timeout_handler(signum, frame):
                     raise TimeoutError("Prompt timeout")
                 
-                # Set up timeout for non-Windows systems
-                if hasattr(signal, 'SIGALRM'):
+                # Set up timeout for non-Windows systems; signal handlers can only be
+                # installed from the main thread, so prompts raised from the CLI's
+                # background event loop wait without a timeout
+                use_alarm = hasattr(signal, 'SIGALRM') and threading.current_thread() is threading.main_thread()
+                if use_alarm:
                     signal.signal(signal.SIGALRM, timeout_handler)
                     signal.alarm(timeout)
                 
@@ -64,7 +68,7 @@ def _safe_prompt(message, default="", timeout=30):
                     return result.strip() if result else default
                 finally:
                     # Clear the alarm
-                    if hasattr(signal, 'SIGALRM'):
+                    if use_alarm:
                         signal.alarm(0)
                         
             except TimeoutError:
@@ -121,6 +125,8 @@ class AIRouter:
         self.last_selected_model = None
         self.mcp_client = MCPClient(config_manager)
         self.filesystem_initialized = False
+        # Model requests currently running, keyed by (loop, model, prompt)
+        self._in_flight = {}
     
     def _initialize_models(self) -> Dict[str, ModelCapability]:
         """Initialize available models with their capabilities"""
@@ -1173,7 +1179,7 @@ REMEMBER: You have real file system access - USE IT!
         try:
             model_name = self.select_best_model(enhanced_prompt, todo_context)
             self.last_selected_model = model_name
-            return await self._process_with_model(model_name, enhanced_prompt)
+            return await self._process_with_model_shared(model_name, enhanced_prompt)
         except Exception as e:
             console.print(f"❌ Primary model failed: {str(e)}")
             
@@ -1187,7 +1193,7 @@ REMEMBER: You have real file system access - USE IT!
                 try:
                     console.print(f"🔄 Trying fallback model: {fallback_model}")
                     self.last_selected_model = fallback_model
-                    return await self._process_with_model(fallback_model, enhanced_prompt)
+                    return await self._process_with_model_shared(fallback_model, enhanced_prompt)
                 except Exception as fallback_error:
                     console.print(f"❌ Fallback model {fallback_model} failed: {str(fallback_error)}")
                     continue
@@ -1262,6 +1268,31 @@ REMEMBER: You have real file system access - USE IT!
         else:
             raise ValueError(f"Unsupported provider: {model.provider}")
     
+    async def _process_with_model_shared(self, model_name: str, prompt: str) -> str:
+        """Process prompt with a model, sharing one request between identical concurrent calls
+        
+        Multitasked todos and scheduled tasks can send the same prompt at the
+        same time; they all wait on the first request instead of each paying
+        for their own.
+        """
+        key = (asyncio.get_running_loop(), model_name, prompt)
+        entry = self._in_flight.get(key)
+        if entry is None:
+            task = asyncio.ensure_future(self._process_with_model(model_name, prompt))
+            entry = self._in_flight[key] = [task, 0]
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        
+        entry[1] += 1
+        try:
+            return await asyncio.shield(entry[0])
+        except asyncio.CancelledError:
+            # Only abandon the request when no other caller is still waiting on it
+            if entry[1] == 1:
+                entry[0].cancel()
+            raise
+        finally:
+            entry[1] -= 1
+    
     async def _process_with_model_stream(self, model_name: str, prompt: str):
         """Process prompt with a specific model using streaming responses"""
         model = self.models[model_name]
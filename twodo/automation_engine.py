@@ -9,8 +9,10 @@ import os
 import asyncio
 import subprocess
 import json
-from typing import Dict, List, Optional, Tuple, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Any
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from rich.console import Console
 from rich.prompt import Confirm, Prompt
@@ -18,6 +20,49 @@ from rich.panel import Panel
 
 console = Console()
 
+# Scaffolding request patterns, compiled once and tried in order; the first
+# match decides the template
+_SCAFFOLDING_PATTERNS = tuple(
+    (template_key, re.compile(pattern))
+    for template_key, patterns in {
+        'laravel_livewire_component': [
+            r'(create|make|generate)\s+(livewire\s+)?component\s+(\w+)',
+            r'(scaffold|generate)\s+livewire\s+(\w+)',
+        ],
+        'laravel_controller': [
+            r'(create|make|generate)\s+controller\s+(\w+)',
+            r'(scaffold|generate)\s+(resource\s+)?controller\s+(\w+)',
+        ],
+        'laravel_model': [
+            r'(create|make|generate)\s+model\s+(\w+)',
+            r'(scaffold|generate)\s+model\s+(\w+)\s+with\s+(migration|factory)',
+        ],
+        'full_tall_crud': [
+            r'(create|generate|scaffold)\s+(full\s+)?crud\s+(for\s+)?(\w+)',
+            r'(scaffold|generate)\s+complete\s+(\w+)\s+(module|crud)',
+            r'(create|build)\s+(full|complete)\s+(\w+)\s+(system|module)',
+        ]
+    }.items()
+    for pattern in patterns
+)
+
+@lru_cache(maxsize=1024)
+def _slug_branch(todo_title: str) -> str:
+    """Turn a todo title into a "todo/<slug>" branch name (cached per title)"""
+    # Single pass: keep ASCII letters/digits, collapse every other run into one dash
+    out = []
+    prev_dash = False
+    for c in todo_title:
+        if c.isascii() and c.isalnum():
+            out.append(c.lower())
+            prev_dash = False
+        elif not prev_dash:
+            out.append('-')
+            prev_dash = True
+    clean_title = ''.join(out).strip('-')[:50]  # Limit length
+    
+    return f"todo/{clean_title}"
+
 @dataclass
 class AutoTodoRequest:
     """Represents an automatically parsed todo request"""
@@ -47,6 +92,8 @@ class EnhancedAutomationEngine:
         self.github_integration = github_integration
         self.tech_detector = tech_detector
         self.github_pro_mode = False
+        self._status = None
+        self._status_key = None
         
         # Enhanced file modification patterns
         self.file_patterns = {
@@ -148,39 +195,18 @@ class EnhancedAutomationEngine:
         user_input_lower = user_input.lower()
         
         # Detect TALL stack scaffolding requests
-        scaffolding_patterns = {
-            'laravel_livewire_component': [
-                r'(create|make|generate)\s+(livewire\s+)?component\s+(\w+)',
-                r'(scaffold|generate)\s+livewire\s+(\w+)',
-            ],
-            'laravel_controller': [
-                r'(create|make|generate)\s+controller\s+(\w+)',
-                r'(scaffold|generate)\s+(resource\s+)?controller\s+(\w+)',
-            ],
-            'laravel_model': [
-                r'(create|make|generate)\s+model\s+(\w+)',
-                r'(scaffold|generate)\s+model\s+(\w+)\s+with\s+(migration|factory)',
-            ],
-            'full_tall_crud': [
-                r'(create|generate|scaffold)\s+(full\s+)?crud\s+(for\s+)?(\w+)',
-                r'(scaffold|generate)\s+complete\s+(\w+)\s+(module|crud)',
-                r'(create|build)\s+(full|complete)\s+(\w+)\s+(system|module)',
-            ]
-        }
-        
-        for template_key, patterns in scaffolding_patterns.items():
-            for pattern in patterns:
-                match = re.search(pattern, user_input_lower)
-                if match:
-                    # Extract the name (usually the last captured group)
-                    name = match.groups()[-1].capitalize()
-                    
-                    return {
-                        'template': template_key,
-                        'name': name,
-                        'scaffold_info': self.scaffold_templates[template_key],
-                        'confidence': 0.9
-                    }
+        for template_key, pattern in _SCAFFOLDING_PATTERNS:
+            match = pattern.search(user_input_lower)
+            if match:
+                # Extract the name (usually the last captured group)
+                name = match.groups()[-1].capitalize()
+                
+                return {
+                    'template': template_key,
+                    'name': name,
+                    'scaffold_info': self.scaffold_templates[template_key],
+                    'confidence': 0.9
+                }
         
         return None
     
@@ -724,37 +750,42 @@ jobs:
             console.print(f"💥 Run all encountered an error: {e}")
             return False
     
-    def run_all_todos_sync(self, working_dir=None):
-        """Synchronous wrapper for run_all_todos to avoid event loop conflicts"""
+    async def _init_and_run(self, working_dir: str):
+        """Re-initialize MCP servers for working_dir, then run all todos on the same loop"""
+        # CRITICAL FIX: Re-initialize AI router with correct working directory
+        if hasattr(self.multitasker, 'ai_router'):
+            console.print("🔧 Re-initializing AI router with correct working directory...")
+            try:
+                # Initialize all MCP servers with the correct working directory
+                await self.multitasker.ai_router.initialize_all_servers(working_dir)
+                console.print("✅ AI router re-initialized successfully")
+            except Exception as init_error:
+                console.print(f"⚠️ AI router re-initialization failed: {init_error}")
+        
+        return await self.run_all_todos()
+    
+    def run_all_todos_sync(self, working_dir=None, run=asyncio.run):
+        """Synchronous wrapper for run_all_todos to avoid event loop conflicts
+        
+        run executes a coroutine to completion; callers that own an event loop
+        pass their own so the MCP servers stay on that loop.
+        """
         try:
-            import asyncio
-            import os
-            
             # CRITICAL FIX: Ensure we have the correct working directory
             if working_dir is None:
                 working_dir = os.getcwd()
             
             console.print(f"🎯 AUTOMATION ENGINE: Using working directory: {working_dir}")
             
-            # CRITICAL FIX: Re-initialize AI router with correct working directory
-            if hasattr(self.multitasker, 'ai_router'):
-                console.print("🔧 Re-initializing AI router with correct working directory...")
-                try:
-                    # Initialize all MCP servers with the correct working directory
-                    asyncio.run(self.multitasker.ai_router.initialize_all_servers(working_dir))
-                    console.print("✅ AI router re-initialized successfully")
-                except Exception as init_error:
-                    console.print(f"⚠️ AI router re-initialization failed: {init_error}")
-            
             # Check if we're already in an event loop
             try:
                 loop = asyncio.get_running_loop()
-                # We're in a running loop, use create_task
-                task = loop.create_task(self.run_all_todos())
-                return task
             except RuntimeError:
-                # No running loop, safe to use asyncio.run
-                return asyncio.run(self.run_all_todos())
+                # No running loop, safe to run to completion ourselves
+                return run(self._init_and_run(working_dir))
+            
+            # We're in a running loop, use create_task
+            return loop.create_task(self._init_and_run(working_dir))
         except Exception as e:
             console.print(f"❌ Error in run_all_todos_sync: {e}")
             return False
@@ -770,7 +801,7 @@ jobs:
         # Check if the todo is too large and should be broken down into subtasks
         if self.todo_manager.is_todo_too_large(todo):
             # Check if it already has subtasks
-            if not todo.get("sub_task_ids") or len(todo["sub_task_ids"]) == 0:
+            if not todo.get("sub_task_ids"):
                 console.print("🔍 This task is quite large and complex.")
                 if Confirm.ask("🎯 Would you like me to break it down into smaller, more manageable sub-tasks first?"):
                     console.print("🔧 Creating sub-tasks to make this more manageable...")
@@ -846,24 +877,28 @@ jobs:
             console.print(f"❌ GitHub Pro mode error: {e}")
             return False
     
-    def _generate_branch_name(self, todo_title: str) -> str:
+    @staticmethod
+    def _generate_branch_name(todo_title: str) -> str:
         """Generate a clean branch name from todo title"""
-        # Clean the title for branch naming
-        clean_title = re.sub(r'[^a-zA-Z0-9\s-]', '', todo_title)
-        clean_title = re.sub(r'\s+', '-', clean_title.strip())
-        clean_title = clean_title.lower()[:50]  # Limit length
-        
-        return f"todo/{clean_title}"
+        return _slug_branch(todo_title)
     
-    def get_automation_status(self) -> Dict:
-        """Get current automation engine status"""
-        return {
-            'github_pro_mode': self.github_pro_mode,
-            'smart_parsing_enabled': True,
-            'instant_actions_enabled': True,
-            'run_all_available': True,
-            'github_integration': self.github_integration is not None
-        }
+    def get_automation_status(self) -> Mapping[str, bool]:
+        """Get current automation engine status
+        
+        The read-only status mapping is rebuilt only when one of the fields it
+        reports has changed, so status polling doesn't allocate a dict per call.
+        """
+        key = (self.github_pro_mode, self.github_integration is not None)
+        if self._status_key != key:
+            self._status_key = key
+            self._status = MappingProxyType({
+                'github_pro_mode': self.github_pro_mode,
+                'smart_parsing_enabled': True,
+                'instant_actions_enabled': True,
+                'run_all_available': True,
+                'github_integration': self.github_integration is not None
+            })
+        return self._status
 
 # Legacy compatibility - keeping the original class name
 class AutomationEngine(EnhancedAutomationEngine):
@@ -4,17 +4,55 @@ Browser Integration for 2DO - Provides web browser interaction during developmen
 """
 
 import os
-import subprocess
+import re
+import json
+import sys
+import mmap
+import shutil
+import signal
 import threading
 import time
 import socket
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-import psutil
+from typing import TYPE_CHECKING, Dict, Any, List, Set
 from rich.console import Console
 
+if TYPE_CHECKING:
+    import subprocess
+
 console = Console()
 
+# Matches any casing of "flask" in raw file bytes
+FLASK_RE = re.compile(rb'flask', re.IGNORECASE)
+
+# Candidate Flask entry points, in order of preference
+FLASK_ENTRY_POINTS = ("app.py", "main.py", "run.py")
+
+# Addresses a dev server started for "localhost" may be listening on
+LOOPBACK_HOSTS = ("127.0.0.1", "::1")
+
+# Seconds to give the system URL opener to fail before assuming it is opening the page
+URL_OPENER_GRACE = 0.05
+
+# Shared pool for overlapping project-detection file reads (threads start on first use)
+_DETECT_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="detect")
+
+
+def _is_flask_app(path: Path) -> bool:
+    """Check whether a Python file mentions flask, without decoding it"""
+    try:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            return FLASK_RE.search(m) is not None
+    except Exception:
+        return False
+
+
+def _object_field(data: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """Get data[key] if it is a JSON object, otherwise an empty dict"""
+    value = data.get(key)
+    return value if isinstance(value, dict) else {}
+
 
 class BrowserIntegration:
     """Manages browser interaction for development workflow"""
@@ -25,6 +63,8 @@ class BrowserIntegration:
         self.dev_server_process = None
         self.dev_server_url = None
         self.is_active = False
+        # System URL opener, resolved once so opening a page is a single spawn
+        self._browser_cmd = shutil.which("xdg-open") or shutil.which("open")
         
     def detect_project_type(self) -> Dict[str, Any]:
         """Detect the type of project and determine how to serve it"""
@@ -35,17 +75,35 @@ class BrowserIntegration:
             "server_url": None
         }
         
+        # One directory listing answers every sentinel-file check below
+        names = self._list_file_names()
+        base = Path(self.working_dir)
+        
+        # Start the file reads up front so they overlap on slow filesystems
+        pkg_future = None
+        if "package.json" in names:
+            pkg_future = _DETECT_POOL.submit((base / "package.json").read_bytes)
+        flask_futures = [
+            (flask_file, _DETECT_POOL.submit(_is_flask_app, base / flask_file))
+            for flask_file in FLASK_ENTRY_POINTS if flask_file in names
+        ]
+        
         # Check for React/Vue/Angular (package.json with scripts)
-        package_json = Path(self.working_dir) / "package.json"
-        if package_json.exists():
+        if pkg_future is not None:
             try:
-                import json
-                with open(package_json) as f:
-                    pkg_data = json.load(f)
-                    
-                scripts = pkg_data.get("scripts", {})
-                dependencies = pkg_data.get("dependencies", {})
-                dev_dependencies = pkg_data.get("devDependencies", {})
+                pkg_data = json.loads(pkg_future.result())
+            except OSError as e:
+                console.print(f"⚠️  Error reading package.json: {e}")
+            except ValueError as e:
+                console.print(f"⚠️  Invalid package.json: {e}")
+            else:
+                if not isinstance(pkg_data, dict):
+                    pkg_data = {}
+                
+                # Fields that aren't JSON objects (null, lists, ...) count as empty
+                scripts = _object_field(pkg_data, "scripts")
+                dependencies = _object_field(pkg_data, "dependencies")
+                dev_dependencies = _object_field(pkg_data, "devDependencies")
                 all_deps = {**dependencies, **dev_dependencies}
                 
                 # React project
@@ -91,42 +149,29 @@ class BrowserIntegration:
                     if "dev" in scripts:
                         project_info["server_command"] = ["npm", "run", "dev"]
                         project_info["server_port"] = 5173
-                        
-            except Exception as e:
-                console.print(f"⚠️  Error reading package.json: {e}")
         
         # Check for Laravel (composer.json + artisan)
-        composer_json = Path(self.working_dir) / "composer.json"
-        artisan_file = Path(self.working_dir) / "artisan"
-        if composer_json.exists() and artisan_file.exists():
+        if "composer.json" in names and "artisan" in names:
             project_info["type"] = "laravel"
             project_info["server_command"] = ["php", "artisan", "serve"]
             project_info["server_port"] = 8000
         
         # Check for Django (manage.py)
-        manage_py = Path(self.working_dir) / "manage.py"
-        if manage_py.exists():
+        if "manage.py" in names:
             project_info["type"] = "django"
             project_info["server_command"] = ["python", "manage.py", "runserver"]
             project_info["server_port"] = 8000
         
         # Check for Flask (app.py or main.py with flask)
-        for flask_file in ["app.py", "main.py", "run.py"]:
-            flask_path = Path(self.working_dir) / flask_file
-            if flask_path.exists():
-                try:
-                    content = flask_path.read_text()
-                    if "flask" in content.lower() or "Flask" in content:
-                        project_info["type"] = "flask"
-                        project_info["server_command"] = ["python", flask_file]
-                        project_info["server_port"] = 5000
-                        break
-                except Exception:
-                    pass
+        for flask_file, is_flask in flask_futures:
+            if is_flask.result():
+                project_info["type"] = "flask"
+                project_info["server_command"] = ["python", flask_file]
+                project_info["server_port"] = 5000
+                break
         
         # Check for static HTML files
-        html_files = list(Path(self.working_dir).glob("*.html"))
-        if html_files and project_info["type"] == "unknown":
+        if project_info["type"] == "unknown" and any(name.endswith(".html") for name in names):
             project_info["type"] = "static"
             project_info["server_port"] = 8080
         
@@ -136,6 +181,14 @@ class BrowserIntegration:
         
         return project_info
     
+    def _list_file_names(self) -> Set[str]:
+        """Snapshot the names of all non-directory entries in the working directory"""
+        try:
+            with os.scandir(self.working_dir) as it:
+                return {e.name for e in it if not e.is_dir()}
+        except OSError:
+            return set()
+    
     def find_free_port(self, start_port: int = 8080) -> int:
         """Find a free port starting from the given port"""
         for port in range(start_port, start_port + 100):
@@ -154,45 +207,79 @@ class BrowserIntegration:
             return False
         
         try:
+            port = project_info["server_port"]
             if project_info["type"] == "static":
                 # Use Python's built-in HTTP server for static files
                 port = self.find_free_port(8080)
-                self.dev_server_process = subprocess.Popen(
-                    ["python", "-m", "http.server", str(port)],
-                    cwd=self.working_dir,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
+                self.dev_server_process = self._spawn_server(
+                    [sys.executable, "-m", "http.server", str(port)]
                 )
                 self.dev_server_url = f"http://localhost:{port}"
                 console.print(f"🌐 Started static file server at {self.dev_server_url}")
                 
             elif project_info["server_command"]:
                 # Start the project's development server
-                self.dev_server_process = subprocess.Popen(
-                    project_info["server_command"],
-                    cwd=self.working_dir,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
-                )
+                self.dev_server_process = self._spawn_server(project_info["server_command"])
                 self.dev_server_url = project_info["server_url"]
                 console.print(f"🚀 Started {project_info['type']} development server at {self.dev_server_url}")
             
-            # Wait a moment for server to start
-            time.sleep(2)
+            # Wait for the server to accept connections instead of sleeping blindly
+            if self.dev_server_process and port and not self._await_port("localhost", port):
+                console.print(f"⚠️  Server is not answering on port {port} yet, continuing anyway")
             return True
             
         except Exception as e:
             console.print(f"❌ Failed to start development server: {e}")
             return False
     
+    def _await_port(self, host: str, port: int, timeout: float = 10.0) -> bool:
+        """Poll until host:port accepts a TCP connection, the server exits, or timeout passes
+        
+        localhost is probed on both loopback addresses, so servers bound only to
+        ::1 (Vite, Node 17+) are found however the name resolves here.
+        """
+        hosts = LOOPBACK_HOSTS if host == "localhost" else (host,)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            for probe_host in hosts:
+                try:
+                    socket.create_connection((probe_host, port), timeout=0.1).close()
+                    return True
+                except OSError:
+                    pass
+            if self.dev_server_process.poll() is not None:
+                return False
+            time.sleep(0.05)
+        return False
+    
+    def _spawn_server(self, command: List[str]) -> "subprocess.Popen":
+        """Launch a server command in its own session without copying the parent's memory
+        
+        Resolving the executable up front and avoiding preexec_fn keeps CPython on its
+        vfork-based launch path instead of a full fork of this (large) process.
+        """
+        import subprocess
+        
+        return subprocess.Popen(
+            command,
+            executable=shutil.which(command[0]) or command[0],
+            cwd=self.working_dir,
+            # Nobody reads the server's output; a PIPE would fill up and stall it
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            start_new_session=True
+        )
+    
     def open_browser(self, url: str = None) -> bool:
         """Open browser with the specified URL"""
         target_url = url or self.dev_server_url or "http://localhost:8080"
         
         try:
-            # First try to use system default browser (more reliable)
-            import webbrowser
-            webbrowser.open(target_url)
+            # webbrowser honours $BROWSER; otherwise try the system URL opener first
+            if os.environ.get("BROWSER") or not self._spawn_url_opener(target_url):
+                import webbrowser
+                webbrowser.open(target_url)
             console.print(f"🌐 Opened system browser at {target_url}")
             self.is_active = True
             return True
@@ -201,6 +288,46 @@ class BrowserIntegration:
             console.print(f"❌ Failed to open browser: {e}")
             return False
     
+    def _spawn_url_opener(self, url: str) -> bool:
+        """Open url with the platform's opener in one process spawn
+        
+        Returns False if the opener is unavailable or fails straight away, so the
+        caller can fall back to webbrowser.
+        """
+        if hasattr(os, "startfile"):
+            try:
+                os.startfile(url)
+            except OSError:
+                return False
+            return True
+        if not self._browser_cmd or not hasattr(os, "posix_spawn"):
+            return False
+        
+        try:
+            pid = os.posix_spawn(
+                self._browser_cmd,
+                [self._browser_cmd, url],
+                os.environ,
+                file_actions=[
+                    (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+                    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                    (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+                ]
+            )
+        except OSError:
+            return False
+        
+        # An opener that can't work (no display, no handler) exits at once with an
+        # error; one that stays up may be launching the browser, so don't wait on it
+        time.sleep(URL_OPENER_GRACE)
+        waited_pid, status = os.waitpid(pid, os.WNOHANG)
+        if waited_pid:
+            return os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+        
+        # Reap the opener in the background so it doesn't linger as a zombie
+        threading.Thread(target=os.waitpid, args=(pid, 0), daemon=True).start()
+        return True
+    
     def refresh_browser(self):
         """Refresh the browser page"""
         # This is a simplified implementation
@@ -224,9 +351,6 @@ class BrowserIntegration:
         if not self.start_dev_server(project_info):
             return False
         
-        # Wait for server to be ready
-        time.sleep(3)
-        
         # Open browser
         if not self.open_browser():
             return False
@@ -244,21 +368,23 @@ class BrowserIntegration:
         
         # Stop development server
         if self.dev_server_process:
+            import subprocess
+            
             try:
-                # Terminate the process and its children
-                parent = psutil.Process(self.dev_server_process.pid)
-                for child in parent.children(recursive=True):
-                    child.terminate()
-                parent.terminate()
+                # The server runs in its own session, so signalling its process
+                # group stops the server and any workers it forked in one call
+                self._signal_server()
                 
                 # Wait for termination
-                parent.wait(timeout=5)
+                self.dev_server_process.wait(timeout=5)
                 console.print("🛑 Development server stopped")
-            except (psutil.NoSuchProcess, psutil.TimeoutExpired):
+            except ProcessLookupError:
+                pass
+            except subprocess.TimeoutExpired:
                 # Force kill if needed
                 try:
-                    parent.kill()
-                except psutil.NoSuchProcess:
+                    self._signal_server(force=True)
+                except ProcessLookupError:
                     pass
             except Exception as e:
                 console.print(f"⚠️  Error stopping development server: {e}")
@@ -268,6 +394,16 @@ class BrowserIntegration:
         # Browser will close automatically when the thread exits
         console.print("✅ Browser integration mode stopped")
     
+    def _signal_server(self, force: bool = False):
+        """Terminate (or kill) the dev server's whole process group, or just the server on Windows"""
+        if hasattr(os, "killpg"):
+            sig = signal.SIGKILL if force else signal.SIGTERM
+            os.killpg(os.getpgid(self.dev_server_process.pid), sig)
+        elif force:
+            self.dev_server_process.kill()
+        else:
+            self.dev_server_process.terminate()
+    
     def is_server_running(self) -> bool:
         """Check if the development server is running"""
         return self.dev_server_process is not None and self.dev_server_process.poll() is None
@@ -4,53 +4,78 @@
 """
 
 # Suppress urllib3 SSL warnings that can appear on macOS with LibreSSL
-# Must be done before importing any packages that use urllib3
-try:
-    import urllib3
-    urllib3.disable_warnings(urllib3.exceptions.NotOpenSSLWarning)
-except (ImportError, AttributeError):
-    # If urllib3 not available or warning type doesn't exist, ignore
-    pass
+# Must be done before importing any packages that use urllib3. The filter matches
+# by message and module so urllib3 itself is only imported once HTTP is needed;
+# other urllib3 warnings such as InsecureRequestWarning still show.
+import warnings
+warnings.filterwarnings("ignore", message=".*LibreSSL.*", module="urllib3")
 
-import asyncio
+import atexit
 import click
+import getpass
 import os
-import yaml
+import sys
 import json
 import time
+import threading
+import importlib
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 
-from .config import ConfigManager
-from .ai_router import AIRouter
-from .todo_manager import TodoManager
-from .multitasker import Multitasker
-from .tech_stack import TechStackDetector
-from .markdown_parser import MarkdownTaskParser
-from .github_integration import GitHubIntegration
-from .browser_integration import BrowserIntegration
-from .image_handler import ImageHandler
-from .intent_router import IntentRouter
-from .permission_manager import PermissionManager, diagnose_permissions, get_session_permission_manager
-from .enhanced_file_handler import get_enhanced_file_handler
-from .automation_engine import AutomationEngine
-from .laravel_devtoolbox_integration import LaravelDevToolboxIntegration
-
-from .setup_guide import SetupGuide
-from .mcp_manager import MCPServerManager
-from .updater import UpdateManager
-from .smart_code_analyzer import SmartCodeAnalyzer
-from .automation_engine import EnhancedAutomationEngine
-from .scheduler import Scheduler
-from .escape_handler import escape_listener, check_escape_interrupt, EscapeInterrupt, raise_if_interrupted
-
 
 console = Console()
 
+# Heavy subsystems (AI SDKs, GitHub, schedulers) are imported inside the commands
+# that use them so `2do --help` and light commands start fast. Attribute access
+# such as `twodo.cli.AIRouter` still resolves them lazily.
+_LAZY_IMPORTS = {
+    "ConfigManager": ".config",
+    "AIRouter": ".ai_router",
+    "TodoManager": ".todo_manager",
+    "Multitasker": ".multitasker",
+    "TechStackDetector": ".tech_stack",
+    "MarkdownTaskParser": ".markdown_parser",
+    "GitHubIntegration": ".github_integration",
+    "BrowserIntegration": ".browser_integration",
+    "ImageHandler": ".image_handler",
+    "IntentRouter": ".intent_router",
+    "PermissionManager": ".permission_manager",
+    "diagnose_permissions": ".permission_manager",
+    "get_session_permission_manager": ".permission_manager",
+    "get_enhanced_file_handler": ".enhanced_file_handler",
+    "AutomationEngine": ".automation_engine",
+    "EnhancedAutomationEngine": ".automation_engine",
+    "LaravelDevToolboxIntegration": ".laravel_devtoolbox_integration",
+    "SetupGuide": ".setup_guide",
+    "MCPServerManager": ".mcp_manager",
+    "UpdateManager": ".updater",
+    "SmartCodeAnalyzer": ".smart_code_analyzer",
+    "Scheduler": ".scheduler",
+    "escape_listener": ".escape_handler",
+    "check_escape_interrupt": ".escape_handler",
+    "EscapeInterrupt": ".escape_handler",
+    "raise_if_interrupted": ".escape_handler",
+}
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __package__), name)
+
 def _get_colleague_task_confirmation(action: str, user_input: str) -> bool:
     """
     Get confirmation from user in a human colleague-like manner.
@@ -79,14 +104,21 @@ def _get_colleague_task_confirmation(action: str, user_input: str) -> bool:
         default=False
     )
 
+# Environment variables whose presence means we're running under CI
+_CI_ENV_VARS = frozenset({'CI', 'GITHUB_ACTIONS', 'JENKINS_URL', 'GITLAB_CI'})
+
+@lru_cache(maxsize=1)
 def _is_terminal_interactive():
-    """Enhanced terminal interactivity detection (handles curl | bash correctly)"""
-    import sys
+    """Enhanced terminal interactivity detection (handles curl | bash correctly)
     
+    The answer can't change within a process, so it is computed once; tests that
+    swap terminals can call _is_terminal_interactive.cache_clear().
+    """
     # Check if stdout and stderr are terminals (even if stdin is piped)
     if os.isatty(1) and os.isatty(2):
-        # Check if we're NOT in a CI environment
-        if not any(env in os.environ for env in ['CI', 'GITHUB_ACTIONS', 'JENKINS_URL', 'GITLAB_CI']):
+        # Check if we're NOT in a CI environment (most CI systems set CI itself,
+        # so test that single key before scanning for the others)
+        if 'CI' not in os.environ and _CI_ENV_VARS.isdisjoint(os.environ):
             # Try to access controlling terminal directly
             try:
                 return os.path.exists('/dev/tty')
@@ -95,28 +127,47 @@ def _is_terminal_interactive():
     
     return sys.stdin.isatty() and sys.stdout.isatty()
 
+def _banner(title, style):
+    """Heading for a command: a panel on a terminal, the bare title when output is piped"""
+    if not console.is_terminal:
+        return Text(title)
+    return _banner_panel(title, style)
+
+@lru_cache(maxsize=None)
+def _banner_panel(title, style):
+    """Heading panel for a command, built once per title and style"""
+    return Panel.fit(title, style=style)
+
+# Controlling terminal, opened on first use and kept for the rest of the process
+_tty = None
+
+def _get_tty():
+    """Return the shared read handle on /dev/tty, opening it on first use"""
+    global _tty
+    if _tty is None:
+        _tty = open('/dev/tty', 'r')
+        atexit.register(_tty.close)
+    return _tty
+
 def _read_from_terminal(prompt_text: str, password: bool = False) -> str:
     """Read input from controlling terminal (works with curl | bash)"""
     if _is_terminal_interactive():
         try:
             # Try to read from controlling terminal
-            with open('/dev/tty', 'r') as tty_in:
-                # Write prompt to stderr (which should be connected to terminal)
-                import sys
-                sys.stderr.write(prompt_text)
-                sys.stderr.flush()
-                
-                if password:
-                    import getpass
-                    return getpass.getpass("", stream=tty_in)
-                else:
-                    return tty_in.readline().strip()
+            tty_in = _get_tty()
+            # Write prompt to stderr (which should be connected to terminal)
+            sys.stderr.write(prompt_text)
+            sys.stderr.flush()
+            
+            if password:
+                return getpass.getpass("", stream=tty_in)
+            else:
+                return tty_in.readline().strip()
         except:
             pass
     
     # Fallback to regular prompt
     if password:
-        import getpass
         return getpass.getpass(prompt_text)
     else:
         return input(prompt_text).strip()
@@ -143,6 +194,9 @@ def _safe_prompt(message, password=False, default=""):
         if _is_terminal_interactive():
             if password:
                 result = _read_from_terminal(f"{message}: ", password=True)
+            elif not default:
+                # Nothing to show or fall back to, so skip Rich's prompt rendering
+                result = input(f"{message}: ")
             else:
                 result = Prompt.ask(message, default=default)
             return result.strip() if result else default
@@ -157,13 +211,195 @@ def _safe_prompt(message, password=False, default=""):
         console.print(f"⚠️ Could not get input for: {message}")
         return default
 
+_safe_working_directory = None
+
+# (provider, choice shown in the form, key prompt, display name) asked by `2do setup`
+_SETUP_API_KEY_PROMPTS = (
+    ("openai", "OpenAI models", "Enter your OpenAI API key", "OpenAI"),
+    ("anthropic", "Anthropic Claude models", "Enter your Anthropic API key", "Anthropic"),
+    ("google", "Google Gemini models (optional)", "Enter your Google AI API key", "Google AI"),
+    ("github", "GitHub integration", "Enter your GitHub personal access token", "GitHub"),
+)
+
+def _batch_prompts(items):
+    """Ask a set of opt-in secret prompts as one grouped form and return the answers by key
+    
+    All choices are shown in one panel and picked with a single answer; only the
+    chosen secrets are then asked for. Nothing is applied while prompting, so
+    callers can persist all answers at once.
+    """
+    console.print(Panel(
+        "\n".join(f"{number}. {choice}" for number, (_key, choice, _prompt, _label) in enumerate(items, 1)),
+        title="Which would you like to configure?",
+        expand=False
+    ))
+    selection = _safe_prompt("Enter numbers separated by commas, 'all', or leave blank to skip", default="")
+    if selection.lower() == "all":
+        chosen = range(len(items))
+    else:
+        chosen = sorted({int(number) - 1 for number in re.findall(r"\d+", selection)
+                         if 0 < int(number) <= len(items)})
+    
+    answers = {}
+    for index in chosen:
+        key, _choice, prompt, _label = items[index]
+        value = _safe_prompt(prompt, password=True)
+        if value:
+            answers[key] = value
+    return answers
+
 def _get_safe_working_directory():
-    """Get current working directory with fallback"""
+    """Get current working directory with fallback
+    
+    The CLI never changes directory, so the first successful lookup is reused.
+    """
+    global _safe_working_directory
+    if _safe_working_directory is None:
+        try:
+            _safe_working_directory = os.getcwd()
+        except (OSError, FileNotFoundError):
+            # If we can't get current directory, fall back to home directory
+            return str(Path.home())
+    return _safe_working_directory
+
+# Event loop kept alive on a background thread for the length of an interactive
+# session, so MCP server transports and other loop-bound state outlive each call
+_session_loop = None
+
+def _start_session_loop():
+    """Start the background event loop used by the interactive session"""
+    import asyncio
+    
+    global _session_loop
+    if _session_loop is None:
+        loop = asyncio.new_event_loop()
+        threading.Thread(target=loop.run_forever, name="2do-session-loop", daemon=True).start()
+        _session_loop = loop
+    return _session_loop
+
+def _stop_session_loop():
+    """Stop and close the interactive session's background event loop"""
+    global _session_loop
+    loop, _session_loop = _session_loop, None
+    if loop is not None:
+        loop.call_soon_threadsafe(loop.stop)
+
+def _submit_async(coro):
+    """Schedule coro on the session loop without waiting for it; returns a concurrent.futures.Future"""
+    import asyncio
+    
+    return asyncio.run_coroutine_threadsafe(coro, _start_session_loop())
+
+# Main-thread runner reused by every async call of a one-shot command; a plain
+# event loop stands in for asyncio.Runner before Python 3.11
+_command_runner = None
+_command_loop = None
+
+def _close_command_loop():
+    """Finish async generators and close the pre-3.11 command loop"""
+    loop = _command_loop
+    try:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
+
+def _run_command_async(coro):
+    """Run coro on one event loop kept for the whole command, closed at exit"""
+    import asyncio
+    
+    global _command_runner, _command_loop
+    if sys.version_info < (3, 11):
+        if _command_loop is None:
+            _command_loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(_command_loop)
+            atexit.register(_close_command_loop)
+        return _command_loop.run_until_complete(coro)
+    
+    if _command_runner is None:
+        _command_runner = asyncio.Runner()
+        atexit.register(_command_runner.close)
+    return _command_runner.run(coro)
+
+def _run_async(coro):
+    """Run coro to completion on the session loop, or on the command's loop outside a session"""
+    if _session_loop is None:
+        return _run_command_async(coro)
+    future = _submit_async(coro)
     try:
-        return os.getcwd()
-    except (OSError, FileNotFoundError):
-        # If we can't get current directory, fall back to home directory
-        return str(Path.home())
+        return future.result()
+    except KeyboardInterrupt:
+        # Don't leave the coroutine running on the session loop after Ctrl+C
+        future.cancel()
+        raise
+
+def _initialize_servers_alongside(ai_router, working_dir, *factories):
+    """Initialize all MCP servers while blocking factories run on worker threads
+    
+    Returns the factories' results in order.
+    """
+    import asyncio
+    
+    async def initialize():
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            ai_router.initialize_all_servers(working_dir),
+            *(loop.run_in_executor(None, factory) for factory in factories)
+        )
+        return results[1:]
+    
+    return _run_async(initialize())
+
+# Fully initialized automation stacks by working directory, reused by later
+# commands in the same process
+_automation_engines = {}
+
+def _build_automation_engine(working_dir, config_manager):
+    """Get the automation engine for working_dir, starting its MCP servers on first use"""
+    engine = _automation_engines.get(working_dir)
+    if engine is not None:
+        return engine
+    
+    from .ai_router import AIRouter
+    from .todo_manager import TodoManager
+    from .multitasker import Multitasker
+    from .github_integration import GitHubIntegration
+    from .automation_engine import AutomationEngine
+    
+    ai_router = AIRouter(config_manager)
+    
+    # CRITICAL FIX: Initialize all MCP servers with correct project path.
+    # The GitHub connection check and todo loading overlap with server startup.
+    console.print(f"🎯 Initializing all MCP servers for directory: {working_dir}")
+    github_integration, todo_manager = _initialize_servers_alongside(
+        ai_router, working_dir,
+        lambda: GitHubIntegration(config_manager.get_api_key("github")),
+        lambda: TodoManager(config_manager.config_dir)
+    )
+    
+    multitasker = Multitasker(ai_router, todo_manager)
+    engine = AutomationEngine(todo_manager, multitasker, github_integration)
+    _automation_engines[working_dir] = engine
+    return engine
+
+def _invalidate_automation_engines():
+    """Forget cached automation engines, e.g. after API keys or config change"""
+    _automation_engines.clear()
+
+# Config and permission-session managers by working directory, shared by the
+# permission and file commands run in the same process
+_session_contexts = {}
+
+def _get_session_context(working_dir):
+    """Get (config_manager, session_manager) for working_dir, loading them on first use"""
+    context = _session_contexts.get(working_dir)
+    if context is None:
+        from .config import ConfigManager
+        from .permission_manager import get_session_permission_manager
+        
+        config_manager = ConfigManager(working_dir)
+        context = (config_manager, get_session_permission_manager(config_manager.config_dir))
+        _session_contexts[working_dir] = context
+    return context
 
 def _show_manual_setup_instructions(config_manager):
     """Show manual setup instructions"""
@@ -187,7 +423,30 @@ def _show_manual_setup_instructions(config_manager):
         style="cyan"
     ))
 
-@click.group()
+class LazyGroup(click.Group):
+    """click Group that imports some subcommands only when they are looked up"""
+    
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # command name -> "module.path:attribute"
+        self.lazy_subcommands = lazy_subcommands or {}
+    
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+    
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            module_name, attr = self.lazy_subcommands[cmd_name].split(":")
+            return getattr(importlib.import_module(module_name), attr)
+        return super().get_command(ctx, cmd_name)
+
+@click.group(cls=LazyGroup, lazy_subcommands={
+    "agent-status": "twodo.commands.agents:agent_status",
+    "agent-daemon": "twodo.commands.agents:agent_daemon",
+    "agent-help": "twodo.commands.agents:agent_help",
+    "agent-messages": "twodo.commands.agents:agent_messages",
+    "agent-collaborate": "twodo.commands.agents:agent_collaborate",
+})
 @click.version_option(version="0.1.0", package_name=None)
 def cli():
     """2DO - Intelligent AI model routing and multitasking CLI tool"""
@@ -197,7 +456,11 @@ def cli():
 @click.option('--non-interactive', is_flag=True, help='Skip interactive prompts and show manual setup instructions')
 def setup(non_interactive):
     """Initial setup - configure AI model API keys"""
-    console.print(Panel.fit("🚀 Welcome to 2DO Setup", style="bold blue"))
+    from .config import ConfigManager
+    from .tech_stack import TechStackDetector
+    from .mcp_manager import MCPServerManager
+    
+    console.print(_banner("🚀 Welcome to 2DO Setup", "bold blue"))
     
     try:
         config_manager = ConfigManager()
@@ -215,33 +478,13 @@ def setup(non_interactive):
     console.print("\n📋 Let's configure your AI models:")
     
     try:
-        # OpenAI
-        if _safe_confirm("Do you want to use OpenAI models?"):
-            api_key = _safe_prompt("Enter your OpenAI API key", password=True)
-            if api_key:
-                config_manager.set_api_key("openai", api_key)
-                console.print("✅ OpenAI configured")
-        
-        # Anthropic
-        if _safe_confirm("Do you want to use Anthropic Claude models?"):
-            api_key = _safe_prompt("Enter your Anthropic API key", password=True)
-            if api_key:
-                config_manager.set_api_key("anthropic", api_key)
-                console.print("✅ Anthropic configured")
-        
-        # Google AI (optional)
-        if _safe_confirm("Do you want to use Google Gemini models? (optional)"):
-            api_key = _safe_prompt("Enter your Google AI API key", password=True)
-            if api_key:
-                config_manager.set_api_key("google", api_key)
-                console.print("✅ Google AI configured")
-        
-        # GitHub
-        if _safe_confirm("Do you want to configure GitHub integration?"):
-            github_token = _safe_prompt("Enter your GitHub personal access token", password=True)
-            if github_token:
-                config_manager.set_api_key("github", github_token)
-                console.print("✅ GitHub configured")
+        # Collect every key first, then write the config once
+        api_keys = _batch_prompts(_SETUP_API_KEY_PROMPTS)
+        config_manager.set_api_keys(api_keys)
+        _invalidate_automation_engines()
+        for provider, _question, _prompt, label in _SETUP_API_KEY_PROMPTS:
+            if provider in api_keys:
+                console.print(f"✅ {label} configured")
         
         # Optional MCP server setup
         console.print("\n🔌 MCP Server Setup (Optional)")
@@ -275,7 +518,9 @@ def setup(non_interactive):
 @click.option('--project', '-p', help='Project directory to verify (default: current directory)')
 def verify(project):
     """Verify 2DO setup and guide through missing components"""
-    console.print(Panel.fit("🔍 2DO Setup Verification", style="bold cyan"))
+    from .setup_guide import SetupGuide
+    
+    console.print(_banner("🔍 2DO Setup Verification", "bold cyan"))
     
     project_dir = project if project else os.getcwd()
     
@@ -301,16 +546,36 @@ def start(repo, force_analyze):
     # Run the interactive session directly without escape handler for normal operation
     _start_interactive_session(repo, force_analyze)
 
+# Inputs that show the natural language help in the interactive session
+_HELP_WORDS = frozenset({"help", "?", "commands", "h"})
+
 def _start_interactive_session(repo, force_analyze):
     """Internal method for the interactive session logic"""
+    from .config import ConfigManager
+    from .ai_router import AIRouter
+    from .todo_manager import TodoManager
+    from .multitasker import Multitasker
+    from .tech_stack import TechStackDetector
+    from .github_integration import GitHubIntegration
+    from .browser_integration import BrowserIntegration
+    from .image_handler import ImageHandler
+    from .intent_router import IntentRouter
+    from .automation_engine import AutomationEngine
+    from concurrent.futures import TimeoutError as FuturesTimeoutError
+    
     # Determine the working directory with error handling
     working_dir = repo if repo else _get_safe_working_directory()
     
     # Check if we're in a git repository
+    is_project = ConfigManager.exists(working_dir)
     try:
-        config_manager = ConfigManager(working_dir)
+        config_manager = ConfigManager(working_dir if is_project else None)
     except Exception as e:
         console.print(f"❌ Error initializing configuration: {e}")
+        if not is_project:
+            # The global configuration is what just failed; don't build it again
+            console.print("💡 Please run '2do setup' from your home directory")
+            return
         console.print("💡 Falling back to global configuration")
         try:
             config_manager = ConfigManager()
@@ -319,8 +584,12 @@ def _start_interactive_session(repo, force_analyze):
             console.print("💡 Please run '2do setup' from your home directory")
             return
     
+    is_local_project = config_manager.is_local_project
+    # Analysis results are buffered during the session; make sure they reach disk
+    atexit.register(config_manager.flush_analysis)
+    
     # Simplified project detection - only show if not in a git repo
-    if not config_manager.is_local_project:
+    if not is_local_project:
         console.print("🏠 Using global configuration")
     
     if not config_manager.has_api_keys():
@@ -332,13 +601,12 @@ def _start_interactive_session(repo, force_analyze):
     
     ai_router = AIRouter(config_manager)
     
-    # Initialize MCP filesystem server (silent initialization)
+    # Initialize MCP filesystem server in the background while the rest of the
+    # session (GitHub lookup, tech-stack analysis) is set up
     try:
-        import asyncio
-        filesystem_success = asyncio.run(ai_router.initialize_filesystem(working_dir))
-        if not filesystem_success:
-            console.print("⚠️ File operations limited - install Node.js for full functionality")
-    except Exception as e:
+        filesystem_future = _submit_async(ai_router.initialize_filesystem(working_dir))
+    except Exception:
+        filesystem_future = None
         console.print("⚠️ File operations limited - install Node.js for full functionality")
     
     todo_manager = TodoManager(config_manager.config_dir)
@@ -353,14 +621,14 @@ def _start_interactive_session(repo, force_analyze):
     
     # Get repository info if we're in a git repo
     repo_info = None
-    if config_manager.is_local_project:
+    if is_local_project:
         repo_info = github_integration.get_repository_info(working_dir)
         if repo_info:
             console.print(f"📁 {repo_info['full_name']} ({repo_info['current_branch']})")
 
     # Handle repository analysis with memory
     tech_stack = []
-    if repo or config_manager.is_local_project:
+    if repo or is_local_project:
         analysis_path = repo if repo else working_dir
         
         # Check if we should skip analysis
@@ -378,12 +646,12 @@ def _start_interactive_session(repo, force_analyze):
                 tech_stack = tech_detector.get_existing_analysis()
                 if tech_stack:
                     console.print(f"🔍 Tech stack: {', '.join(tech_stack)}")
-                    config_manager.save_analysis_results(tech_stack, memory_files_created=True)
+                    config_manager.mark_analysis_dirty(tech_stack, memory_files_created=True)
         
         if not tech_stack or force_analyze:
             # Run fresh analysis
             console.print("🔍 Analyzing repository...")
-            tech_stack = tech_detector.analyze_repo(analysis_path, force_reanalyze=force_analyze)
+            tech_stack = tech_detector.analyze_repo(analysis_path, force_reanalyze=force_analyze, max_workers=os.cpu_count())
             console.print(f"🔍 Tech stack: {', '.join(tech_stack)}")
             
             # Create memory files for tech stack
@@ -392,8 +660,19 @@ def _start_interactive_session(repo, force_analyze):
                 tech_detector.create_memory_files(tech_stack)
                 memory_files_created = True
             
-            # Save analysis results
-            config_manager.save_analysis_results(tech_stack, memory_files_created)
+            # Record analysis results; they are written once when the session ends
+            config_manager.mark_analysis_dirty(tech_stack, memory_files_created)
+    
+    # Make sure the filesystem server is ready before the first request
+    if filesystem_future is not None:
+        try:
+            filesystem_success = filesystem_future.result(timeout=10)
+            if not filesystem_success:
+                console.print("⚠️ File operations limited - install Node.js for full functionality")
+        except FuturesTimeoutError:
+            console.print("⏳ File server is still starting in the background...")
+        except Exception as e:
+            console.print("⚠️ File operations limited - install Node.js for full functionality")
     
     # Interactive session with natural language interface
     console.print("\n🤖 Welcome to 2DO - Your AI-powered development companion!")
@@ -403,141 +682,108 @@ def _start_interactive_session(repo, force_analyze):
     # Add developer-focused context to AI router
     ai_router.set_developer_context(intent_router.get_developer_context_prompt())
     
-    while True:
-        console.print("\n" + "="*50)
-        
-        # Natural language prompt with more human-like tone
-        user_input = Prompt.ask(
-            "[bold cyan]Hey! What can I help you with today?[/bold cyan]",
-            default=""
-        )
-        
-        if not user_input.strip():
-            console.print("😊 No worries! Let me know what you're working on whenever you're ready.")
-            show_natural_language_help()
-            continue
-        
-        # Handle special commands
-        if user_input.lower().strip() in ["help", "?", "commands"]:
-            show_natural_language_help()
-            continue
-        
-        # Analyze intent
-        intent_match = intent_router.analyze_intent(user_input)
-        action = intent_match.intent
-        
-        # Show friendly confirmation with human colleague tone
-        confirmation = intent_router.get_friendly_confirmation(action, intent_match.extracted_params)
-        console.print(f"\n{confirmation}")
-        
-        # Human colleague-like task confirmation workflow
-        if action in ["add-todo", "multitask", "run-all"]:
-            should_run_now = _get_colleague_task_confirmation(action, user_input)
-            if not should_run_now:
-                console.print("👍 Got it! I'll add this to your list and you can tackle it later when you're ready.")
-                # Continue with adding to list but don't execute
-                if action == "add-todo":
-                    handle_add_todo_natural(todo_manager, ai_router, image_handler, user_input, intent_match.extracted_params, execute_immediately=False, multitasker=multitasker)
-                continue
-        
-        if action == "quit":
-            console.print("👋 Take care! Feel free to come back whenever you need help with your work.")
-            # Clean up browser integration before quitting
-            if browser_integration.is_active:
-                browser_integration.stop_browser_mode()
-            break
-        elif action == "add-todo":
-            # Try simple file modification first for basic requests
-            simple_handled = handle_simple_file_modification(user_input, working_dir)
-            if not simple_handled:
-                # Try smart todo parsing
-                smart_todo_handled = asyncio.run(automation_engine.handle_smart_todo_creation(user_input))
-                if not smart_todo_handled:
-                    # Fallback to traditional todo creation
-                    handle_add_todo_natural(todo_manager, ai_router, image_handler, user_input, intent_match.extracted_params, multitasker=multitasker)
-        elif action == "list-todos":
-            handle_list_todos(todo_manager)
-        elif action == "remove-todo":
-            handle_remove_todo(todo_manager)
-        elif action == "remove-completed-todos":
-            handle_remove_completed_todos(todo_manager)
-        elif action == "create-subtasks":
-            handle_create_subtasks(todo_manager, ai_router)
-        elif action == "multitask":
-            console.print("🔥 Great! Let me process your pending tasks with multiple AI agents working in parallel.")
-            handle_multitask(multitasker, todo_manager, browser_integration)
-        elif action == "run-all":
-            # The ultimate shortcut - run all todos at once!
-            console.print("🚀 Awesome! I'll get all your pending work done with up to 5 AI agents. This is going to be efficient!")
-            # CRITICAL FIX: Pass working directory to ensure correct file operations
-            automation_engine.run_all_todos_sync(working_dir)
-        elif action == "parse-markdown":
-            handle_parse_markdown(todo_manager, working_dir)
-        elif action == "mcp-management":
-            handle_manage_mcp(config_manager, working_dir)
-        elif action == "browser-integration":
-            handle_browser_integration_natural(browser_integration, user_input)
-        elif action == "github-issues":
-            handle_github_issues(github_integration, todo_manager, repo_info, working_dir)
-        elif action == "create-github-issue":
-            handle_create_github_issue_natural(github_integration, repo_info, user_input, intent_match.extracted_params)
-        elif action == "export-todos-to-github":
-            if repo_info and github_integration.github:
-                handle_export_todos_to_github(github_integration, todo_manager, repo_info)
-        elif action == "chat":
-            handle_chat_natural(ai_router, image_handler, user_input)
-        else:
-            # Fallback to chat for unrecognized intents - more human-like
-            console.print("🤔 Hmm, I'm not quite sure what you're asking for, but let me try to help anyway!")
-            handle_chat_natural(ai_router, image_handler, user_input)
-
-@cli.command()
-@click.option('--project', '-p', help='Project directory to analyze (default: current directory)')
-@click.option('--list', 'list_servers', is_flag=True, help='List currently configured MCP servers')
-@click.option('--recommend', is_flag=True, help='Show recommendations without configuring')
-def mcp(project, list_servers, recommend):
-    """Manage MCP (Model Context Protocol) servers"""
-    console.print(Panel.fit("🔌 MCP Server Management", style="bold blue"))
-    
     try:
-        # Determine working directory
-        working_dir = project if project else os.getcwd()
-        
-        # Initialize managers
-        config_manager = ConfigManager(working_dir)
-        tech_stack_detector = TechStackDetector(config_manager.config_dir)
-        mcp_manager = MCPServerManager(config_manager, tech_stack_detector)
-        
-        if list_servers:
-            # List currently configured servers
-            mcp_manager.list_configured_servers()
-            return
-        
-        if recommend:
-            # Show recommendations only
-            recommended_servers = mcp_manager.run_tech_stack_analysis_and_recommend(working_dir)
-            mcp_manager.display_recommended_servers(recommended_servers)
-            return
-        
-        # Run full interactive setup
-        success = mcp_manager.setup_mcp_servers_interactive(working_dir)
-        
-        if success:
-            console.print("\n✅ MCP servers setup completed successfully!")
-            console.print("💡 You can view configured servers with: 2do mcp --list")
-        else:
-            console.print("\n⚠️ MCP server setup was not completed")
+        while True:
+            console.print("\n" + "="*50)
             
-    except Exception as e:
-        console.print(f"❌ Error during MCP server management: {e}")
-        console.print("💡 Try running '2do setup' first to ensure proper configuration")
+            # Natural language prompt with more human-like tone
+            user_input = Prompt.ask(
+                "[bold cyan]Hey! What can I help you with today?[/bold cyan]",
+                default=""
+            )
+            
+            command_word = user_input.strip().lower()
+            if not command_word:
+                console.print("😊 No worries! Let me know what you're working on whenever you're ready.")
+                show_natural_language_help()
+                continue
+            
+            # Handle special commands
+            if command_word in _HELP_WORDS:
+                show_natural_language_help()
+                continue
+            
+            # Analyze intent
+            intent_match = intent_router.analyze_intent(user_input)
+            action = intent_match.intent
+            
+            # Show friendly confirmation with human colleague tone
+            confirmation = intent_router.get_friendly_confirmation(action, intent_match.extracted_params)
+            console.print(f"\n{confirmation}")
+            
+            # Human colleague-like task confirmation workflow
+            if action in ["add-todo", "multitask", "run-all"]:
+                should_run_now = _get_colleague_task_confirmation(action, user_input)
+                if not should_run_now:
+                    console.print("👍 Got it! I'll add this to your list and you can tackle it later when you're ready.")
+                    # Continue with adding to list but don't execute
+                    if action == "add-todo":
+                        handle_add_todo_natural(todo_manager, ai_router, image_handler, user_input, intent_match.extracted_params, execute_immediately=False, multitasker=multitasker)
+                    continue
+            
+            if action == "quit":
+                console.print("👋 Take care! Feel free to come back whenever you need help with your work.")
+                # Clean up browser integration before quitting
+                if browser_integration.is_active:
+                    browser_integration.stop_browser_mode()
+                break
+            elif action == "add-todo":
+                # Try simple file modification first for basic requests
+                simple_handled = handle_simple_file_modification(user_input, working_dir)
+                if not simple_handled:
+                    # Try smart todo parsing
+                    smart_todo_handled = _run_async(automation_engine.handle_smart_todo_creation(user_input))
+                    if not smart_todo_handled:
+                        # Fallback to traditional todo creation
+                        handle_add_todo_natural(todo_manager, ai_router, image_handler, user_input, intent_match.extracted_params, multitasker=multitasker)
+            elif action == "list-todos":
+                handle_list_todos(todo_manager)
+            elif action == "remove-todo":
+                handle_remove_todo(todo_manager)
+            elif action == "remove-completed-todos":
+                handle_remove_completed_todos(todo_manager)
+            elif action == "create-subtasks":
+                handle_create_subtasks(todo_manager, ai_router)
+            elif action == "multitask":
+                console.print("🔥 Great! Let me process your pending tasks with multiple AI agents working in parallel.")
+                handle_multitask(multitasker, todo_manager, browser_integration)
+            elif action == "run-all":
+                # The ultimate shortcut - run all todos at once!
+                console.print("🚀 Awesome! I'll get all your pending work done with up to 5 AI agents. This is going to be efficient!")
+                # CRITICAL FIX: Pass working directory to ensure correct file operations
+                automation_engine.run_all_todos_sync(working_dir, run=_run_async)
+            elif action == "parse-markdown":
+                handle_parse_markdown(todo_manager, working_dir)
+            elif action == "mcp-management":
+                handle_manage_mcp(config_manager, working_dir)
+            elif action == "browser-integration":
+                handle_browser_integration_natural(browser_integration, user_input)
+            elif action == "github-issues":
+                handle_github_issues(github_integration, todo_manager, repo_info, working_dir)
+            elif action == "create-github-issue":
+                handle_create_github_issue_natural(github_integration, repo_info, user_input, intent_match.extracted_params)
+            elif action == "export-todos-to-github":
+                if repo_info and github_integration.github:
+                    handle_export_todos_to_github(github_integration, todo_manager, repo_info)
+            elif action == "chat":
+                handle_chat_natural(ai_router, image_handler, user_input)
+            else:
+                # Fallback to chat for unrecognized intents - more human-like
+                console.print("🤔 Hmm, I'm not quite sure what you're asking for, but let me try to help anyway!")
+                handle_chat_natural(ai_router, image_handler, user_input)
+    finally:
+        _stop_session_loop()
+        config_manager.flush_analysis()
 
 @cli.command()
 @click.option('--project', '-p', help='Project directory to analyze (default: current directory)')
 @click.option('--force', is_flag=True, help='Force re-analysis even if already analyzed')
 def analyze(project, force):
     """Analyze repository technology stack and create memory files"""
-    console.print(Panel.fit("🔍 Repository Analysis", style="bold cyan"))
+    from .config import ConfigManager
+    from .tech_stack import TechStackDetector
+    
+    console.print(_banner("🔍 Repository Analysis", "bold cyan"))
     
     # Determine working directory
     working_dir = project if project else _get_safe_working_directory()
@@ -561,7 +807,7 @@ def analyze(project, force):
         
         # Run analysis
         console.print(f"📁 Analyzing repository: {working_dir}")
-        tech_stack = tech_detector.analyze_repo(working_dir, force_reanalyze=True)
+        tech_stack = tech_detector.analyze_repo(working_dir, force_reanalyze=True, max_workers=os.cpu_count())
         
         if not tech_stack:
             console.print("⚠️ No technologies detected")
@@ -588,6 +834,8 @@ def analyze(project, force):
 @click.option('--force', is_flag=True, help='Force update even if already up to date')
 def update(check_only, force):
     """Check for and install 2DO updates"""
+    from .updater import UpdateManager
+    
     try:
         updater = UpdateManager()
         
@@ -602,13 +850,35 @@ def update(check_only, force):
         console.print(f"❌ Update error: {e}")
         raise click.ClickException("Update process failed")
 
+# Status labels indexed by a server's "enabled" flag
+_MCP_STATUS = ("❌ Disabled", "✅ Enabled")
+
 @cli.command()
 @click.option('--interactive', is_flag=True, default=True, help='Interactive configuration mode')
 @click.option('--list', 'list_servers', is_flag=True, help='List configured MCP servers')
-def mcp(interactive, list_servers):
+@click.option('--project', '-p', help='Project directory to analyze (default: current directory)')
+@click.option('--recommend', is_flag=True, help='Show recommendations for the project without configuring')
+def mcp(interactive, list_servers, project, recommend):
     """Configure advanced MCP servers for enhanced AI capabilities"""
     from .config import ConfigManager
-    from rich.table import Table
+    
+    if recommend:
+        # Recommend servers based on the project's tech stack
+        from .tech_stack import TechStackDetector
+        from .mcp_manager import MCPServerManager
+        
+        try:
+            working_dir = project if project else _get_safe_working_directory()
+            project_config = ConfigManager(working_dir)
+            tech_stack_detector = TechStackDetector(project_config.config_dir)
+            mcp_manager = MCPServerManager(project_config, tech_stack_detector)
+            
+            recommended_servers = mcp_manager.run_tech_stack_analysis_and_recommend(working_dir)
+            mcp_manager.display_recommended_servers(recommended_servers)
+        except Exception as e:
+            console.print(f"❌ Error during MCP server management: {e}")
+            console.print("💡 Try running '2do setup' first to ensure proper configuration")
+        return
     
     config_manager = ConfigManager()
     
@@ -626,14 +896,17 @@ def mcp(interactive, list_servers):
         table.add_column("Status", style="yellow")
         table.add_column("Description", style="white")
         
-        for server in servers:
-            status = "✅ Enabled" if server.get('enabled', True) else "❌ Disabled"
-            table.add_row(
+        rows = [
+            (
                 server.get('name', 'Unknown'),
                 server.get('type', 'Unknown'),
-                status,
-                server.get('description', 'No description')
+                _MCP_STATUS[bool(server.get('enabled', True))],
+                server.get('description', 'No description'),
             )
+            for server in servers
+        ]
+        for row in rows:
+            table.add_row(*row)
         
         console.print(table)
         return
@@ -665,7 +938,9 @@ def mcp(interactive, list_servers):
 @click.option('--list-supported', is_flag=True, help='Show supported models from built-in list')
 def add_ai(provider, model, api_key, list_supported):
     """Add AI models and providers with your own API keys"""
-    console.print(Panel.fit("🤖 Add AI Models", style="bold blue"))
+    from .config import ConfigManager
+    
+    console.print(_banner("🤖 Add AI Models", "bold blue"))
     
     # Initialize config manager
     working_dir = os.getcwd()
@@ -689,7 +964,10 @@ def add_ai(provider, model, api_key, list_supported):
 @click.option('--status', is_flag=True, help='Show local model status')
 def local_models(enable, disable, list_models, status):
     """Manage local AI models for privacy and offline use"""
-    console.print(Panel.fit("🏠 Local AI Models", style="bold green"))
+    from .config import ConfigManager
+    from .ai_router import AIRouter
+    
+    console.print(_banner("🏠 Local AI Models", "bold green"))
     
     try:
         working_dir = _get_safe_working_directory()
@@ -765,7 +1043,9 @@ def local_models(enable, disable, list_models, status):
 @click.option('--status', is_flag=True, help='Show streaming status')
 def streaming(enable, disable, status):
     """Manage AI response streaming for real-time output"""
-    console.print(Panel.fit("⚡ Streaming Responses", style="bold blue"))
+    from .config import ConfigManager
+    
+    console.print(_banner("⚡ Streaming Responses", "bold blue"))
     
     try:
         working_dir = _get_safe_working_directory()
@@ -809,7 +1089,9 @@ def streaming(enable, disable, status):
 @click.argument('value', required=False)
 def config_command(action, key, value):
     """Manage 2DO configuration settings"""
-    console.print(Panel.fit("⚙️ Configuration Management", style="bold cyan"))
+    from .config import ConfigManager
+    
+    console.print(_banner("⚙️ Configuration Management", "bold cyan"))
     
     try:
         working_dir = _get_safe_working_directory()
@@ -893,7 +1175,10 @@ def config_command(action, key, value):
 @click.option('--show-configured', is_flag=True, help='Show only configured models')
 def ai_list(show_free, show_configured):
     """List all available AI models and their status"""
-    console.print(Panel.fit("🤖 Available AI Models", style="bold blue"))
+    from .config import ConfigManager
+    from .ai_router import AIRouter
+    
+    console.print(_banner("🤖 Available AI Models", "bold blue"))
     
     # Initialize components
     working_dir = os.getcwd() 
@@ -904,8 +1189,6 @@ def ai_list(show_free, show_configured):
 
 def handle_simple_file_modification(user_input: str, working_dir: str) -> bool:
     """Handle simple file modifications directly without verbose todo creation"""
-    import re
-    
     # Simple patterns for direct file modification
     simple_patterns = [
         # "add X to [end of] file.ext"
@@ -961,6 +1244,24 @@ def handle_simple_file_modification(user_input: str, working_dir: str) -> bool:
     
     return False
 
+def _read_pasted_content():
+    """Read multi-line content until EOF (Ctrl+D)
+    
+    Piped input is read in one call; a terminal keeps line-by-line input() so
+    the user still gets line editing.
+    """
+    if not sys.stdin.isatty():
+        content = sys.stdin.read()
+        # Match the line-by-line path, which drops the final newline
+        return content[:-1] if content.endswith("\n") else content
+    
+    lines = []
+    try:
+        while True:
+            lines.append(input())
+    except EOFError:
+        return "\n".join(lines)
+
 def handle_add_todo(todo_manager, ai_router, image_handler):
     """Handle adding a new todo item"""
     title = Prompt.ask("Todo title")
@@ -989,13 +1290,7 @@ def handle_add_todo(todo_manager, ai_router, image_handler):
     if todo_type in ["code", "text"]:
         if Confirm.ask("Do you want to paste content now?"):
             console.print("Enter content (Ctrl+D to finish):")
-            lines = []
-            try:
-                while True:
-                    line = input()
-                    lines.append(line)
-            except EOFError:
-                content = "\n".join(lines)
+            content = _read_pasted_content()
     elif todo_type == "image":
         # Check for clipboard image first
         clipboard_image_path = image_handler.prompt_for_clipboard_image()
@@ -1019,80 +1314,165 @@ def handle_add_todo(todo_manager, ai_router, image_handler):
                 console.print(f"✅ Created {len(sub_task_ids)} sub-tasks!")
                 console.print("💡 Use 'list-todos' to see the sub-tasks.")
 
-def handle_list_todos(todo_manager):
-    """Display all todos in a nice table"""
+# Todos rendered per page by handle_list_todos
+_TODO_PAGE_SIZE = 50
+
+# Todo table columns as (header, style, width). Every column except Title has a
+# fixed width and Title is capped, so Rich has little to measure per render.
+_TODO_COLUMNS = (
+    ("ID", "cyan", 8),
+    ("Title", "bold", None),
+    ("Type", "magenta", 8),
+    ("Priority", "yellow", 8),
+    ("Status", "green", 12),
+    ("Created", "dim", 10),
+)
+_TODO_TITLE_MAX_WIDTH = 72
+
+# Table labels for todo statuses and priorities
+_STATUS_DISPLAY = MappingProxyType({
+    "pending": "⏳ Pending",
+    "in_progress": "🔄 In Progress",
+    "completed": "✅ Completed",
+    "failed": "❌ Failed"
+})
+_PRIORITY_DISPLAY = MappingProxyType({
+    "critical": "🔥 Critical",
+    "high": "🔴 High",
+    "medium": "🟡 Medium",
+    "low": "🟢 Low"
+})
+
+@lru_cache(maxsize=4096)
+def _format_created(created_at):
+    """Format an ISO created_at timestamp as MM/DD for todo tables"""
+    # Fast path for the YYYY-MM-DD... strings TodoManager writes; the date part
+    # is used as written, exactly as fromisoformat would keep it
+    if (len(created_at) >= 10 and created_at[4] == '-' and created_at[7] == '-'
+            and created_at[5:7].isdigit() and created_at[8:10].isdigit()):
+        return f"{created_at[5:7]}/{created_at[8:10]}"
+    
+    iso = created_at[:-1] + '+00:00' if created_at.endswith('Z') else created_at
+    try:
+        return datetime.fromisoformat(iso).strftime("%m/%d")
+    except ValueError:
+        return created_at[:10] if len(created_at) >= 10 else created_at
+
+def _todo_row(todo):
+    """Format one todo as a row of the todo table"""
+    status = todo.get("status", "pending")
+    status_display = _STATUS_DISPLAY.get(status, status)
+    
+    priority = todo.get("priority", "medium")
+    priority_display = _PRIORITY_DISPLAY.get(priority, priority)
+    
+    created_at = todo.get("created_at", "")
+    created_display = _format_created(created_at) if created_at else "N/A"
+    
+    title = todo.get("title", "")
+    if len(title) > 50:
+        title = title[:47] + "..."
+    
+    if todo.get("parent_id"):
+        title = f"  ↳ {title}"  # Indent sub-tasks
+    elif todo.get("sub_task_ids"):
+        title = f"📁 {title} ({len(todo['sub_task_ids'])} sub-tasks)"
+    
+    return (
+        todo.get("id", "")[:8],
+        title,
+        todo.get("todo_type", "general"),
+        priority_display,
+        status_display,
+        created_display
+    )
+
+def _build_todo_table(todos):
+    """Build the todo table for the given (already ordered) todos"""
+    table = Table(title="📋 Your Todos", expand=False)
+    for header, style, width in _TODO_COLUMNS:
+        if width is None:
+            table.add_column(header, style=style, max_width=_TODO_TITLE_MAX_WIDTH)
+        else:
+            table.add_column(header, style=style, width=width)
+    
+    for todo in todos:
+        table.add_row(*_todo_row(todo))
+    return table
+
+def handle_list_todos(todo_manager, page_size=_TODO_PAGE_SIZE):
+    """Display all todos in a nice table, a page at a time for long lists in a terminal"""
     todos = todo_manager.get_todos()
     
     if not todos:
         console.print("📝 No todos found. Add some with 'add-todo'!")
         return
     
-    table = Table(title="📋 Your Todos")
-    table.add_column("ID", style="cyan", width=8)
-    table.add_column("Title", style="bold")
-    table.add_column("Type", style="magenta", width=8)
-    table.add_column("Priority", style="yellow", width=8)
-    table.add_column("Status", style="green", width=12)
-    table.add_column("Created", style="dim", width=10)
-    
-    priority_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-    sorted_todos = sorted(todos, key=lambda x: (
-        priority_order.get(x.get("priority", "medium"), 2),
-        x.get("created_at", "")
-    ))
-    
-    for todo in sorted_todos:
-        status = todo.get("status", "pending")
-        status_display = {
-            "pending": "⏳ Pending",
-            "in_progress": "🔄 In Progress", 
-            "completed": "✅ Completed",
-            "failed": "❌ Failed"
-        }.get(status, status)
-        
-        priority = todo.get("priority", "medium")
-        priority_display = {
-            "critical": "🔥 Critical",
-            "high": "🔴 High",
-            "medium": "🟡 Medium",
-            "low": "🟢 Low"
-        }.get(priority, priority)
-        
-        created_at = todo.get("created_at", "")
-        if created_at:
-            try:
-                from datetime import datetime
-                dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                created_display = dt.strftime("%m/%d")
-            except:
-                created_display = created_at[:10] if len(created_at) >= 10 else created_at
-        else:
-            created_display = "N/A"
-        
-        title = todo.get("title", "")
-        if len(title) > 50:
-            title = title[:47] + "..."
-        
-        if todo.get("parent_id"):
-            title = f"  ↳ {title}"  # Indent sub-tasks
-        elif todo.get("sub_task_ids") and len(todo["sub_task_ids"]) > 0:
-            title = f"📁 {title} ({len(todo['sub_task_ids'])} sub-tasks)"
-        
-        table.add_row(
-            todo.get("id", "")[:8],
-            title,
-            todo.get("todo_type", "general"),
-            priority_display,
-            status_display,
-            created_display
-        )
-    
-    console.print(table)
+    if not _is_terminal_interactive():
+        # Pipes and scripts get the complete list in one table
+        console.print(_build_todo_table(todo_manager.get_sorted_todos()))
+    else:
+        # Only the first page is selected up front; the full order is sorted (and
+        # cached) only if the user pages on. Only rows that are shown get formatted.
+        page = todo_manager.get_top_todos(page_size)
+        console.print(_build_todo_table(page))
+        offset = len(page)
+        while offset < len(todos):
+            remaining = len(todos) - offset
+            if not _safe_confirm(
+                f"... and {remaining} more. Show the next {min(page_size, remaining)}?", default=False
+            ):
+                console.print(f"... {remaining} more todos not shown")
+                break
+            page = todo_manager.get_sorted_todos()[offset:offset + page_size]
+            console.print(_build_todo_table(page))
+            offset += len(page)
     
     stats = todo_manager.get_completion_stats()
     completion_rate = (stats['completed'] / stats['total'] * 100) if stats['total'] > 0 else 0
     console.print(f"\n📊 Progress: {stats['completed']}/{stats['total']} completed ({completion_rate:.1f}%)")
 
+_PICKER_SIZE = 20
+
+def _pick_todo(todo_manager, action):
+    """Let the user pick a todo by ID or title fragment from a short candidate list
+    
+    Only up to _PICKER_SIZE candidates are printed instead of the full todo table.
+    Returns the chosen todo, or None if the user cancels or nothing matches.
+    """
+    candidates = todo_manager.get_top_todos(_PICKER_SIZE)
+    while True:
+        for todo in candidates:
+            console.print(f"  • [cyan]{todo['id'][:8]}[/cyan]: {todo['title']}")
+        total = len(todo_manager.get_todos())
+        if total > len(candidates):
+            console.print(f"  ... {total - len(candidates)} more, type part of a title to narrow")
+        
+        answer = Prompt.ask(f"\nEnter the ID or title of the todo to {action} (or 'cancel' to abort)").strip()
+        if answer.lower() == 'cancel':
+            console.print("🚫 Cancelled.")
+            return None
+        if not answer:
+            # An empty fragment would match every todo
+            console.print("⚠️ Please enter an ID or part of a title.")
+            continue
+        
+        todo = todo_manager.get_todo_by_id(answer)
+        if todo:
+            return todo
+        
+        needle = answer.lower()
+        matches = [
+            todo for todo in todo_manager.get_sorted_todos()
+            if todo['id'].startswith(answer) or needle in todo['title'].lower()
+        ]
+        if len(matches) == 1:
+            return matches[0]
+        if not matches:
+            console.print(f"❌ Todo with ID '{answer}' not found.")
+            return None
+        candidates = matches[:_PICKER_SIZE]
+
 def handle_remove_todo(todo_manager):
     """Handle removing a todo by ID"""
     todos = todo_manager.get_todos()
@@ -1101,22 +1481,13 @@ def handle_remove_todo(todo_manager):
         console.print("📝 No todos found to remove.")
         return
     
-    handle_list_todos(todo_manager)
-    
-    todo_id = Prompt.ask("\nEnter the ID of the todo to remove (or 'cancel' to abort)")
-    
-    if todo_id.lower() == 'cancel':
-        console.print("🚫 Todo removal cancelled.")
-        return
-    
-    todo = todo_manager.get_todo_by_id(todo_id)
+    todo = _pick_todo(todo_manager, "remove")
     if not todo:
-        console.print(f"❌ Todo with ID '{todo_id}' not found.")
         return
     
     console.print(f"\n📋 Todo to remove: {todo['title']}")
     if Confirm.ask("Are you sure you want to delete this todo?"):
-        success = todo_manager.delete_todo(todo_id)
+        success = todo_manager.delete_todo(todo['id'])
         if success:
             console.print("✅ Todo removed successfully!")
         else:
@@ -1126,8 +1497,7 @@ def handle_remove_todo(todo_manager):
 
 def handle_remove_completed_todos(todo_manager):
     """Handle removing all completed todos"""
-    todos = todo_manager.get_todos()
-    completed_todos = [todo for todo in todos if todo.get("status") == "completed"]
+    completed_todos = todo_manager.get_completed_todos()
     
     if not completed_todos:
         console.print("📝 No completed todos found to remove.")
@@ -1138,10 +1508,7 @@ def handle_remove_completed_todos(todo_manager):
         console.print(f"  • {todo['id'][:8]}: {todo['title']}")
     
     if Confirm.ask(f"\nAre you sure you want to delete all {len(completed_todos)} completed todos?"):
-        removed_count = 0
-        for todo in completed_todos:
-            if todo_manager.delete_todo(todo['id']):
-                removed_count += 1
+        removed_count = todo_manager.delete_todos([todo['id'] for todo in completed_todos])
         
         console.print(f"✅ Removed {removed_count} completed todos!")
         
@@ -1155,6 +1522,8 @@ def handle_remove_completed_todos(todo_manager):
 
 def handle_multitask(multitasker, todo_manager, browser_integration):
     """Start multitasking on todos"""
+    from .escape_handler import escape_listener, EscapeInterrupt
+    
     todos = todo_manager.get_pending_todos()
     
     if not todos:
@@ -1167,8 +1536,8 @@ def handle_multitask(multitasker, todo_manager, browser_integration):
     if Confirm.ask("Proceed with multitasking?"):
         try:
             with escape_listener() as escape_handler:
-                # CRITICAL FIX: start_multitask is now async, use asyncio.run
-                asyncio.run(multitasker.start_multitask(todos))
+                # CRITICAL FIX: start_multitask is now async, run it on the shared loop
+                _run_async(multitasker.start_multitask(todos))
                 
                 if escape_handler.is_interrupted():
                     console.print("⚠️ Multitasking interrupted by user")
@@ -1186,40 +1555,45 @@ def handle_multitask(multitasker, todo_manager, browser_integration):
         except KeyboardInterrupt:
             console.print("⚠️ Multitasking interrupted by user (Ctrl+C)")
 
+# Chat help text, rendered in a single print
+_CHAT_HELP = "\n".join([
+    "\n📖 Chat Help - Available Commands:",
+    "=" * 50,
+    "\n🎯 Chat Commands:",
+    "   ?        - Show this help",
+    "   exit     - Return to main menu",
+    "   image    - Load an image file manually",
+    "\n🤖 AI Features:",
+    "   • 2DO automatically chooses the best AI model for your prompt",
+    "   • Supports image analysis - paste images from clipboard automatically",
+    "   • Intelligent routing based on prompt complexity and type",
+    "\n💡 Tips:",
+    "   • Just type your question or request naturally",
+    "   • Images from clipboard are detected automatically",
+    "   • For image files, type 'image' to browse and select",
+    "   • Use 'exit' to return to the main 2DO menu",
+    "=" * 50,
+    ""
+])
+
 def show_chat_help():
     """Display help information for chat commands"""
-    console.print("\n📖 Chat Help - Available Commands:")
-    console.print("=" * 50)
-    
-    # Chat-specific commands
-    console.print("\n🎯 Chat Commands:")
-    console.print("   ?        - Show this help")
-    console.print("   exit     - Return to main menu")
-    console.print("   image    - Load an image file manually")
-    
-    # AI and functionality info
-    console.print("\n🤖 AI Features:")
-    console.print("   • 2DO automatically chooses the best AI model for your prompt")
-    console.print("   • Supports image analysis - paste images from clipboard automatically")
-    console.print("   • Intelligent routing based on prompt complexity and type")
-    
-    # Tips
-    console.print("\n💡 Tips:")
-    console.print("   • Just type your question or request naturally")
-    console.print("   • Images from clipboard are detected automatically")
-    console.print("   • For image files, type 'image' to browse and select")
-    console.print("   • Use 'exit' to return to the main 2DO menu")
-    console.print("=" * 50)
-    console.print()
+    console.print(_CHAT_HELP)
 
 def handle_chat(ai_router, image_handler):
     """Handle interactive chat with AI routing"""
+    from .escape_handler import escape_listener, EscapeHandler, EscapeInterrupt
+    
     console.print("💬 Chat")
     console.print("💡 Type '?' for help, 'exit' to return to main menu, or press Escape to interrupt AI responses\n")
     
     # Clean up old temporary files
     image_handler.cleanup_old_temp_files()
     
+    # Piped or scripted sessions can't paste images or press Escape, so skip the
+    # clipboard probe and the key listener thread there
+    interactive = sys.stdin.isatty() and sys.stdout.isatty()
+    
     while True:
         prompt = Prompt.ask("You")
         if prompt.lower() == 'exit':
@@ -1236,13 +1610,12 @@ def handle_chat(ai_router, image_handler):
                 prompt = Prompt.ask("What would you like to know about this image?")
             else:
                 continue
-        else:
+        elif interactive:
             # Check for clipboard image automatically (non-intrusive)
             try:
                 image = image_handler.check_clipboard_for_image()
                 if image is not None:
                     console.print("🖼️  Image detected in clipboard!")
-                    from rich.prompt import Confirm
                     if Confirm.ask("Include this image with your prompt?"):
                         image_handler.display_image_info(image)
                         clipboard_image_path = image_handler.save_image_temporarily(image)
@@ -1273,13 +1646,14 @@ def handle_chat(ai_router, image_handler):
             # Check if streaming is enabled
             use_streaming = config_manager.get_preference("enable_streaming", True) if 'config_manager' in locals() else True
             
-            with escape_listener() as escape_handler:
+            listener = escape_listener() if interactive else nullcontext(EscapeHandler())
+            with listener as escape_handler:
                 if image_path:
                     # Legacy format support
                     if hasattr(ai_router, 'route_and_process_with_image'):
                         response = ai_router.route_and_process_with_image(prompt, image_path)
                     else:
-                        response = asyncio.run(ai_router.route_and_process(f"{prompt}\n\n[Image: {image_path}]"))
+                        response = _run_async(ai_router.route_and_process(f"{prompt}\n\n[Image: {image_path}]"))
                     console.print(f"\n🤖 AI: {response}\n")
                 else:
                     if use_streaming:
@@ -1294,11 +1668,11 @@ def handle_chat(ai_router, image_handler):
                                 full_response += chunk
                             return full_response
                         
-                        response = asyncio.run(stream_response())
+                        response = _run_async(stream_response())
                         console.print("\n")  # New line after streaming
                     else:
                         # Use non-streaming response (original behavior)
-                        response = asyncio.run(ai_router.route_and_process(prompt_with_image))
+                        response = _run_async(ai_router.route_and_process(prompt_with_image))
                         console.print(f"\n🤖 AI: {response}\n")
                 
                 if escape_handler.is_interrupted():
@@ -1312,6 +1686,8 @@ def handle_chat(ai_router, image_handler):
 
 def handle_parse_markdown(todo_manager, working_dir):
     """Handle parsing markdown files for tasks"""
+    from .markdown_parser import MarkdownTaskParser
+    
     parser = MarkdownTaskParser()
     
     # Ask for file or directory
@@ -1368,6 +1744,9 @@ def handle_parse_markdown(todo_manager, working_dir):
 
 def handle_manage_mcp(config_manager, working_dir):
     """Handle MCP server management in interactive mode"""
+    from .tech_stack import TechStackDetector
+    from .mcp_manager import MCPServerManager
+    
     try:
         console.print("\n🔌 MCP Server Management")
         
@@ -1507,8 +1886,11 @@ def handle_export_todos_to_github(github_integration, todo_manager, repo_info):
         return
     
     # Separate parent todos from sub-tasks for better organization
-    parent_todos = [todo for todo in pending_todos if not todo.get("parent_id")]
-    sub_todos = [todo for todo in pending_todos if todo.get("parent_id")]
+    parent_todos = []
+    sub_todos = []
+    for todo in pending_todos:
+        (sub_todos if todo.get("parent_id") else parent_todos).append(todo)
+    sub_tasks_by_parent = todo_manager.get_subtasks_by_parent()
     
     console.print(f"📋 Found {len(pending_todos)} pending todos:")
     console.print(f"   📁 {len(parent_todos)} parent todos")
@@ -1516,8 +1898,8 @@ def handle_export_todos_to_github(github_integration, todo_manager, repo_info):
     
     # Show preview
     for i, todo in enumerate(parent_todos[:5], 1):
-        sub_count = len(todo.get("sub_task_ids", []))
-        sub_info = f" (with {sub_count} sub-tasks)" if sub_count > 0 else ""
+        sub_task_ids = todo.get("sub_task_ids")
+        sub_info = f" (with {len(sub_task_ids)} sub-tasks)" if sub_task_ids else ""
         console.print(f"   {i}. {todo['title']}{sub_info}")
     
     if len(parent_todos) > 5:
@@ -1525,7 +1907,7 @@ def handle_export_todos_to_github(github_integration, todo_manager, repo_info):
     
     # Ask user preference for handling sub-tasks
     export_option = "parent-only"
-    if any(len(todo.get("sub_task_ids", [])) > 0 for todo in parent_todos):
+    if any(todo.get("sub_task_ids") for todo in parent_todos):
         export_option = Prompt.ask(
             "How would you like to handle todos with sub-tasks?",
             choices=["parent-only", "with-subtasks", "subtasks-as-issues"],
@@ -1538,9 +1920,15 @@ def handle_export_todos_to_github(github_integration, todo_manager, repo_info):
     # Export todos
     created_issues = []
     total_issues_created = 0
+    # Todos exported as plain issues; created together once all specs are built
+    bulk_todos = []
+    issue_specs = []
+    # (todo_id, status, result) updates, saved together after the export
+    status_updates = []
     
     for todo in parent_todos:
-        if export_option == "subtasks-as-issues" and len(todo.get("sub_task_ids", [])) > 0:
+        has_subtasks = bool(todo.get("sub_task_ids"))
+        if export_option == "subtasks-as-issues" and has_subtasks:
             # Use the new sub-task aware export function
             result = github_integration.export_todo_with_subtasks_to_github(
                 repo_info['owner'], 
@@ -1554,63 +1942,74 @@ def handle_export_todos_to_github(github_integration, todo_manager, repo_info):
                 total_issues_created += 1 + len(result['sub_issues'])
                 
                 # Update parent todo status
-                todo_manager.update_todo_status(
+                status_updates.append((
                     todo['id'], 
                     "completed", 
                     f"Exported as GitHub issue #{result['parent_issue']['number']}: {result['parent_issue']['url']}"
-                )
+                ))
                 
                 # Update sub-task statuses
-                for sub_issue in result['sub_issues']:
-                    todo_manager.update_todo_status(
+                status_updates.extend(
+                    (
                         sub_issue['todo_id'],
                         "completed",
                         f"Exported as GitHub issue #{sub_issue['issue_number']}: {sub_issue['issue_url']}"
                     )
+                    for sub_issue in result['sub_issues']
+                )
         else:
             # Traditional export (with or without sub-task info in description)
-            body = f"{todo['description']}\n\n"
+            parts = [todo['description'], ""]
             if todo['content']:
-                body += f"**Details:**\n{todo['content']}\n\n"
+                parts += ["**Details:**", todo['content'], ""]
             
             # Include sub-task information if requested
             if export_option == "with-subtasks":
-                sub_tasks = todo_manager.get_sub_tasks(todo['id'])
+                sub_tasks = sub_tasks_by_parent.get(todo['id'], [])
                 if sub_tasks:
-                    body += f"**Sub-tasks ({len(sub_tasks)} items):**\n"
-                    for i, sub_task in enumerate(sub_tasks, 1):
-                        body += f"{i}. {sub_task['title']} - {sub_task['description']}\n"
-                    body += "\n"
+                    parts.append(f"**Sub-tasks ({len(sub_tasks)} items):**")
+                    parts.extend(
+                        f"{i}. {sub_task['title']} - {sub_task['description']}"
+                        for i, sub_task in enumerate(sub_tasks, 1)
+                    )
+                    parts.append("")
             
-            body += f"**Priority:** {todo['priority']}\n"
-            body += f"**Type:** {todo['todo_type']}\n"
-            body += f"**Created:** {todo['created_at']}"
+            parts += [
+                f"**Priority:** {todo['priority']}",
+                f"**Type:** {todo['todo_type']}",
+                f"**Created:** {todo['created_at']}"
+            ]
+            body = "\n".join(parts)
             
             # Create labels based on todo type and priority
             labels = [f"priority-{todo['priority']}", f"type-{todo['todo_type']}"]
-            if len(todo.get("sub_task_ids", [])) > 0:
+            if has_subtasks:
                 labels.append("has-subtasks")
             
-            issue_info = github_integration.create_issue(
-                repo_info['owner'], 
-                repo_info['repo_name'], 
-                todo['title'], 
-                body, 
-                labels
-            )
-            
-            if issue_info:
-                created_issues.append(issue_info)
-                total_issues_created += 1
-                # Update todo with GitHub issue reference
-                todo_manager.update_todo_status(
-                    todo['id'], 
-                    "completed", 
-                    f"Exported as GitHub issue #{issue_info['number']}: {issue_info['url']}"
-                )
-                console.print(f"✅ Created issue #{issue_info['number']}: {todo['title']}")
-            else:
-                console.print(f"❌ Failed to create issue for: {todo['title']}")
+            bulk_todos.append(todo)
+            issue_specs.append({"title": todo['title'], "body": body, "labels": labels})
+    
+    # Create the plain issues concurrently, then record every export in one save
+    issue_results = github_integration.create_issues_bulk(
+        repo_info['owner'], 
+        repo_info['repo_name'], 
+        issue_specs
+    )
+    for todo, issue_info in zip(bulk_todos, issue_results):
+        if issue_info:
+            created_issues.append(issue_info)
+            total_issues_created += 1
+            # Update todo with GitHub issue reference
+            status_updates.append((
+                todo['id'], 
+                "completed", 
+                f"Exported as GitHub issue #{issue_info['number']}: {issue_info['url']}"
+            ))
+            console.print(f"✅ Created issue #{issue_info['number']}: {todo['title']}")
+        else:
+            console.print(f"❌ Failed to create issue for: {todo['title']}")
+    if status_updates:
+        todo_manager.update_todos_bulk(status_updates)
     
     if created_issues:
         console.print(f"\n🎉 Successfully exported {len(parent_todos)} todos as {total_issues_created} GitHub issues!")
@@ -1662,7 +2061,7 @@ def handle_create_subtasks(todo_manager, ai_router):
     # Filter to show only parent todos (no sub-tasks) that don't already have sub-tasks
     candidate_todos = [
         todo for todo in todos 
-        if not todo.get("parent_id") and len(todo.get("sub_task_ids", [])) == 0
+        if not todo.get("parent_id") and not todo.get("sub_task_ids")
     ]
     
     if not candidate_todos:
@@ -1694,7 +2093,7 @@ def handle_create_subtasks(todo_manager, ai_router):
         console.print("❌ Cannot create sub-tasks for a sub-task")
         return
     
-    if len(selected_todo.get("sub_task_ids", [])) > 0:
+    if selected_todo.get("sub_task_ids"):
         console.print("❌ This todo already has sub-tasks")
         return
     
@@ -1717,60 +2116,120 @@ def handle_create_subtasks(todo_manager, ai_router):
         console.print("❌ Failed to create sub-tasks")
 
 
+# Natural language help text, rendered in a single print
+_NATURAL_LANGUAGE_HELP = "\n".join([
+    "\n🎯 2DO Natural Language Help",
+    "=" * 50,
+    "\n💬 Just tell me what you want to do! Here are some examples:",
+    "\n📝 [bold]Managing Todos:[/bold]",
+    "   • 'Add a todo for fixing the login bug'",
+    "   • 'Create a task to implement user authentication'",
+    "   • 'I need to debug the payment system'",
+    "   • 'Show me my current tasks'",
+    "   • 'What am I working on?'",
+    "   • 'Break down my complex task into smaller pieces'",
+    "   • 'Remove todo by ID'",
+    "   • 'Delete completed todos'",
+    "   • 'Clean up finished tasks'",
+    "\n🤖 [bold]SMART TODO AUTOMATION:[/bold]",
+    "   • 'Change the text in readme.md from Hello to Hi'",
+    "   • 'Add a new function called validateUser to auth.js'",
+    "   • 'Fix the bug in payment.py line 42'",
+    "   • 'Replace the old API call with the new one in app.js'",
+    "   • 'Remove the deprecated function from utils.py'",
+    "   • 'Refactor the database connection in config.py'",
+    "\n🚀 [bold]ULTIMATE SHORTCUTS:[/bold]",
+    "   • 'run all' - Start multitasking on ALL pending todos",
+    "   • 'execute everything' - Maximum productivity mode",
+    "   • 'start all todos' - The ultimate automation shortcut",
+    "\n🐙 [bold]GitHub Integration:[/bold]",
+    "   • 'Show me GitHub issues'",
+    "   • 'Create a GitHub issue for the API bug'",
+    "   • 'Export my todos to GitHub'",
+    "   • 'Sync with repository issues'",
+    "\n🌐 [bold]Development Tools:[/bold]",
+    "   • 'Start browser integration'",
+    "   • 'Parse markdown files for tasks'",
+    "   • 'Manage MCP servers'",
+    "   • 'Run multitask on all todos'",
+    "\n💡 [bold]Getting Help:[/bold]",
+    "   • 'How do I implement OAuth?'",
+    "   • 'Help me with React state management'",
+    "   • 'Explain database indexing'",
+    "   • 'What's the best way to handle errors?'",
+    "\n🚪 [bold]Exiting:[/bold]",
+    "   • 'quit', 'exit', 'bye', 'done'",
+    "\n🤖 Remember: I'm here to help make your development workflow faster and more enjoyable!",
+    "=" * 50
+])
+
+
 def show_natural_language_help():
     """Display help for the natural language interface"""
-    console.print("\n🎯 2DO Natural Language Help")
-    console.print("=" * 50)
-    
-    console.print("\n💬 Just tell me what you want to do! Here are some examples:")
-    
-    console.print("\n📝 [bold]Managing Todos:[/bold]")
-    console.print("   • 'Add a todo for fixing the login bug'")
-    console.print("   • 'Create a task to implement user authentication'")
-    console.print("   • 'I need to debug the payment system'")
-    console.print("   • 'Show me my current tasks'")
-    console.print("   • 'What am I working on?'")
-    console.print("   • 'Break down my complex task into smaller pieces'")
-    console.print("   • 'Remove todo by ID'")
-    console.print("   • 'Delete completed todos'")
-    console.print("   • 'Clean up finished tasks'")
-    
-    console.print("\n🤖 [bold]SMART TODO AUTOMATION:[/bold]")
-    console.print("   • 'Change the text in readme.md from Hello to Hi'")
-    console.print("   • 'Add a new function called validateUser to auth.js'")
-    console.print("   • 'Fix the bug in payment.py line 42'")
-    console.print("   • 'Replace the old API call with the new one in app.js'")
-    console.print("   • 'Remove the deprecated function from utils.py'")
-    console.print("   • 'Refactor the database connection in config.py'")
-    
-    console.print("\n🚀 [bold]ULTIMATE SHORTCUTS:[/bold]")
-    console.print("   • 'run all' - Start multitasking on ALL pending todos")
-    console.print("   • 'execute everything' - Maximum productivity mode")
-    console.print("   • 'start all todos' - The ultimate automation shortcut")
-    
-    console.print("\n🐙 [bold]GitHub Integration:[/bold]")
-    console.print("   • 'Show me GitHub issues'")
-    console.print("   • 'Create a GitHub issue for the API bug'")
-    console.print("   • 'Export my todos to GitHub'")
-    console.print("   • 'Sync with repository issues'")
-    
-    console.print("\n🌐 [bold]Development Tools:[/bold]")
-    console.print("   • 'Start browser integration'")
-    console.print("   • 'Parse markdown files for tasks'")
-    console.print("   • 'Manage MCP servers'")
-    console.print("   • 'Run multitask on all todos'")
-    
-    console.print("\n💡 [bold]Getting Help:[/bold]")
-    console.print("   • 'How do I implement OAuth?'")
-    console.print("   • 'Help me with React state management'")
-    console.print("   • 'Explain database indexing'")
-    console.print("   • 'What's the best way to handle errors?'")
-    
-    console.print("\n🚪 [bold]Exiting:[/bold]")
-    console.print("   • 'quit', 'exit', 'bye', 'done'")
-    
-    console.print("\n🤖 Remember: I'm here to help make your development workflow faster and more enjoyable!")
-    console.print("=" * 50)
+    console.print(_NATURAL_LANGUAGE_HELP)
+
+# Keyword groups for the natural-language handlers. Matching is by substring,
+# so "fixing" still counts as "fix" and "docs" as "doc", except for priority
+# words, which must appear as whole words.
+_CODE_KEYWORDS = frozenset({"code", "debug", "implement", "fix", "build", "deploy"})
+_TEXT_KEYWORDS = frozenset({"write", "document", "readme", "docs"})
+_HIGH_PRIORITY_KEYWORDS = frozenset({"urgent", "asap", "important", "high"})
+_LOW_PRIORITY_KEYWORDS = frozenset({"minor", "low", "later", "someday"})
+_CRITICAL_PRIORITY_KEYWORDS = frozenset({"critical", "emergency", "broken", "down"})
+_BUG_KEYWORDS = frozenset({"bug", "error", "broken", "issue", "problem"})
+_ENHANCEMENT_KEYWORDS = frozenset({"feature", "enhancement", "new", "add"})
+_DOC_KEYWORDS = frozenset({"doc", "documentation", "readme"})
+_BROWSER_START_KEYWORDS = frozenset({"start", "open", "launch", "begin"})
+_BROWSER_REFRESH_KEYWORDS = frozenset({"refresh", "reload", "update"})
+_BROWSER_STOP_KEYWORDS = frozenset({"stop", "close", "end"})
+
+def _group_alternatives(groups):
+    """Regex alternation with one named group per keyword set, longest keywords first"""
+    return "|".join(
+        f"(?P<{name}>{'|'.join(map(re.escape, sorted(keywords, key=len, reverse=True)))})"
+        for name, keywords in groups.items()
+    )
+
+def _keyword_pattern(**groups):
+    """Compile keyword groups into one pattern with a named group per keyword set
+    
+    The alternation sits in a lookahead so matches may overlap and every
+    position of the text is tried, keeping plain substring semantics. Where a
+    keyword is in several groups, the group passed first wins.
+    """
+    return re.compile(f"(?=(?:{_group_alternatives(groups)}))")
+
+def _word_pattern(**groups):
+    """Like _keyword_pattern, but keywords only count as whole words"""
+    return re.compile(fr"\b(?:{_group_alternatives(groups)})\b")
+
+def _mentioned_groups(pattern, text):
+    """Names of the keyword groups occurring in text, in a single scan (text should already be lowercased)"""
+    return {match.lastgroup for match in pattern.finditer(text)}
+
+_TODO_TYPE_PATTERN = _keyword_pattern(code=_CODE_KEYWORDS, text=_TEXT_KEYWORDS)
+# Priority words must stand alone: "down" in "markdown" or "dropdown" is not an outage
+_PRIORITY_PATTERN = _word_pattern(
+    critical=_CRITICAL_PRIORITY_KEYWORDS, high=_HIGH_PRIORITY_KEYWORDS, low=_LOW_PRIORITY_KEYWORDS
+)
+_ISSUE_LABEL_PATTERN = _keyword_pattern(
+    bug=_BUG_KEYWORDS, enhancement=_ENHANCEMENT_KEYWORDS, documentation=_DOC_KEYWORDS
+)
+_BROWSER_ACTION_PATTERN = _keyword_pattern(
+    start=_BROWSER_START_KEYWORDS, refresh=_BROWSER_REFRESH_KEYWORDS, stop=_BROWSER_STOP_KEYWORDS
+)
+
+@lru_cache(maxsize=256)
+def _suggest_todo_title(ai_router, normalized_input):
+    """Ask the AI for a todo title; repeated requests reuse the earlier suggestion
+    
+    Failures raise and are not cached, so the next request tries again.
+    """
+    suggestion = _run_async(ai_router.route_and_process(
+        f"Based on this request: '{normalized_input}', suggest a concise todo title (max 60 characters). "
+        f"Just return the title, nothing else."
+    ))
+    return suggestion.strip()
 
 def handle_add_todo_natural(todo_manager, ai_router, image_handler, user_input, extracted_params, execute_immediately=True, multitasker=None):
     """Handle adding a todo from natural language input with human colleague interaction"""
@@ -1783,11 +2242,7 @@ def handle_add_todo_natural(todo_manager, ai_router, image_handler, user_input,
         ai_suggestion = None
         if execute_immediately and ai_router and hasattr(ai_router, 'models') and ai_router.models:
             try:
-                ai_suggestion = asyncio.run(ai_router.route_and_process(
-                    f"Based on this request: '{user_input}', suggest a concise todo title (max 60 characters). "
-                    f"Just return the title, nothing else."
-                ))
-                ai_suggestion = ai_suggestion.strip()
+                ai_suggestion = _suggest_todo_title(ai_router, " ".join(user_input.split()))
             except Exception:
                 # If AI fails, just use a simple fallback
                 ai_suggestion = None
@@ -1812,9 +2267,10 @@ def handle_add_todo_natural(todo_manager, ai_router, image_handler, user_input,
     # Smart type detection based on content
     todo_type = "general"
     user_input_lower = user_input.lower()
-    if any(word in user_input_lower for word in ["code", "debug", "implement", "fix", "build", "deploy"]):
+    mentioned = _mentioned_groups(_TODO_TYPE_PATTERN, user_input_lower)
+    if "code" in mentioned:
         todo_type = "code"
-    elif any(word in user_input_lower for word in ["write", "document", "readme", "docs"]):
+    elif "text" in mentioned:
         todo_type = "text"
     
     todo_type = Prompt.ask(
@@ -1823,14 +2279,15 @@ def handle_add_todo_natural(todo_manager, ai_router, image_handler, user_input,
         default=todo_type
     )
     
-    # Smart priority detection
+    # Smart priority detection, most urgent first
     priority = "medium"
-    if any(word in user_input_lower for word in ["urgent", "critical", "asap", "important", "high"]):
+    mentioned = _mentioned_groups(_PRIORITY_PATTERN, user_input_lower)
+    if "critical" in mentioned:
+        priority = "critical"
+    elif "high" in mentioned:
         priority = "high"
-    elif any(word in user_input_lower for word in ["minor", "low", "later", "someday"]):
+    elif "low" in mentioned:
         priority = "low"
-    elif any(word in user_input_lower for word in ["critical", "emergency", "broken", "down"]):
-        priority = "critical"
     
     priority = Prompt.ask(
         "⚡ How urgent is this?",
@@ -1843,13 +2300,7 @@ def handle_add_todo_natural(todo_manager, ai_router, image_handler, user_input,
     if todo_type in ["code", "text"]:
         if Confirm.ask("🖋️ Want to add any specific content or details now?"):
             console.print("📝 Enter content (Ctrl+D when finished):")
-            lines = []
-            try:
-                while True:
-                    line = input()
-                    lines.append(line)
-            except EOFError:
-                content = "\n".join(lines)
+            content = _read_pasted_content()
     elif todo_type == "image":
         clipboard_image_path = image_handler.prompt_for_clipboard_image()
         if clipboard_image_path:
@@ -1880,12 +2331,12 @@ def handle_add_todo_natural(todo_manager, ai_router, image_handler, user_input,
                             # Process sub-tasks
                             pending_subtasks = [todo_manager.get_todo_by_id(sid) for sid in sub_task_ids]
                             if pending_subtasks and multitasker:
-                                asyncio.run(multitasker.start_multitask(pending_subtasks))
+                                _run_async(multitasker.start_multitask(pending_subtasks))
             except Exception as e:
                 console.print(f"⚠️ Couldn't create sub-tasks automatically: {str(e)}")
                 console.print("💡 You can manually break this down later if needed.")
                 try:
-                    asyncio.run(multitasker.start_multitask([todo]))
+                    _run_async(multitasker.start_multitask([todo]))
                 except Exception as e:
                     console.print(f"❌ Error processing task: {e}")
                     console.print("💡 You can run it manually with 'multitask' command")
@@ -1909,14 +2360,10 @@ def handle_create_github_issue_natural(github_integration, repo_info, user_input
     body = Prompt.ask("Issue description (optional)", default="")
     
     # Smart label suggestions based on user input
-    suggested_labels = []
-    user_input_lower = user_input.lower()
-    if any(word in user_input_lower for word in ["bug", "error", "broken", "issue", "problem"]):
-        suggested_labels.append("bug")
-    if any(word in user_input_lower for word in ["feature", "enhancement", "new", "add"]):
-        suggested_labels.append("enhancement")
-    if any(word in user_input_lower for word in ["doc", "documentation", "readme"]):
-        suggested_labels.append("documentation")
+    mentioned = _mentioned_groups(_ISSUE_LABEL_PATTERN, user_input.lower())
+    suggested_labels = [
+        label for label in ("bug", "enhancement", "documentation") if label in mentioned
+    ]
     
     labels_input = Prompt.ask(
         "Labels (comma-separated, optional)", 
@@ -1936,13 +2383,13 @@ def handle_create_github_issue_natural(github_integration, repo_info, user_input
 
 def handle_browser_integration_natural(browser_integration, user_input):
     """Handle browser integration from natural language"""
-    user_input_lower = user_input.lower()
+    mentioned = _mentioned_groups(_BROWSER_ACTION_PATTERN, user_input.lower())
     
-    if any(word in user_input_lower for word in ["start", "open", "launch", "begin"]):
+    if "start" in mentioned:
         handle_start_browser(browser_integration)
-    elif any(word in user_input_lower for word in ["refresh", "reload", "update"]):
+    elif "refresh" in mentioned:
         handle_refresh_browser(browser_integration)
-    elif any(word in user_input_lower for word in ["stop", "close", "end"]):
+    elif "stop" in mentioned:
         handle_stop_browser(browser_integration)
     else:
         # Show browser status and options
@@ -1965,6 +2412,14 @@ def handle_browser_integration_natural(browser_integration, user_input):
             if Confirm.ask("Would you like to start it?"):
                 handle_start_browser(browser_integration)
 
+# Developer context wrapped around natural chat requests
+_CHAT_PROMPT_PREFIX = "As a developer-focused AI assistant, please help with this request: "
+_CHAT_PROMPT_SUFFIX = """
+
+Context: This is from a developer using 2DO, a development productivity tool. Please provide helpful, practical advice that's relevant to software development workflows. Be friendly, encouraging, and add a touch of developer humor when appropriate.
+
+If this is a technical question, provide clear explanations with code examples when relevant. If it's about productivity or workflow, suggest best practices that work well for developers."""
+
 def handle_chat_natural(ai_router, image_handler, user_input):
     """Handle natural chat - enhanced with developer context"""
     console.print("💬 Let me help you with that...")
@@ -1979,9 +2434,10 @@ def handle_chat_natural(ai_router, image_handler, user_input):
         console.print("   • Manage your project setup with '2do verify'")
         return
     
-    # Clean up old temporary files  
+    # Clean up old temporary files while the clipboard check and AI request run;
+    # it only removes images older than a day, so nothing this call saves
     if image_handler:
-        image_handler.cleanup_old_temp_files()
+        threading.Thread(target=image_handler.cleanup_old_temp_files, daemon=True).start()
     
     # Check for clipboard image
     clipboard_image_path = None
@@ -1998,11 +2454,7 @@ def handle_chat_natural(ai_router, image_handler, user_input):
             pass  # Silently ignore clipboard errors
     
     # Enhance the prompt with developer context
-    enhanced_prompt = f"""As a developer-focused AI assistant, please help with this request: {user_input}
-
-Context: This is from a developer using 2DO, a development productivity tool. Please provide helpful, practical advice that's relevant to software development workflows. Be friendly, encouraging, and add a touch of developer humor when appropriate.
-
-If this is a technical question, provide clear explanations with code examples when relevant. If it's about productivity or workflow, suggest best practices that work well for developers."""
+    enhanced_prompt = _CHAT_PROMPT_PREFIX + user_input + _CHAT_PROMPT_SUFFIX
     
     if clipboard_image_path:
         enhanced_prompt += f"\n\n[Image attached: {clipboard_image_path}]"
@@ -2021,10 +2473,10 @@ If this is a technical question, provide clear explanations with code examples w
                     full_response += chunk
                 return full_response
             
-            response = asyncio.run(stream_chat_response())
+            response = _run_async(stream_chat_response())
             console.print("\n")  # New line after streaming
         else:
-            response = asyncio.run(ai_router.route_and_process(enhanced_prompt))
+            response = _run_async(ai_router.route_and_process(enhanced_prompt))
             console.print(f"\n🤖 {response}\n")
     except Exception as e:
         console.print(f"\n❌ Sorry, I encountered an issue: {e}")
@@ -2038,35 +2490,20 @@ If this is a technical question, provide clear explanations with code examples w
     console.print("   • 'Show me my current tasks' to see what else you're working on")
 
 
-def _show_supported_models():
-    """Show all supported models from the built-in list"""
-    console.print("\n🎯 Supported AI Models:")
-    
-    # Free models (included by default)
-    console.print("\n💚 [bold green]Free Models (Included by Default):[/bold green]")
-    free_models = [
-        ("OpenAI", "gpt-4o-mini", "Fast, cost-effective model"),
-        ("OpenAI", "gpt-3.5-turbo", "General purpose, high speed"),
-        ("Anthropic", "claude-3-5-haiku", "Ultra-fast simple tasks"),
-        ("Google", "gemini-1.5-flash", "Fast multimodal model"),
-    ]
-    
-    for provider, model, description in free_models:
-        console.print(f"   • [cyan]{provider}[/cyan] - [yellow]{model}[/yellow]: {description}")
-    
-    # Premium models (require API keys) - Claude 4 models highlighted
-    console.print("\n💰 [bold yellow]Premium Models (Require API Keys):[/bold yellow]")
-    console.print("\n🏆 [bold cyan]Claude 4 Models (Premier for Coding):[/bold cyan]")
-    claude_4_models = [
-        ("Anthropic", "claude-opus-4", "🥇 Premier coding model - best for complex development"),
-        ("Anthropic", "claude-sonnet-4", "⭐ Advanced coding and reasoning"),
-    ]
-    
-    for provider, model, description in claude_4_models:
-        console.print(f"   • [cyan]{provider}[/cyan] - [bold yellow]{model}[/bold yellow]: {description}")
-    
-    console.print("\n🚀 [bold white]Other Premium Models:[/bold white]")
-    premium_models = [
+# Built-in model catalogue shown by `2do add-ai --list`
+_FREE_MODELS = (
+    ("OpenAI", "gpt-4o-mini", "Fast, cost-effective model"),
+    ("OpenAI", "gpt-3.5-turbo", "General purpose, high speed"),
+    ("Anthropic", "claude-3-5-haiku", "Ultra-fast simple tasks"),
+    ("Google", "gemini-1.5-flash", "Fast multimodal model"),
+)
+
+_CLAUDE_4_MODELS = (
+    ("Anthropic", "claude-opus-4", "🥇 Premier coding model - best for complex development"),
+    ("Anthropic", "claude-sonnet-4", "⭐ Advanced coding and reasoning"),
+)
+
+_PREMIUM_MODELS = (
     ("OpenAI", "gpt-5-pro",      "Unified next-gen model with expert reasoning, multimodal input, agentic capabilities (highest performance)"),
     ("OpenAI", "gpt-5",          "High reasoning, multimodal inputs (text, image, audio, video), extended context, free user access with some limits"),
     ("OpenAI", "gpt-5-mini",     "Cost-optimized variant, lighter and faster"),
@@ -2077,13 +2514,46 @@ def _show_supported_models():
     ("xAI", "grok-4",           "Strong code and reasoning, real-time updates, competitive pricing"),
     ("DeepSeek", "deepseek-r1", "Open-source chain-of-thought model—cost-effective reasoning & code performance"),
     ("Perplexity", "pplx-70b-online", "Search-augmented model with timely web grounding"),
-]
+)
+
+
+def _build_supported_models_text():
+    """Render the supported models listing as one markup string"""
+    lines = ["\n🎯 Supported AI Models:"]
+    
+    # Free models (included by default)
+    lines.append("\n💚 [bold green]Free Models (Included by Default):[/bold green]")
+    lines.extend(
+        f"   • [cyan]{provider}[/cyan] - [yellow]{model}[/yellow]: {description}"
+        for provider, model, description in _FREE_MODELS
+    )
     
-    for provider, model, description in premium_models:
-        console.print(f"   • [cyan]{provider}[/cyan] - [yellow]{model}[/yellow]: {description}")
+    # Premium models (require API keys) - Claude 4 models highlighted
+    lines.append("\n💰 [bold yellow]Premium Models (Require API Keys):[/bold yellow]")
+    lines.append("\n🏆 [bold cyan]Claude 4 Models (Premier for Coding):[/bold cyan]")
+    lines.extend(
+        f"   • [cyan]{provider}[/cyan] - [bold yellow]{model}[/bold yellow]: {description}"
+        for provider, model, description in _CLAUDE_4_MODELS
+    )
     
-    console.print(f"\n💡 Use [bold]2do add-ai[/bold] to add any of these models with your API key")
-    console.print(f"🏆 [bold cyan]Recommended for coding:[/bold cyan] Claude Opus 4 models offer the best performance for development tasks!")
+    lines.append("\n🚀 [bold white]Other Premium Models:[/bold white]")
+    lines.extend(
+        f"   • [cyan]{provider}[/cyan] - [yellow]{model}[/yellow]: {description}"
+        for provider, model, description in _PREMIUM_MODELS
+    )
+    
+    lines.append("\n💡 Use [bold]2do add-ai[/bold] to add any of these models with your API key")
+    lines.append("🏆 [bold cyan]Recommended for coding:[/bold cyan] Claude Opus 4 models offer the best performance for development tasks!")
+    return "\n".join(lines)
+
+
+# The listing never changes, so it is built once at import
+_SUPPORTED_MODELS_TEXT = _build_supported_models_text()
+
+
+def _show_supported_models():
+    """Show all supported models from the built-in list"""
+    console.print(_SUPPORTED_MODELS_TEXT)
 
 
 def _interactive_add_ai(config_manager):
@@ -2122,6 +2592,7 @@ def _add_from_supported_list(config_manager):
     if not config_manager.get_api_key(provider):
         api_key = Prompt.ask(f"Enter {provider} API key", password=True)
         config_manager.set_api_key(provider, api_key)
+        _invalidate_automation_engines()
         console.print(f"✅ API key saved for {provider}")
     else:
         console.print(f"✅ Using existing {provider} API key")
@@ -2138,6 +2609,7 @@ def _add_custom_model(config_manager):
     
     # Save the API key
     config_manager.set_api_key(provider, api_key)
+    _invalidate_automation_engines()
     
     console.print(f"✅ Custom provider '{provider}' added!")
     console.print("⚠️  Note: You'll need to modify the AI router code to add the actual model implementation")
@@ -2154,12 +2626,36 @@ def _direct_add_ai(config_manager, provider, model, api_key):
         api_key = Prompt.ask(f"Enter API key for {provider}", password=True)
     
     config_manager.set_api_key(provider, api_key)
+    _invalidate_automation_engines()
     console.print(f"✅ API key saved for {provider}")
     
     if model:
         console.print(f"💡 Model '{model}' will be available if supported by {provider}")
 
 
+# Speed glyphs indexed by speed_rating // 2 (ratings run 1-10)
+_SPEED_BARS = tuple("⚡" * i for i in range(6))
+
+# Models listed for providers that have an API key but no implementation yet,
+# as ready-to-render (model, speed, strengths) cells
+_POTENTIAL_MODELS = MappingProxyType({
+    provider: tuple(
+        (model_name, _SPEED_BARS[speed // 2], ", ".join(strengths))
+        for model_name, speed, strengths in models
+    )
+    for provider, models in {
+        "xai": [("grok-4", 7, ["reasoning", "general"])],
+        "deepseek": [
+            ("deepseek-v3", 6, ["code", "reasoning"]),
+            ("deepseek-r1", 5, ["reasoning", "analysis"])
+        ],
+        "mistral": [("mistral-large-2", 7, ["reasoning", "code"])],
+        "cohere": [("command-r-plus", 6, ["general", "reasoning"])],
+        "perplexity": [("pplx-70b-online", 8, ["search", "general"])]
+    }.items()
+})
+
+
 def _display_ai_models(ai_router, config_manager, show_free, show_configured):
     """Display AI models in a formatted table"""
     
@@ -2176,55 +2672,34 @@ def _display_ai_models(ai_router, config_manager, show_free, show_configured):
     table.add_column("Speed", style="white")
     table.add_column("Strengths", style="dim")
     
-    # Add configured models
+    # Add configured models; all of them are shown unless only free ones are wanted
+    configured_providers = set()
     for model_name, model in configured_models.items():
-        status = "✅ Ready"
-        model_type = "💚 Free" if model.is_free else "💰 Paid"
-        speed = "⚡" * (model.speed_rating // 2) if model.speed_rating else "❓"
-        strengths = ", ".join(model.strengths[:3])  # Show first 3 strengths
-        
+        configured_providers.add(model.provider)
         if show_free and not model.is_free:
             continue
-        if show_configured:  # All configured models are shown
-            pass
-            
+        
         table.add_row(
             model.provider.title(),
             model_name,
-            status,
-            model_type,
-            speed,
-            strengths
+            "✅ Ready",
+            "💚 Free" if model.is_free else "💰 Paid",
+            _SPEED_BARS[model.speed_rating // 2] if model.speed_rating else "❓",
+            ", ".join(model.strengths[:3])  # Show first 3 strengths
         )
     
-    # Add potential models for providers with API keys but no models loaded
-    potential_models = {
-        "xai": [("grok-4", "Advanced reasoning", 7, ["reasoning", "general"])],
-        "deepseek": [
-            ("deepseek-v3", "Code and reasoning", 6, ["code", "reasoning"]),
-            ("deepseek-r1", "Advanced reasoner", 5, ["reasoning", "analysis"])
-        ],
-        "mistral": [("mistral-large-2", "Advanced model", 7, ["reasoning", "code"])],
-        "cohere": [("command-r-plus", "Command model", 6, ["general", "reasoning"])],
-        "perplexity": [("pplx-70b-online", "Search model", 8, ["search", "general"])]
-    }
-    
-    for provider in available_providers:
-        if provider in potential_models and provider not in [m.provider for m in configured_models.values()]:
-            for model_name, description, speed, strengths in potential_models[provider]:
-                status = "⚠️  Available"
-                model_type = "💰 Paid"
-                speed_display = "⚡" * (speed // 2)
-                strengths_str = ", ".join(strengths)
-                
-                if show_free:  # Skip paid models when showing only free
-                    continue
-                    
+    # Add potential models for providers with API keys but no models loaded.
+    # These are all paid, so they are skipped when showing only free models.
+    if not show_free:
+        for provider in available_providers:
+            if provider in configured_providers:
+                continue
+            for model_name, speed_display, strengths_str in _POTENTIAL_MODELS.get(provider, ()):
                 table.add_row(
                     provider.title(),
                     model_name,
-                    status,
-                    model_type,
+                    "⚠️  Available",
+                    "💰 Paid",
                     speed_display,
                     strengths_str
                 )
@@ -2238,7 +2713,9 @@ def _display_ai_models(ai_router, config_manager, show_free, show_configured):
 @cli.command()
 def github_pro():
     """Toggle GitHub Pro mode for advanced automation"""
-    console.print(Panel.fit("🚀 GitHub Pro Mode Management", style="bold blue"))
+    from .config import ConfigManager
+    
+    console.print(_banner("🚀 GitHub Pro Mode Management", "bold blue"))
     
     try:
         # Determine working directory
@@ -2250,18 +2727,7 @@ def github_pro():
             console.print("❌ No API keys configured. Please run '2do setup' first.")
             return
         
-        github_integration = GitHubIntegration(config_manager.get_api_key("github"))
-        todo_manager = TodoManager(config_manager.config_dir)
-        ai_router = AIRouter(config_manager)
-        
-        # CRITICAL FIX: Initialize all MCP servers with correct project path
-        console.print(f"🎯 Initializing all MCP servers for directory: {working_dir}")
-        asyncio.run(ai_router.initialize_all_servers(working_dir))
-        
-        multitasker = Multitasker(ai_router, todo_manager)
-        
-        # Initialize automation engine
-        automation_engine = AutomationEngine(todo_manager, multitasker, github_integration)
+        automation_engine = _build_automation_engine(working_dir, config_manager)
         
         # Toggle GitHub Pro mode
         new_status = automation_engine.toggle_github_pro_mode()
@@ -2280,7 +2746,9 @@ def github_pro():
 @cli.command()
 def run_all():
     """Run multitasking on all pending todos - the ultimate shortcut"""
-    console.print(Panel.fit("🔥 RUN ALL MODE", style="bold red"))
+    from .config import ConfigManager
+    
+    console.print(_banner("🔥 RUN ALL MODE", "bold red"))
     
     try:
         # Determine working directory
@@ -2292,22 +2760,11 @@ def run_all():
             console.print("❌ No API keys configured. Please run '2do setup' first.")
             return
         
-        github_integration = GitHubIntegration(config_manager.get_api_key("github"))
-        todo_manager = TodoManager(config_manager.config_dir)
-        ai_router = AIRouter(config_manager)
-        
-        # CRITICAL FIX: Initialize all MCP servers with correct project path
-        console.print(f"🎯 Initializing all MCP servers for directory: {working_dir}")
-        asyncio.run(ai_router.initialize_all_servers(working_dir))
-        
-        multitasker = Multitasker(ai_router, todo_manager)
-        
-        # Initialize automation engine
-        automation_engine = AutomationEngine(todo_manager, multitasker, github_integration)
+        automation_engine = _build_automation_engine(working_dir, config_manager)
         
         # Run all todos
         # CRITICAL FIX: Use synchronous wrapper to avoid nested event loops
-        automation_engine.run_all_todos_sync()
+        automation_engine.run_all_todos_sync(working_dir, run=_run_async)
         
     except Exception as e:
         console.print(f"❌ Error in run all mode: {e}")
@@ -2316,7 +2773,9 @@ def run_all():
 @click.argument('request', required=False)
 def smart_todo(request):
     """Create a smart todo from natural language (e.g., 'change text in readme.md')"""
-    console.print(Panel.fit("🤖 Smart Todo Creation", style="bold green"))
+    from .config import ConfigManager
+    
+    console.print(_banner("🤖 Smart Todo Creation", "bold green"))
     
     if not request:
         request = Prompt.ask("What would you like to do?", default="")
@@ -2335,37 +2794,38 @@ def smart_todo(request):
             console.print("❌ No API keys configured. Please run '2do setup' first.")
             return
         
-        github_integration = GitHubIntegration(config_manager.get_api_key("github"))
-        todo_manager = TodoManager(config_manager.config_dir)
-        ai_router = AIRouter(config_manager)
-        
-        # CRITICAL FIX: Initialize all MCP servers with correct project path
-        console.print(f"🎯 Initializing all MCP servers for directory: {working_dir}")
-        asyncio.run(ai_router.initialize_all_servers(working_dir))
-        
-        multitasker = Multitasker(ai_router, todo_manager)
-        
-        # Initialize automation engine
-        automation_engine = AutomationEngine(todo_manager, multitasker, github_integration)
+        automation_engine = _build_automation_engine(working_dir, config_manager)
         
         # Handle smart todo creation
-        asyncio.run(automation_engine.handle_smart_todo_creation(request))
+        _run_async(automation_engine.handle_smart_todo_creation(request))
         
     except Exception as e:
         console.print(f"❌ Error creating smart todo: {e}")
 
+
+# Readable form of each "RWX"-style access mode from list_permissions
+_ACCESS_MODE_NAMES = MappingProxyType({
+    "RWX": "read, write, execute",
+    "RW-": "read, write",
+    "R-X": "read, execute",
+    "R--": "read",
+    "-WX": "write, execute",
+    "-W-": "write",
+    "--X": "execute",
+    "---": "none",
+})
+
 @cli.command()
 @click.option('--session-id', help='Specific session ID to show')
 def permissions(session_id):
     """Manage file access permissions and sessions"""
-    console.print(Panel.fit("🔐 Permission Management", style="bold blue"))
+    from .permission_manager import diagnose_permissions
+    
+    console.print(_banner("🔐 Permission Management", "bold blue"))
     
     try:
         working_dir = _get_safe_working_directory()
-        config_manager = ConfigManager(working_dir)
-        
-        # Get session permission manager
-        session_manager = get_session_permission_manager(config_manager.config_dir)
+        _, session_manager = _get_session_context(working_dir)
         
         if session_id:
             # Show specific session
@@ -2380,19 +2840,13 @@ def permissions(session_id):
                 
                 if perms['allowed_paths']:
                     console.print("\n📁 Allowed Paths:")
-                    for path in list(perms['allowed_paths'])[:10]:
-                        read_access = "R" if path in perms['read_permissions'] else "-"
-                        write_access = "W" if path in perms['write_permissions'] else "-"
-                        execute_access = "X" if path in perms['execute_permissions'] else "-"
-                        console.print(f"  {read_access}{write_access}{execute_access} {path}")
+                    for path in perms['allowed_paths'][:10]:
+                        console.print(f"  {perms['access_modes'][path]} {path}")
                 
                 if perms['allowed_patterns']:
                     console.print("\n🔍 Allowed Patterns:")
-                    for pattern in list(perms['allowed_patterns'])[:10]:
-                        read_access = "R" if pattern in perms['read_permissions'] else "-"
-                        write_access = "W" if pattern in perms['write_permissions'] else "-"
-                        execute_access = "X" if pattern in perms['execute_permissions'] else "-"
-                        console.print(f"  {read_access}{write_access}{execute_access} {pattern}")
+                    for pattern in perms['allowed_patterns'][:10]:
+                        console.print(f"  {perms['access_modes'][pattern]} {pattern}")
             else:
                 console.print(f"❌ Session {session_id} not found")
         else:
@@ -2430,14 +2884,7 @@ def permissions(session_id):
                     if perms['allowed_paths']:
                         console.print("\n📁 Detailed Path Permissions:")
                         for path in perms['allowed_paths']:
-                            permissions = []
-                            if path in perms['read_permissions']:
-                                permissions.append("read")
-                            if path in perms['write_permissions']:
-                                permissions.append("write")
-                            if path in perms['execute_permissions']:
-                                permissions.append("execute")
-                            console.print(f"  {path}: {', '.join(permissions) if permissions else 'none'}")
+                            console.print(f"  {path}: {_ACCESS_MODE_NAMES[perms['access_modes'][path]]}")
             else:
                 console.print("📝 No active permission session")
                 console.print("💡 A session will be created automatically when needed")
@@ -2455,12 +2902,11 @@ def permissions(session_id):
 @click.option('--session-id', help='Clear specific session')
 def clear_permissions(clear_all, session_id):
     """Clear permission sessions"""
-    console.print(Panel.fit("🗑️ Clear Permissions", style="bold red"))
+    console.print(_banner("🗑️ Clear Permissions", "bold red"))
     
     try:
         working_dir = _get_safe_working_directory()
-        config_manager = ConfigManager(working_dir)
-        session_manager = get_session_permission_manager(config_manager.config_dir)
+        _, session_manager = _get_session_context(working_dir)
         
         if clear_all:
             if _safe_confirm("Clear ALL permission sessions?", default=False):
@@ -2497,12 +2943,11 @@ def clear_permissions(clear_all, session_id):
 @click.option('--execute', is_flag=True, help='Grant execute permission')
 def grant_permission(path, read, write, execute):
     """Grant specific permissions for a path"""
-    console.print(Panel.fit("✅ Grant Permission", style="bold green"))
+    console.print(_banner("✅ Grant Permission", "bold green"))
     
     try:
         working_dir = _get_safe_working_directory()
-        config_manager = ConfigManager(working_dir)
-        session_manager = get_session_permission_manager(config_manager.config_dir)
+        _, session_manager = _get_session_context(working_dir)
         
         if not session_manager.current_session:
             session_manager.create_session()
@@ -2537,19 +2982,21 @@ def grant_permission(path, read, write, execute):
 @click.option('--no-progress', is_flag=True, help='Hide progress indicators')
 def fast_read(files, no_cache, no_progress):
     """Fast file reading with caching and progress indicators"""
-    console.print(Panel.fit("⚡ Fast File Reading", style="bold green"))
+    from .enhanced_file_handler import get_enhanced_file_handler
+    
+    console.print(_banner("⚡ Fast File Reading", "bold green"))
     
     try:
         working_dir = _get_safe_working_directory()
-        config_manager = ConfigManager(working_dir)
-        session_manager = get_session_permission_manager(config_manager.config_dir)
+        _, session_manager = _get_session_context(working_dir)
         file_handler = get_enhanced_file_handler(session_manager)
         
         async def read_files():
             if len(files) == 1:
                 # Single file
+                # One character past the preview tells whether to show "..."
                 content = await file_handler.read_file_fast(
-                    files[0], show_progress=not no_progress
+                    files[0], show_progress=not no_progress, max_chars=1001
                 )
                 console.print(f"\n📄 Content of {files[0]}:")
                 console.print(Panel(content[:1000] + ("..." if len(content) > 1000 else ""), 
@@ -2561,7 +3008,7 @@ def fast_read(files, no_cache, no_progress):
                 for file_path, content in results.items():
                     console.print(f"  ✅ {Path(file_path).name}: {len(content)} characters")
         
-        asyncio.run(read_files())
+        _run_async(read_files())
         
     except Exception as e:
         console.print(f"❌ Error reading files: {e}")
@@ -2574,26 +3021,31 @@ def fast_read(files, no_cache, no_progress):
 @click.option('--no-progress', is_flag=True, help='Hide progress indicators')
 def fast_write(file_path, content, no_backup, no_progress):
     """Fast file writing with backup and progress indicators"""
-    console.print(Panel.fit("✍️ Fast File Writing", style="bold green"))
+    from .enhanced_file_handler import PROGRESS_THRESHOLD_BYTES, get_enhanced_file_handler
+    
+    console.print(_banner("✍️ Fast File Writing", "bold green"))
     
     try:
         working_dir = _get_safe_working_directory()
-        config_manager = ConfigManager(working_dir)
-        session_manager = get_session_permission_manager(config_manager.config_dir)
+        _, session_manager = _get_session_context(working_dir)
         file_handler = get_enhanced_file_handler(session_manager)
         
-        async def write_file():
-            success = await file_handler.write_file_fast(
+        # Writes that won't show a progress bar skip the event loop entirely
+        if no_progress or len(content.encode('utf-8')) <= PROGRESS_THRESHOLD_BYTES:
+            success = file_handler.write_file_sync(
+                file_path, content, create_backup=not no_backup
+            )
+        else:
+            success = _run_async(file_handler.write_file_fast(
                 file_path, content, 
-                show_progress=not no_progress,
+                show_progress=True,
                 create_backup=not no_backup
-            )
-            if success:
-                console.print(f"✅ Successfully wrote to {file_path}")
-            else:
-                console.print(f"❌ Failed to write to {file_path}")
+            ))
         
-        asyncio.run(write_file())
+        if success:
+            console.print(f"✅ Successfully wrote to {file_path}")
+        else:
+            console.print(f"❌ Failed to write to {file_path}")
         
     except Exception as e:
         console.print(f"❌ Error writing file: {e}")
@@ -2602,12 +3054,13 @@ def fast_write(file_path, content, no_backup, no_progress):
 @cli.command()
 def file_stats():
     """Show file operation performance statistics"""
-    console.print(Panel.fit("📊 File Performance Statistics", style="bold blue"))
+    from .enhanced_file_handler import get_enhanced_file_handler
+    
+    console.print(_banner("📊 File Performance Statistics", "bold blue"))
     
     try:
         working_dir = _get_safe_working_directory()
-        config_manager = ConfigManager(working_dir)
-        session_manager = get_session_permission_manager(config_manager.config_dir)
+        _, session_manager = _get_session_context(working_dir)
         file_handler = get_enhanced_file_handler(session_manager)
         
         file_handler.show_performance_report()
@@ -2619,12 +3072,13 @@ def file_stats():
 @cli.command()
 def clear_cache():
     """Clear file operation cache"""
-    console.print(Panel.fit("🗑️ Clear File Cache", style="bold red"))
+    from .enhanced_file_handler import get_enhanced_file_handler
+    
+    console.print(_banner("🗑️ Clear File Cache", "bold red"))
     
     try:
         working_dir = _get_safe_working_directory()
-        config_manager = ConfigManager(working_dir)
-        session_manager = get_session_permission_manager(config_manager.config_dir)
+        _, session_manager = _get_session_context(working_dir)
         file_handler = get_enhanced_file_handler(session_manager)
         
         file_handler.clear_cache()
@@ -2640,7 +3094,10 @@ def clear_cache():
 @click.option('--pending-only', is_flag=True, help='Show only pending todos')
 def todo_read(filter, format, pending_only):
     """Read and display todos - like Claude Code todo read tool"""
-    console.print(Panel.fit("📋 Todo Read Tool", style="bold blue"))
+    from .config import ConfigManager
+    from .todo_manager import TodoManager, todo_sort_key
+    
+    console.print(_banner("📋 Todo Read Tool", "bold blue"))
     
     try:
         working_dir = _get_safe_working_directory()
@@ -2667,7 +3124,6 @@ def todo_read(filter, format, pending_only):
         
         # Display todos in requested format
         if format == 'json':
-            import json
             console.print(json.dumps(todos, indent=2, default=str))
         elif format == 'list':
             for i, todo in enumerate(todos, 1):
@@ -2683,32 +3139,19 @@ def todo_read(filter, format, pending_only):
             table.add_column("Status", style="green", width=12)
             table.add_column("Created", style="dim", width=10)
             
-            # Sort by priority and creation date
-            priority_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-            sorted_todos = sorted(todos, key=lambda x: (
-                priority_order.get(x.get("priority", "medium"), 2),
-                x.get("created_at", "")
-            ))
+            # Sort by priority and creation date (an unfiltered listing reuses
+            # the manager's cached sorted view)
+            if todos is todo_manager.get_todos():
+                sorted_todos = todo_manager.get_sorted_todos()
+            else:
+                sorted_todos = sorted(todos, key=todo_sort_key)
             
             for todo in sorted_todos:
                 status = todo.get("status", "pending")
-                status_display = {
-                    "pending": "⏳ Pending",
-                    "in_progress": "🔄 In Progress", 
-                    "completed": "✅ Completed",
-                    "failed": "❌ Failed"
-                }.get(status, status)
+                status_display = _STATUS_DISPLAY.get(status, status)
                 
                 created_date = todo.get("created_at", "")
-                if created_date:
-                    try:
-                        from datetime import datetime
-                        dt = datetime.fromisoformat(created_date.replace('Z', '+00:00'))
-                        created_display = dt.strftime("%m/%d")
-                    except:
-                        created_display = created_date[:10] if len(created_date) >= 10 else created_date
-                else:
-                    created_display = "Unknown"
+                created_display = _format_created(created_date) if created_date else "Unknown"
                 
                 table.add_row(
                     todo.get("id", "")[:8],
@@ -2734,7 +3177,10 @@ def todo_read(filter, format, pending_only):
 @click.option('--from-file', '-f', help='Read content from file')
 def todo_write(title, description, type, priority, content, from_file):
     """Write/create a new todo - like Claude Code todo write tool"""
-    console.print(Panel.fit("✍️ Todo Write Tool", style="bold green"))
+    from .config import ConfigManager
+    from .todo_manager import TodoManager
+    
+    console.print(_banner("✍️ Todo Write Tool", "bold green"))
     
     try:
         # Validate title is not empty
@@ -2792,18 +3238,28 @@ def todo_write(title, description, type, priority, content, from_file):
 @cli.command()
 def automation_status():
     """Show current automation engine status and features"""
-    console.print(Panel.fit("🤖 Automation Engine Status", style="bold cyan"))
+    from .config import ConfigManager
+    from .todo_manager import TodoManager
+    from .automation_engine import AutomationEngine
+    
+    console.print(_banner("🤖 Automation Engine Status", "bold cyan"))
     
     try:
         # Determine working directory
         working_dir = _get_safe_working_directory()
         
-        # Initialize managers
+        # Initialize managers; the AI and GitHub stack is only loaded once keys exist
         config_manager = ConfigManager(working_dir)
-        github_integration = GitHubIntegration(config_manager.get_api_key("github")) if config_manager.has_api_keys() else None
         todo_manager = TodoManager(config_manager.config_dir)
-        ai_router = AIRouter(config_manager) if config_manager.has_api_keys() else None
-        multitasker = Multitasker(ai_router, todo_manager) if ai_router else None
+        github_integration = ai_router = multitasker = None
+        if config_manager.has_api_keys():
+            from .ai_router import AIRouter
+            from .multitasker import Multitasker
+            from .github_integration import GitHubIntegration
+            
+            github_integration = GitHubIntegration(config_manager.get_api_key("github"))
+            ai_router = AIRouter(config_manager)
+            multitasker = Multitasker(ai_router, todo_manager)
         
         # Initialize automation engine
         automation_engine = AutomationEngine(todo_manager, multitasker, github_integration)
@@ -2811,27 +3267,29 @@ def automation_status():
         # Get status
         status = automation_engine.get_automation_status()
         
-        console.print("\n🎯 Automation Features:")
-        console.print(f"  • Smart Todo Parsing: {'✅ Enabled' if status['smart_parsing_enabled'] else '❌ Disabled'}")
-        console.print(f"  • Instant Action Prompts: {'✅ Enabled' if status['instant_actions_enabled'] else '❌ Disabled'}")
-        console.print(f"  • Run All Shortcut: {'✅ Available' if status['run_all_available'] else '❌ Unavailable'}")
-        console.print(f"  • GitHub Pro Mode: {'🚀 Active' if status['github_pro_mode'] else '📴 Inactive'}")
-        console.print(f"  • GitHub Integration: {'✅ Connected' if status['github_integration'] else '❌ Not configured'}")
-        
-        console.print("\n🔧 Available Commands:")
-        console.print("  • [bold]2do smart-todo[/bold] - Create smart todos from natural language")
-        console.print("  • [bold]2do run-all[/bold] - Run multitasking on all pending todos")
-        console.print("  • [bold]2do github-pro[/bold] - Toggle GitHub Pro mode")
-        console.print("  • [bold]2do automation-status[/bold] - Show this status")
-        
-        # Show current todos
-        todos = todo_manager.get_todos()
-        pending_todos = [todo for todo in todos if todo.status == 'pending']
-        
-        console.print(f"\n📊 Current Status:")
-        console.print(f"  • Total todos: {len(todos)}")
-        console.print(f"  • Pending todos: {len(pending_todos)}")
-        console.print(f"  • Ready for 'run all': {'✅ Yes' if pending_todos else '❌ No pending todos'}")
+        # Buffer the report so it is written in one go
+        with console:
+            console.print("\n🎯 Automation Features:")
+            console.print(f"  • Smart Todo Parsing: {'✅ Enabled' if status['smart_parsing_enabled'] else '❌ Disabled'}")
+            console.print(f"  • Instant Action Prompts: {'✅ Enabled' if status['instant_actions_enabled'] else '❌ Disabled'}")
+            console.print(f"  • Run All Shortcut: {'✅ Available' if status['run_all_available'] else '❌ Unavailable'}")
+            console.print(f"  • GitHub Pro Mode: {'🚀 Active' if status['github_pro_mode'] else '📴 Inactive'}")
+            console.print(f"  • GitHub Integration: {'✅ Connected' if status['github_integration'] else '❌ Not configured'}")
+            
+            console.print("\n🔧 Available Commands:")
+            console.print("  • [bold]2do smart-todo[/bold] - Create smart todos from natural language")
+            console.print("  • [bold]2do run-all[/bold] - Run multitasking on all pending todos")
+            console.print("  • [bold]2do github-pro[/bold] - Toggle GitHub Pro mode")
+            console.print("  • [bold]2do automation-status[/bold] - Show this status")
+            
+            # Show current todos
+            todos = todo_manager.get_todos()
+            pending_todos = [todo for todo in todos if todo.status == 'pending']
+            
+            console.print(f"\n📊 Current Status:")
+            console.print(f"  • Total todos: {len(todos)}")
+            console.print(f"  • Pending todos: {len(pending_todos)}")
+            console.print(f"  • Ready for 'run all': {'✅ Yes' if pending_todos else '❌ No pending todos'}")
         
     except Exception as e:
         console.print(f"❌ Error getting automation status: {e}")
@@ -2843,7 +3301,9 @@ def automation_status():
 @click.option('--max-files', default=50, help='Maximum number of files to analyze')
 def smart_analyze(project, file, max_files):
     """Smart code analysis for enhanced development intelligence"""
-    console.print(Panel.fit("🧠 Smart Code Analysis", style="bold blue"))
+    from .smart_code_analyzer import SmartCodeAnalyzer
+    
+    console.print(_banner("🧠 Smart Code Analysis", "bold blue"))
     
     try:
         analyzer = SmartCodeAnalyzer()
@@ -2888,7 +3348,10 @@ def smart_analyze(project, file, max_files):
 @click.option('--project', '-p', help='Project path (default: current directory)')
 def tall_stack_check(project):
     """Analyze TALL stack completeness and provide recommendations"""
-    console.print(Panel.fit("🏗️ TALL Stack Analysis", style="bold yellow"))
+    from .config import ConfigManager
+    from .tech_stack import TechStackDetector
+    
+    console.print(_banner("🏗️ TALL Stack Analysis", "bold yellow"))
     
     try:
         project_path = project or os.getcwd()
@@ -2901,113 +3364,127 @@ def tall_stack_check(project):
         tall_analysis = tech_detector.analyze_tall_stack_completeness(project_path)
         
         # Display results
-        console.print(f"\n📊 TALL Stack Analysis for: {project_path}")
-        console.print(f"Completeness Score: {tall_analysis['completeness_score']:.0f}%")
-        console.print(f"Is TALL Stack: {'✅ Yes' if tall_analysis['is_tall_stack'] else '❌ No'}")
-        
-        # Show components
-        console.print("\n🔧 TALL Stack Components:")
-        components = tall_analysis['components']
-        
-        tailwind_status = "✅" if components['tailwindcss'] else "❌"
-        alpine_status = "✅" if components['alpinejs'] else "❌"
-        laravel_status = "✅" if components['laravel'] else "❌"
-        livewire_status = "✅" if components['livewire'] else "❌"
-        
-        console.print(f"   {tailwind_status} TailwindCSS - Utility-first CSS framework")
-        console.print(f"   {alpine_status} Alpine.js - Minimal reactive framework")
-        console.print(f"   {laravel_status} Laravel - PHP web application framework")
-        console.print(f"   {livewire_status} Livewire - Dynamic Laravel components")
-        
-        # Show detected files
-        if any(tall_analysis['detected_files'].values()):
-            console.print("\n📄 Detected Files:")
-            for component, files in tall_analysis['detected_files'].items():
-                if files:
-                    console.print(f"   {component.capitalize()}: {', '.join(files[:3])}")
-        
-        # Show recommendations
-        if tall_analysis['recommendations']:
-            console.print("\n💡 Recommendations:")
-            for i, rec in enumerate(tall_analysis['recommendations'], 1):
-                console.print(f"   {i}. {rec}")
-        
-        # Suggest MCP servers based on analysis
-        if tall_analysis['is_tall_stack']:
-            console.print("\n🔌 Recommended MCP Servers for TALL Stack:")
-            console.print("   • Context7 (Upstash) - Advanced context management")
-            console.print("   • PHP MCP Server - PHP code execution")
-            console.print("   • Git MCP Server - Version control operations")
-            console.print("   • GitHub MCP Server - Repository integration")
-            console.print("\n💡 Run '2do mcp' to configure these servers")
+        # Buffer the report so it is written in one go
+        with console:
+            console.print(f"\n📊 TALL Stack Analysis for: {project_path}")
+            console.print(f"Completeness Score: {tall_analysis['completeness_score']:.0f}%")
+            console.print(f"Is TALL Stack: {'✅ Yes' if tall_analysis['is_tall_stack'] else '❌ No'}")
+            
+            # Show components
+            console.print("\n🔧 TALL Stack Components:")
+            components = tall_analysis['components']
+            
+            tailwind_status = "✅" if components['tailwindcss'] else "❌"
+            alpine_status = "✅" if components['alpinejs'] else "❌"
+            laravel_status = "✅" if components['laravel'] else "❌"
+            livewire_status = "✅" if components['livewire'] else "❌"
+            
+            console.print(f"   {tailwind_status} TailwindCSS - Utility-first CSS framework")
+            console.print(f"   {alpine_status} Alpine.js - Minimal reactive framework")
+            console.print(f"   {laravel_status} Laravel - PHP web application framework")
+            console.print(f"   {livewire_status} Livewire - Dynamic Laravel components")
+            
+            # Show detected files
+            if any(tall_analysis['detected_files'].values()):
+                console.print("\n📄 Detected Files:")
+                for component, files in tall_analysis['detected_files'].items():
+                    if files:
+                        console.print(f"   {component.capitalize()}: {', '.join(files[:3])}")
+            
+            # Show recommendations
+            if tall_analysis['recommendations']:
+                console.print("\n💡 Recommendations:")
+                for i, rec in enumerate(tall_analysis['recommendations'], 1):
+                    console.print(f"   {i}. {rec}")
+            
+            # Suggest MCP servers based on analysis
+            if tall_analysis['is_tall_stack']:
+                console.print("\n🔌 Recommended MCP Servers for TALL Stack:")
+                console.print("   • Context7 (Upstash) - Advanced context management")
+                console.print("   • PHP MCP Server - PHP code execution")
+                console.print("   • Git MCP Server - Version control operations")
+                console.print("   • GitHub MCP Server - Repository integration")
+                console.print("\n💡 Run '2do mcp' to configure these servers")
         
     except Exception as e:
         console.print(f"❌ Error analyzing TALL stack: {e}")
 
 def _display_file_analysis(analysis):
     """Display analysis results for a single file"""
-    console.print(f"\n📄 File: {analysis.file_path}")
-    console.print(f"Language: {analysis.language}")
-    console.print(f"Complexity Score: {analysis.complexity_score}")
-    
-    if analysis.functions:
-        console.print(f"Functions: {len(analysis.functions)}")
-        for func in analysis.functions[:5]:  # Show first 5
-            console.print(f"   • {func['name']} (line {func.get('line', 'unknown')})")
-    
-    if analysis.classes:
-        console.print(f"Classes: {len(analysis.classes)}")
-        for cls in analysis.classes[:5]:  # Show first 5
-            console.print(f"   • {cls['name']} (line {cls.get('line', 'unknown')})")
-    
-    if analysis.tech_stack_hints:
-        console.print(f"Tech Stack Hints: {', '.join(analysis.tech_stack_hints)}")
-    
-    if analysis.suggestions:
-        console.print("Suggestions:")
-        for sugg in analysis.suggestions:
-            console.print(f"   • {sugg}")
+    # Buffer the analysis so it is written in one go
+    with console:
+        console.print(f"\n📄 File: {analysis.file_path}")
+        console.print(f"Language: {analysis.language}")
+        console.print(f"Complexity Score: {analysis.complexity_score}")
+        
+        if analysis.functions:
+            console.print(f"Functions: {len(analysis.functions)}")
+            for func in analysis.functions[:5]:  # Show first 5
+                console.print(f"   • {func['name']} (line {func.get('line', 'unknown')})")
+        
+        if analysis.classes:
+            console.print(f"Classes: {len(analysis.classes)}")
+            for cls in analysis.classes[:5]:  # Show first 5
+                console.print(f"   • {cls['name']} (line {cls.get('line', 'unknown')})")
+        
+        if analysis.tech_stack_hints:
+            console.print(f"Tech Stack Hints: {', '.join(analysis.tech_stack_hints)}")
+        
+        if analysis.suggestions:
+            console.print("Suggestions:")
+            for sugg in analysis.suggestions:
+                console.print(f"   • {sugg}")
 
 def _display_project_analysis(analysis):
     """Display analysis results for an entire project"""
-    console.print(f"\n📁 Project: {analysis.project_path}")
-    console.print(f"Files Analyzed: {len(analysis.file_analyses)}")
-    console.print(f"Overall Complexity: {analysis.overall_complexity}")
-    
-    if analysis.tech_stack:
-        console.print(f"Detected Technologies: {', '.join(analysis.tech_stack)}")
-    
-    if analysis.architecture_patterns:
-        console.print(f"Architecture Patterns: {', '.join(analysis.architecture_patterns)}")
-    
-    # Show file breakdown by language
-    languages = {}
-    for file_analysis in analysis.file_analyses:
-        lang = file_analysis.language
-        languages[lang] = languages.get(lang, 0) + 1
-    
-    if languages:
-        console.print("File Types:")
-        for lang, count in languages.items():
-            console.print(f"   • {lang}: {count} files")
-    
-    if analysis.recommendations:
-        console.print("Project Recommendations:")
-        for rec in analysis.recommendations:
-            console.print(f"   • {rec}")
+    # Buffer the analysis so it is written in one go
+    with console:
+        console.print(f"\n📁 Project: {analysis.project_path}")
+        console.print(f"Files Analyzed: {len(analysis.file_analyses)}")
+        console.print(f"Overall Complexity: {analysis.overall_complexity}")
+        
+        if analysis.tech_stack:
+            console.print(f"Detected Technologies: {', '.join(analysis.tech_stack)}")
+        
+        if analysis.architecture_patterns:
+            console.print(f"Architecture Patterns: {', '.join(analysis.architecture_patterns)}")
+        
+        # Show file breakdown by language, most common first
+        languages = Counter(file_analysis.language for file_analysis in analysis.file_analyses)
+        
+        if languages:
+            console.print("File Types:")
+            for lang, count in languages.most_common():
+                console.print(f"   • {lang}: {count} files")
+        
+        if analysis.recommendations:
+            console.print("Project Recommendations:")
+            for rec in analysis.recommendations:
+                console.print(f"   • {rec}")
 
 def _generate_smart_todos(project_analysis):
     """Generate intelligent todos based on project analysis"""
     todos = []
     
-    # High complexity files need refactoring
-    for file_analysis in project_analysis.file_analyses:
+    # One pass over the files collects the per-file todos
+    complex_function_todos = []
+    for file_analysis, file_name in zip(project_analysis.file_analyses, project_analysis.file_names):
+        # High complexity files need refactoring
         if file_analysis.complexity_score > 30:
             todos.append({
-                'content': f"Refactor high-complexity file: {Path(file_analysis.file_path).name} (complexity: {file_analysis.complexity_score})",
+                'content': f"Refactor high-complexity file: {file_name} (complexity: {file_analysis.complexity_score})",
                 'priority': 'high',
                 'type': 'code'
             })
+        
+        # Large functions/classes need attention
+        large_functions = [f for f in file_analysis.functions if f.get('complexity', 0) > 10]
+        for func in large_functions[:2]:  # Limit to 2 per file
+            complex_function_todos.append({
+                'content': f"Refactor complex function: {func['name']} in {file_name}",
+                'priority': 'medium',
+                'type': 'code'
+            })
     
     # Missing TALL stack components
     tech_stack = set(project_analysis.tech_stack)
@@ -3033,19 +3510,11 @@ def _generate_smart_todos(project_analysis):
                 'type': 'code'
             })
     
-    # Large functions/classes need attention
-    for file_analysis in project_analysis.file_analyses:
-        large_functions = [f for f in file_analysis.functions if f.get('complexity', 0) > 10]
-        if large_functions:
-            for func in large_functions[:2]:  # Limit to 2 per file
-                todos.append({
-                    'content': f"Refactor complex function: {func['name']} in {Path(file_analysis.file_path).name}",
-                    'priority': 'medium',
-                    'type': 'code'
-                })
+    # Complex functions are listed after the stack suggestions
+    todos.extend(complex_function_todos)
     
     # Add testing suggestions
-    if not any('test' in fa.file_path.lower() for fa in project_analysis.file_analyses):
+    if not project_analysis.has_test_files:
         todos.append({
             'content': "Add unit tests for better code quality and maintainability",
             'priority': 'high',
@@ -3062,22 +3531,47 @@ def _generate_smart_todos(project_analysis):
     
     return todos[:10]  # Limit to 10 todos
 
+
+@dataclass(frozen=True)
+class _ToolingContext:
+    """Components shared by the scaffolding, test and CI/CD commands"""
+    config_manager: Any
+    todo_manager: Any
+    tech_detector: Any
+    automation_engine: Any
+
+@lru_cache(maxsize=1)
+def _get_tooling_context():
+    """Build the scaffolding/test/CI stack once per process"""
+    from .config import ConfigManager
+    from .todo_manager import TodoManager
+    from .tech_stack import TechStackDetector
+    from .automation_engine import EnhancedAutomationEngine
+    
+    config_manager = ConfigManager()
+    todo_manager = TodoManager(config_manager.config_dir)
+    tech_detector = TechStackDetector(config_manager.config_dir)
+    return _ToolingContext(
+        config_manager=config_manager,
+        todo_manager=todo_manager,
+        tech_detector=tech_detector,
+        automation_engine=EnhancedAutomationEngine(todo_manager, None, None, tech_detector),
+    )
+
 @cli.command()
 @click.option('--project', '-p', help='Project path (default: current directory)')
 @click.option('--type', 'scaffold_type', help='Scaffold type: livewire, controller, model, crud')
 @click.argument('name', required=False)
 def scaffold(project, scaffold_type, name):
     """Intelligent TALL Stack scaffolding and code generation"""
-    console.print(Panel.fit("🏗️ TALL Stack Scaffolding", style="bold blue"))
+    console.print(_banner("🏗️ TALL Stack Scaffolding", "bold blue"))
     
     try:
         project_path = project or os.getcwd()
         
         # Initialize components
-        config_manager = ConfigManager()
-        todo_manager = TodoManager(config_manager.config_dir)
-        tech_detector = TechStackDetector(config_manager.config_dir)
-        automation_engine = EnhancedAutomationEngine(todo_manager, None, None, tech_detector)
+        tooling = _get_tooling_context()
+        automation_engine = tooling.automation_engine
         
         # If no name provided, ask for user input
         if not name:
@@ -3137,21 +3631,27 @@ def scaffold(project, scaffold_type, name):
     except Exception as e:
         console.print(f"❌ Error during scaffolding: {e}")
 
+
+def _write_generated_file(file_path, content):
+    """Write a generated file, creating its directory; returns the path"""
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_text(content)
+    return file_path
+
 @cli.command()
 @click.option('--project', '-p', help='Project path (default: current directory)')
 @click.option('--generate', is_flag=True, help='Generate test files automatically')
 def generate_tests(project, generate):
     """Generate intelligent test suggestions and files"""
-    console.print(Panel.fit("🧪 Test Generation Assistant", style="bold green"))
+    console.print(_banner("🧪 Test Generation Assistant", "bold green"))
     
     try:
         project_path = project or os.getcwd()
         
         # Initialize components
-        config_manager = ConfigManager()
-        todo_manager = TodoManager(config_manager.config_dir)
-        tech_detector = TechStackDetector(config_manager.config_dir)
-        automation_engine = EnhancedAutomationEngine(todo_manager, None, None, tech_detector)
+        tooling = _get_tooling_context()
+        todo_manager = tooling.todo_manager
+        automation_engine = tooling.automation_engine
         
         console.print(f"🔍 Analyzing project for test opportunities: {project_path}")
         
@@ -3164,7 +3664,9 @@ def generate_tests(project, generate):
         
         console.print(f"\n📋 Found {len(test_suggestions)} test opportunities:")
         
-        tests_created = 0
+        # Test files are rendered as the user confirms them and written together
+        # afterwards, so the filesystem work overlaps instead of running per prompt
+        pending_writes = []
         for i, test_info in enumerate(test_suggestions, 1):
             console.print(f"\n{i}. {test_info['name']}")
             console.print(f"   Priority: {test_info['priority']}")
@@ -3183,21 +3685,13 @@ def generate_tests(project, generate):
                     console.print("   🔧 Setting up JavaScript testing framework...")
                     console.print("   💡 Consider running: npm install --save-dev jest @testing-library/jest-dom")
                 elif test_info.get('file_path'):
-                    # Create the test file
-                    test_file_path = Path(test_info['file_path'])
-                    test_file_path.parent.mkdir(parents=True, exist_ok=True)
-                    
                     # Generate test content based on template
+                    test_file_path = Path(test_info['file_path'])
                     test_content = automation_engine._generate_file_content(
                         test_info.get('template', 'basic_test'),
-                        Path(test_info['file_path']).stem.replace('Test', '')
+                        test_file_path.stem.replace('Test', '')
                     )
-                    
-                    with open(test_file_path, 'w') as f:
-                        f.write(test_content)
-                    
-                    console.print(f"   ✅ Created: {test_info['file_path']}")
-                    tests_created += 1
+                    pending_writes.append((test_file_path, test_content))
                 
                 # Also create a todo for manual completion
                 todo_id = todo_manager.add_todo(
@@ -3207,6 +3701,14 @@ def generate_tests(project, generate):
                 )
                 console.print(f"   📝 Created todo #{todo_id}")
         
+        # Create the test files
+        if pending_writes:
+            with ThreadPoolExecutor(max_workers=min(8, len(pending_writes))) as pool:
+                created_paths = list(pool.map(lambda write: _write_generated_file(*write), pending_writes))
+            for test_file_path in created_paths:
+                console.print(f"   ✅ Created: {test_file_path}")
+        
+        tests_created = len(pending_writes)
         if tests_created > 0:
             console.print(f"\n🎉 Created {tests_created} test files!")
             console.print("💡 Remember to implement the actual test logic in the generated files.")
@@ -3219,16 +3721,15 @@ def generate_tests(project, generate):
 @click.option('--setup', is_flag=True, help='Setup CI/CD automatically')
 def cicd_assistant(project, setup):
     """Setup CI/CD pipelines for TALL Stack projects"""
-    console.print(Panel.fit("🚀 CI/CD Pipeline Assistant", style="bold yellow"))
+    console.print(_banner("🚀 CI/CD Pipeline Assistant", "bold yellow"))
     
     try:
         project_path = project or os.getcwd()
         
         # Initialize components
-        config_manager = ConfigManager()
-        todo_manager = TodoManager(config_manager.config_dir)
-        tech_detector = TechStackDetector(config_manager.config_dir)
-        automation_engine = EnhancedAutomationEngine(todo_manager, None, None, tech_detector)
+        tooling = _get_tooling_context()
+        todo_manager = tooling.todo_manager
+        automation_engine = tooling.automation_engine
         
         console.print(f"🔍 Analyzing project for CI/CD opportunities: {project_path}")
         
@@ -3309,16 +3810,15 @@ def cicd_assistant(project, setup):
 @click.option('--project', '-p', help='Project path (default: current directory)')
 def smart_scaffold(description, project):
     """Natural language scaffolding - describe what you want to build"""
-    console.print(Panel.fit("🤖 AI-Powered Smart Scaffolding", style="bold magenta"))
+    console.print(_banner("🤖 AI-Powered Smart Scaffolding", "bold magenta"))
     
     try:
         project_path = project or os.getcwd()
         
         # Initialize components
-        config_manager = ConfigManager()
-        todo_manager = TodoManager(config_manager.config_dir)
-        tech_detector = TechStackDetector(config_manager.config_dir)
-        automation_engine = EnhancedAutomationEngine(todo_manager, None, None, tech_detector)
+        tooling = _get_tooling_context()
+        todo_manager = tooling.todo_manager
+        automation_engine = tooling.automation_engine
         
         console.print(f"🧠 Analyzing request: '{description}'")
         
@@ -3363,7 +3863,10 @@ def smart_scaffold(description, project):
 @click.option('--stop', is_flag=True, help='Stop running scheduler daemon')
 def scheduler(daemon, stop):
     """Start the 2DO task scheduler"""
-    console.print(Panel.fit("📅 2DO Task Scheduler", style="bold cyan"))
+    from .config import ConfigManager
+    from .scheduler import Scheduler
+    
+    console.print(_banner("📅 2DO Task Scheduler", "bold cyan"))
     
     try:
         working_dir = _get_safe_working_directory()
@@ -3383,7 +3886,6 @@ def scheduler(daemon, stop):
             try:
                 # Keep the scheduler running
                 import signal
-                import time
                 
                 def signal_handler(sig, frame):
                     console.print("\n🛑 Stopping scheduler...")
@@ -3436,7 +3938,10 @@ def schedule():
 @click.option('--description', prompt='Description', help='Description of what this schedule does')
 def add(name, schedule, description):
     """Add a new schedule interactively"""
-    console.print(Panel.fit("➕ Add New Schedule", style="bold green"))
+    from .config import ConfigManager
+    from .scheduler import Scheduler
+    
+    console.print(_banner("➕ Add New Schedule", "bold green"))
     
     try:
         working_dir = _get_safe_working_directory()
@@ -3507,6 +4012,9 @@ def add(name, schedule, description):
 @schedule.command()
 def list():
     """List all schedules"""
+    from .config import ConfigManager
+    from .scheduler import Scheduler
+    
     try:
         working_dir = _get_safe_working_directory()
         config_manager = ConfigManager(working_dir)
@@ -3523,6 +4031,9 @@ def list():
 @click.argument('name')
 def remove(name):
     """Remove a schedule"""
+    from .config import ConfigManager
+    from .scheduler import Scheduler
+    
     console.print(f"🗑️ Removing schedule: {name}")
     
     try:
@@ -3548,6 +4059,9 @@ def remove(name):
 @click.argument('name')
 def trigger(name):
     """Manually trigger a schedule"""
+    from .config import ConfigManager
+    from .scheduler import Scheduler
+    
     console.print(f"🔧 Manually triggering schedule: {name}")
     
     try:
@@ -3601,401 +4115,6 @@ def _get_task_config(task_type):
     return config
 
 
-# Agent Communication Commands
-@cli.command()
-@click.option('--register', '-r', is_flag=True, help='Register this agent in the network')
-@click.option('--name', '-n', help='Optional agent name (default: Agent-{repo_name})')
-def agent_status(register, name):
-    """Show agent network status and discover other online agents"""
-    from .agent_registry import AgentRegistry
-    from .agent_communicator import AgentCommunicator
-    from .agent_heartbeat import get_agent_heartbeat_service, is_agent_heartbeat_running
-    
-    console.print(Panel.fit("🤖 Agent Network Status", style="bold cyan"))
-    
-    try:
-        working_dir = _get_safe_working_directory()
-        config_manager = ConfigManager(working_dir)
-        agent_registry = AgentRegistry(config_manager)
-        
-        # Show heartbeat service status
-        heartbeat_running = is_agent_heartbeat_running()
-        heartbeat_service = get_agent_heartbeat_service()
-        
-        console.print(f"🔄 Background Service: {'🟢 Running' if heartbeat_running else '🔴 Stopped'}")
-        if heartbeat_service:
-            status = heartbeat_service.get_status()
-            console.print(f"   Active Collaborations: {status['active_collaborations']}")
-        console.print()
-        
-        if register:
-            # Register this agent
-            agent_info = agent_registry.register_agent(name)
-            console.print(f"✅ Agent registered: {agent_info.agent_name}")
-            console.print(f"📍 Repository: {agent_info.repo_name}")
-            console.print(f"🛠️  Tech Stack: {', '.join(agent_info.tech_stack)}")
-            console.print(f"💼 Capabilities: {', '.join(agent_info.capabilities)}")
-            console.print()
-        
-        # Show online agents
-        online_agents = agent_registry.get_online_agents()
-        
-        if not online_agents:
-            console.print("🔍 No other agents currently online")
-            console.print("💡 Run '2do agent-status --register' in other repositories to discover agents")
-            if not heartbeat_running:
-                console.print("💡 Run '2do agent-daemon' to start background agent service")
-            return
-        
-        console.print(f"🌐 Found {len(online_agents)} online agent(s):")
-        
-        # Create table of agents
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Agent", style="cyan", width=20)
-        table.add_column("Repository", style="green", width=25)
-        table.add_column("Tech Stack", style="yellow", width=30)
-        table.add_column("Status", style="blue", width=10)
-        table.add_column("Last Seen", style="dim", width=15)
-        
-        for agent in online_agents:
-            tech_stack_str = ", ".join(agent.tech_stack[:3])  # Show first 3 technologies
-            if len(agent.tech_stack) > 3:
-                tech_stack_str += "..."
-            
-            # Calculate time since last heartbeat
-            import time
-            time_diff = int(time.time() - agent.last_heartbeat)
-            if time_diff < 60:
-                last_seen = f"{time_diff}s ago"
-            elif time_diff < 3600:
-                last_seen = f"{time_diff // 60}m ago"
-            else:
-                last_seen = f"{time_diff // 3600}h ago"
-            
-            table.add_row(
-                agent.agent_name or f"Agent-{agent.repo_name}",
-                agent.repo_name,
-                tech_stack_str,
-                agent.status,
-                last_seen
-            )
-        
-        console.print(table)
-        
-        # Show collaboration opportunities
-        if online_agents:
-            console.print("\n🤝 Collaboration Commands:")
-            console.print("  • [bold]2do agent-help[/bold] - Request help from other agents")
-            console.print("  • [bold]2do agent-collaborate[/bold] - Start collaboration session")
-            console.print("  • [bold]2do agent-messages[/bold] - Check messages from other agents")
-            console.print("  • [bold]2do agent-daemon[/bold] - Start background agent service")
-            
-    except Exception as e:
-        console.print(f"❌ Error accessing agent network: {e}")
-
-
-@cli.command()
-@click.option('--name', '-n', help='Agent name for this repository')
-@click.option('--stop', is_flag=True, help='Stop the background agent service')
-@click.option('--status', is_flag=True, help='Show background service status')
-def agent_daemon(name, stop, status):
-    """Start/stop background agent service for continuous presence"""
-    from .agent_heartbeat import (start_agent_heartbeat, stop_agent_heartbeat, 
-                                  get_agent_heartbeat_service, is_agent_heartbeat_running)
-    
-    console.print(Panel.fit("🔄 Agent Background Service", style="bold blue"))
-    
-    try:
-        working_dir = _get_safe_working_directory()
-        config_manager = ConfigManager(working_dir)
-        
-        if stop:
-            if is_agent_heartbeat_running():
-                stop_agent_heartbeat()
-                console.print("✅ Background agent service stopped")
-            else:
-                console.print("ℹ️  Background agent service was not running")
-            return
-        
-        if status:
-            heartbeat_service = get_agent_heartbeat_service()
-            if heartbeat_service:
-                service_status = heartbeat_service.get_status()
-                console.print(f"🔄 Status: {'🟢 Running' if service_status['running'] else '🔴 Stopped'}")
-                console.print(f"📡 Agent ID: {service_status['agent_id']}")
-                console.print(f"🌐 Online Agents: {service_status['online_agents_count']}")
-                console.print(f"🤝 Active Collaborations: {service_status['active_collaborations']}")
-                console.print(f"💓 Heartbeat Interval: {service_status['heartbeat_interval']}s")
-            else:
-                console.print("🔴 Background agent service is not running")
-            return
-        
-        # Start the service
-        if is_agent_heartbeat_running():
-            console.print("ℹ️  Background agent service is already running")
-            console.print("💡 Use --status to check status or --stop to stop")
-            return
-        
-        console.print("🚀 Starting background agent service...")
-        heartbeat_service = start_agent_heartbeat(config_manager, name)
-        
-        service_status = heartbeat_service.get_status()
-        console.print(f"✅ Agent service started!")
-        console.print(f"📡 Agent ID: {service_status['agent_id']}")
-        console.print(f"💓 Heartbeat every {service_status['heartbeat_interval']} seconds")
-        console.print()
-        console.print("🔧 The service will:")
-        console.print("  • Maintain presence in the agent network")
-        console.print("  • Clean up stale agent entries")
-        console.print("  • Handle incoming collaboration requests")
-        console.print("  • Continue running until stopped or process ends")
-        console.print()
-        console.print("💡 Use 'Ctrl+C' to stop or '2do agent-daemon --stop'")
-        
-        # Keep the main thread alive if running interactively
-        if _is_terminal_interactive():
-            try:
-                while heartbeat_service.is_running():
-                    time.sleep(1)
-            except KeyboardInterrupt:
-                console.print("\n⏹️  Stopping background agent service...")
-                stop_agent_heartbeat()
-                console.print("✅ Service stopped")
-                
-    except Exception as e:
-        console.print(f"❌ Error with background agent service: {e}")
-
-
-@cli.command()
-@click.option('--title', '-t', prompt='Help request title', help='Brief title for the help request')
-@click.option('--description', '-d', prompt='Describe what you need help with', help='Detailed description')
-@click.option('--tech', '-tech', help='Required technologies (comma-separated)')
-@click.option('--capability', '-c', help='Required capabilities (comma-separated)')
-@click.option('--priority', '-p', type=click.Choice(['low', 'medium', 'high', 'urgent']), default='medium')
-def agent_help(title, description, tech, capability, priority):
-    """Request help from other agents in the network"""
-    from .agent_registry import AgentRegistry
-    from .agent_communicator import AgentCommunicator
-    
-    console.print(Panel.fit("🆘 Request Agent Help", style="bold yellow"))
-    
-    try:
-        working_dir = _get_safe_working_directory()
-        config_manager = ConfigManager(working_dir)
-        agent_registry = AgentRegistry(config_manager)
-        agent_communicator = AgentCommunicator(config_manager, agent_registry)
-        
-        # Ensure this agent is registered
-        agent_registry.register_agent()
-        
-        # Parse tech stack and capabilities
-        tech_stack = [t.strip() for t in tech.split(',')] if tech else []
-        capabilities = [c.strip() for c in capability.split(',')] if capability else []
-        
-        # If not specified, auto-detect some requirements
-        if not tech_stack and not capabilities:
-            repo_info = agent_registry._get_repo_info()
-            tech_stack = repo_info['tech_stack'][:3]  # Use first 3 technologies
-            capabilities = ['general-development', 'code-review']
-        
-        console.print(f"📤 Sending help request: {title}")
-        console.print(f"🎯 Priority: {priority}")
-        console.print(f"🛠️  Tech requirements: {', '.join(tech_stack) if tech_stack else 'Any'}")
-        console.print(f"💼 Capability requirements: {', '.join(capabilities) if capabilities else 'General'}")
-        
-        # Send help request
-        request_id = agent_communicator.send_help_request(
-            title=title,
-            description=description,
-            required_capabilities=capabilities,
-            tech_stack=tech_stack,
-            priority=priority
-        )
-        
-        console.print(f"✅ Help request sent! Request ID: {request_id}")
-        console.print("⏳ Waiting for responses from other agents...")
-        console.print("💡 Use '2do agent-messages' to check for replies")
-        
-    except Exception as e:
-        console.print(f"❌ Error sending help request: {e}")
-
-
-@cli.command()
-@click.option('--unread-only', '-u', is_flag=True, help='Show only unread messages')
-def agent_messages(unread_only):
-    """Check messages from other agents"""
-    from .agent_registry import AgentRegistry
-    from .agent_communicator import AgentCommunicator, MessageType
-    
-    console.print(Panel.fit("📬 Agent Messages", style="bold blue"))
-    
-    try:
-        working_dir = _get_safe_working_directory()
-        config_manager = ConfigManager(working_dir)
-        agent_registry = AgentRegistry(config_manager)
-        agent_communicator = AgentCommunicator(config_manager, agent_registry)
-        
-        # Get messages
-        messages = agent_communicator.get_messages()
-        
-        if not messages:
-            console.print("📭 No messages from other agents")
-            return
-        
-        console.print(f"📨 Found {len(messages)} message(s):")
-        
-        for i, message in enumerate(messages, 1):
-            # Get sender info
-            sender_agent = agent_registry.get_agent_by_id(message.from_agent_id)
-            sender_name = sender_agent.agent_name if sender_agent else message.from_agent_id[:8]
-            
-            console.print(f"\n[bold]{i}. {message.message_type.value.replace('_', ' ').title()}[/bold]")
-            console.print(f"   From: {sender_name}")
-            console.print(f"   Time: {datetime.fromtimestamp(message.timestamp).strftime('%Y-%m-%d %H:%M:%S')}")
-            
-            if message.message_type == MessageType.HELP_REQUEST:
-                help_req = message.content['help_request']
-                console.print(f"   Title: {help_req['title']}")
-                console.print(f"   Description: {help_req['description']}")
-                console.print(f"   Tech: {', '.join(help_req['tech_stack'])}")
-                console.print(f"   Priority: {help_req['priority']}")
-                
-                # Prompt to offer help
-                if Confirm.ask(f"   Offer help for this request?"):
-                    offer_message = Prompt.ask("   Your help offer message", 
-                                             default="I can help with this! Let me know how.")
-                    agent_communicator.send_help_offer(message, offer_message)
-                    console.print("   ✅ Help offer sent!")
-                    agent_communicator.mark_message_read(message.message_id)
-                    
-            elif message.message_type == MessageType.HELP_OFFER:
-                console.print(f"   Offer: {message.content['offer_message']}")
-                console.print(f"   Helper experience: {message.content['helper_info']['experience']}")
-                
-                # Prompt to accept/decline
-                if Confirm.ask("   Accept this help offer?"):
-                    agent_communicator.accept_help_offer(message)
-                    console.print("   ✅ Help offer accepted! Collaboration started.")
-                    agent_communicator.mark_message_read(message.message_id)
-                elif Confirm.ask("   Decline this offer?"):
-                    reason = Prompt.ask("   Decline reason (optional)", default="")
-                    agent_communicator.decline_help_offer(message, reason)
-                    console.print("   ❌ Help offer declined.")
-                    agent_communicator.mark_message_read(message.message_id)
-                    
-            elif message.message_type == MessageType.COLLABORATION_MESSAGE:
-                console.print(f"   Message: {message.content['message']}")
-                console.print(f"   Session: {message.content['session_id']}")
-                
-            # Option to mark as read
-            if not unread_only and Confirm.ask("   Mark as read?", default=True):
-                agent_communicator.mark_message_read(message.message_id)
-        
-    except Exception as e:
-        console.print(f"❌ Error checking messages: {e}")
-
-
-@cli.command()
-@click.option('--session-id', '-s', help='Specific collaboration session ID')
-def agent_collaborate(session_id):
-    """Start or join a collaboration session with another agent"""
-    from .agent_registry import AgentRegistry
-    from .agent_communicator import AgentCommunicator
-    
-    console.print(Panel.fit("🤝 Agent Collaboration", style="bold green"))
-    
-    try:
-        working_dir = _get_safe_working_directory()
-        config_manager = ConfigManager(working_dir)
-        agent_registry = AgentRegistry(config_manager)
-        agent_communicator = AgentCommunicator(config_manager, agent_registry)
-        
-        # Get active collaborations
-        active_collaborations = agent_communicator.get_active_collaborations()
-        
-        if session_id:
-            # Join specific session
-            session = next((s for s in active_collaborations if s.session_id == session_id), None)
-            if not session:
-                console.print(f"❌ Session {session_id} not found or not active")
-                return
-        elif active_collaborations:
-            # Show active sessions and let user choose
-            console.print("🔄 Active collaboration sessions:")
-            for i, session in enumerate(active_collaborations, 1):
-                other_agent_id = (session.helper_agent_id if session.requester_agent_id == agent_registry.agent_id 
-                                else session.requester_agent_id)
-                other_agent = agent_registry.get_agent_by_id(other_agent_id)
-                other_name = other_agent.agent_name if other_agent else other_agent_id[:8]
-                
-                console.print(f"  {i}. With {other_name} (Session: {session.session_id[:8]}...)")
-            
-            if len(active_collaborations) == 1:
-                session = active_collaborations[0]
-            else:
-                choice = int(Prompt.ask("Choose session", choices=[str(i) for i in range(1, len(active_collaborations) + 1)]))
-                session = active_collaborations[choice - 1]
-        else:
-            console.print("❌ No active collaboration sessions found")
-            console.print("💡 Use '2do agent-help' to request help and start a collaboration")
-            return
-        
-        # Start collaboration chat
-        console.print(f"💬 Collaboration chat started (Session: {session.session_id[:8]}...)")
-        console.print("💡 Type 'exit' to end, 'help' for commands, or chat naturally")
-        
-        other_agent_id = (session.helper_agent_id if session.requester_agent_id == agent_registry.agent_id 
-                         else session.requester_agent_id)
-        other_agent = agent_registry.get_agent_by_id(other_agent_id)
-        other_name = other_agent.agent_name if other_agent else "Other Agent"
-        
-        console.print(f"🤖 Collaborating with: {other_name}")
-        
-        # Chat loop
-        while True:
-            try:
-                message = Prompt.ask(f"[bold cyan]You[/bold cyan]")
-                
-                if message.lower() == 'exit':
-                    if Confirm.ask("End collaboration session?"):
-                        agent_communicator.end_collaboration(session.session_id, "completed")
-                        console.print("✅ Collaboration ended")
-                        break
-                    continue
-                    
-                elif message.lower() == 'help':
-                    console.print("🔧 Collaboration Commands:")
-                    console.print("  • exit - End collaboration")
-                    console.print("  • help - Show this help")
-                    console.print("  • Just type naturally to chat with the other agent")
-                    continue
-                
-                # Send collaboration message
-                agent_communicator.send_collaboration_message(session.session_id, message)
-                console.print(f"✅ Message sent to {other_name}")
-                
-                # Check for new messages
-                import time
-                time.sleep(1)  # Brief pause
-                messages = agent_communicator.get_messages([MessageType.COLLABORATION_MESSAGE])
-                for msg in messages:
-                    if msg.content.get('session_id') == session.session_id:
-                        sender_agent = agent_registry.get_agent_by_id(msg.from_agent_id)
-                        sender_name = sender_agent.agent_name if sender_agent else "Other Agent"
-                        console.print(f"[bold green]{sender_name}[/bold green]: {msg.content['message']}")
-                        agent_communicator.mark_message_read(msg.message_id)
-                
-            except KeyboardInterrupt:
-                console.print("\n⏸️  Collaboration paused. Use 'exit' to end properly.")
-                break
-            except Exception as e:
-                console.print(f"❌ Error in collaboration: {e}")
-                break
-                
-    except Exception as e:
-        console.print(f"❌ Error starting collaboration: {e}")
-
-
 @cli.command("claude-code")
 @click.option('--mode', default='auto', type=click.Choice(['auto', 'tall-stack', 'flutter', 'laravel', 'react']),
               help='Specialized Claude Code mode for different frameworks')
@@ -4071,6 +4190,8 @@ def claude_code(mode, interactive, prefer_claude, prompt):
 
 def _display_claude_code_status(config_manager, mode, detected_tech):
     """Display current Claude Code configuration and capabilities"""
+    from .ai_router import AIRouter
+    
     
     # Create status table
     table = Table(title="🚀 Claude Code Engine Status", show_header=True, header_style="bold magenta")
@@ -4110,6 +4231,8 @@ def _display_claude_code_status(config_manager, mode, detected_tech):
 
 def _run_claude_code_interactive(config_manager, mode):
     """Run Claude Code in interactive mode"""
+    from .ai_router import AIRouter
+    
     console.print("\n💬 [bold yellow]Interactive Claude Code Session[/bold yellow]")
     console.print("Type 'exit' to quit, 'help' for commands, or describe what you want to build:")
     
@@ -4139,7 +4262,7 @@ def _run_claude_code_interactive(config_manager, mode):
             enhanced_prompt = _enhance_prompt_for_claude_code(user_input, mode)
             
             # Use AI router with Claude preference
-            response = asyncio.run(ai_router.route_prompt(enhanced_prompt))
+            response = _run_async(ai_router.route_prompt(enhanced_prompt))
             console.print(f"\n✨ [bold green]Claude Response:[/bold green]\n{response}")
             
         except KeyboardInterrupt:
@@ -4151,13 +4274,15 @@ def _run_claude_code_interactive(config_manager, mode):
 
 def _run_claude_code_single(config_manager, mode, prompt):
     """Run a single Claude Code prompt"""
+    from .ai_router import AIRouter
+    
     console.print(f"\n🚀 [bold yellow]Processing with Claude Code Engine...[/bold yellow]")
     
     try:
         ai_router = AIRouter(config_manager)
         enhanced_prompt = _enhance_prompt_for_claude_code(prompt, mode)
         
-        response = asyncio.run(ai_router.route_prompt(enhanced_prompt))
+        response = _run_async(ai_router.route_prompt(enhanced_prompt))
         console.print(f"\n✨ [bold green]Claude Response:[/bold green]\n{response}")
         
     except Exception as e:
@@ -4217,21 +4342,28 @@ React Specialization:
     return f"{enhancement}\n\nUser Request: {prompt}"
 
 
+# Static part of the Claude Code session help
+_CLAUDE_CODE_HELP = "\n".join([
+    "\n🆘 [bold yellow]Claude Code Help[/bold yellow]",
+    "Commands:",
+    "  • [bold]exit[/bold] - End Claude Code session",
+    "  • [bold]help[/bold] - Show this help",
+    "  • [bold]mode <type>[/bold] - Switch specialization mode",
+    "\nAvailable modes:",
+    "  • [bold]tall-stack[/bold] - Tailwind, Alpine.js, Laravel, Livewire",
+    "  • [bold]flutter[/bold] - Flutter & Dart development",
+    "  • [bold]laravel[/bold] - Laravel PHP framework",
+    "  • [bold]react[/bold] - React & Next.js",
+    "  • [bold]auto[/bold] - Auto-detect based on project"
+])
+
+
 def _show_claude_code_help(current_mode):
     """Show Claude Code help information"""
-    console.print("\n🆘 [bold yellow]Claude Code Help[/bold yellow]")
-    console.print("Commands:")
-    console.print("  • [bold]exit[/bold] - End Claude Code session")
-    console.print("  • [bold]help[/bold] - Show this help")
-    console.print("  • [bold]mode <type>[/bold] - Switch specialization mode")
-    console.print("\nAvailable modes:")
-    console.print("  • [bold]tall-stack[/bold] - Tailwind, Alpine.js, Laravel, Livewire")
-    console.print("  • [bold]flutter[/bold] - Flutter & Dart development")
-    console.print("  • [bold]laravel[/bold] - Laravel PHP framework")
-    console.print("  • [bold]react[/bold] - React & Next.js")
-    console.print("  • [bold]auto[/bold] - Auto-detect based on project")
-    console.print(f"\nCurrent mode: [bold green]{current_mode}[/bold green]")
-    console.print("\nJust describe what you want to build, and Claude will help with specialized knowledge!")
+    console.print(
+        f"{_CLAUDE_CODE_HELP}\n\nCurrent mode: [bold green]{current_mode}[/bold green]\n"
+        "\nJust describe what you want to build, and Claude will help with specialized knowledge!"
+    )
 
 
 @cli.command("tall-stack")
@@ -4252,6 +4384,7 @@ def tall_stack(task, component, model, route, scaffold):
         2do tall-stack --model Post --scaffold
         2do tall-stack --route "user profile edit and update"
     """
+    from .laravel_devtoolbox_integration import LaravelDevToolboxIntegration
     from .config import ConfigManager
     from .ai_router import AIRouter
     
@@ -4314,7 +4447,7 @@ def tall_stack(task, component, model, route, scaffold):
         enhanced_prompt = _enhance_prompt_for_claude_code(full_prompt, "tall-stack")
         
         console.print("🚀 [bold yellow]Processing with Claude TALL Stack expertise...[/bold yellow]")
-        response = asyncio.run(ai_router.route_prompt(enhanced_prompt))
+        response = _run_async(ai_router.route_prompt(enhanced_prompt))
         console.print(f"\n✨ [bold green]Claude TALL Stack Response:[/bold green]\n{response}")
         
     except Exception as e:
@@ -4385,7 +4518,7 @@ def flutter_dev(task, widget, screen, state, responsive):
         enhanced_prompt = _enhance_prompt_for_claude_code(full_prompt, "flutter")
         
         console.print("🚀 [bold yellow]Processing with Claude Flutter expertise...[/bold yellow]")
-        response = asyncio.run(ai_router.route_prompt(enhanced_prompt))
+        response = _run_async(ai_router.route_prompt(enhanced_prompt))
         console.print(f"\n✨ [bold green]Claude Flutter Response:[/bold green]\n{response}")
         
     except Exception as e:
@@ -4492,6 +4625,8 @@ def laravel_analyze(install, report, models, routes, security, format):
         2do laravel-analyze --report analysis.json
         2do laravel-analyze --security --routes
     """
+    from .laravel_devtoolbox_integration import LaravelDevToolboxIntegration
+    
     console.print("🔍 [bold blue]Laravel Deep Analysis[/bold blue]")
     
     devtoolbox = LaravelDevToolboxIntegration()
@@ -4583,6 +4718,8 @@ def laravel_models(graph, output, format):
         2do laravel-models --graph --output models.mmd
         2do laravel-models --graph --format json
     """
+    from .laravel_devtoolbox_integration import LaravelDevToolboxIntegration
+    
     console.print("📊 [bold blue]Laravel Models Analysis[/bold blue]")
     
     devtoolbox = LaravelDevToolboxIntegration()
@@ -4622,6 +4759,8 @@ def laravel_routes(unused, where):
         2do laravel-routes --unused
         2do laravel-routes --where UserController
     """
+    from .laravel_devtoolbox_integration import LaravelDevToolboxIntegration
+    
     console.print("🛣️ [bold blue]Laravel Routes Analysis[/bold blue]")
     
     devtoolbox = LaravelDevToolboxIntegration()
@@ -4664,6 +4803,8 @@ def laravel_install_devtoolbox():
     """
     Install Laravel DevToolbox for enhanced Laravel analysis.
     """
+    from .laravel_devtoolbox_integration import LaravelDevToolboxIntegration
+    
     console.print("📦 [bold blue]Installing Laravel DevToolbox[/bold blue]")
     
     devtoolbox = LaravelDevToolboxIntegration()
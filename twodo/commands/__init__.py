@@ -0,0 +1,3 @@
+"""
+Subcommands of the 2DO CLI that are imported on demand
+"""
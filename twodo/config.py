@@ -5,17 +5,66 @@ Configuration management for 2DO
 import os
 import yaml
 import json
+import pickle
+import struct
+import hashlib
+import tempfile
 from pathlib import Path
 from typing import Dict, Optional
 from dotenv import load_dotenv
 from .permission_manager import PermissionManager
 
+# Header of a parsed-YAML cache file: st_mtime_ns and st_size of the source YAML
+_YAML_CACHE_HEADER = struct.Struct("<qq")
+
+
+def _yaml_cache_file(path: Path, cache_dir: Path) -> Path:
+    """Location of the parsed-YAML cache for path
+
+    Caches live in the user's own 2DO directory rather than next to the YAML,
+    so a pickle shipped inside a cloned repository is never loaded.
+    """
+    digest = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()
+    return cache_dir / f"{digest}.pkl"
+
+
+def _load_yaml_cached(path: Path, cache_dir: Path) -> dict:
+    """Load a YAML file, reusing a pickled copy while the file is unchanged"""
+    st = path.stat()
+    key = _YAML_CACHE_HEADER.pack(st.st_mtime_ns, st.st_size)
+    cache_file = _yaml_cache_file(path, cache_dir)
+    
+    try:
+        with open(cache_file, 'rb') as f:
+            if f.read(_YAML_CACHE_HEADER.size) == key:
+                return pickle.load(f)
+    except Exception:
+        # Missing, stale or corrupt cache - fall back to parsing the YAML
+        pass
+    
+    with open(path, 'r') as f:
+        data = yaml.safe_load(f) or {}
+    
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, 'wb') as f:
+            f.write(key)
+            pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        # Caching is best effort
+        pass
+    
+    return data
+
+
 class ConfigManager:
     """Manages configuration and API keys for AI models"""
     
     def __init__(self, project_dir=None, suppress_prompts=False):
         # If project_dir is provided and is a git repo, use local 2DO folder
-        if project_dir and self._is_git_repo(project_dir):
+        if self.exists(project_dir):
             # Check for both '2DO' and '2dos' directories
             project_path = Path(project_dir)
             if (project_path / "2dos").exists():
@@ -30,7 +79,9 @@ class ConfigManager:
         self.config_file = self.config_dir / "config.yaml"
         self.global_config_dir = Path.home() / ".2do"
         self.global_config_file = self.global_config_dir / "config.yaml"
+        self.yaml_cache_dir = self.global_config_dir / "cache"
         self.suppress_prompts = suppress_prompts
+        self._analysis_dirty = False
         
         # Load environment variables from .env file
         self._load_environment_variables()
@@ -62,10 +113,15 @@ class ConfigManager:
         
         self._load_config()
     
-    def _is_git_repo(self, path):
+    @staticmethod
+    def exists(project_dir) -> bool:
+        """Check whether project_dir gets its own project-local configuration"""
+        return bool(project_dir) and ConfigManager._is_git_repo(project_dir)
+    
+    @staticmethod
+    def _is_git_repo(path) -> bool:
         """Check if the path is a git repository"""
-        git_dir = Path(path) / ".git"
-        return git_dir.exists()
+        return os.path.exists(os.path.join(path, ".git"))
     
     def _load_environment_variables(self):
         """Load environment variables from .env file"""
@@ -89,8 +145,7 @@ class ConfigManager:
     def _load_config(self):
         """Load configuration from file"""
         if self.config_file.exists():
-            with open(self.config_file, 'r') as f:
-                self.config = yaml.safe_load(f) or {}
+            self.config = _load_yaml_cached(self.config_file, self.yaml_cache_dir)
         else:
             self.config = {
                 "api_keys": {},
@@ -153,8 +208,7 @@ class ConfigManager:
             return None
         
         try:
-            with open(self.global_config_file, 'r') as f:
-                return yaml.safe_load(f) or {}
+            return _load_yaml_cached(self.global_config_file, self.yaml_cache_dir)
         except Exception:
             return None
     
@@ -244,6 +298,13 @@ class ConfigManager:
             with open(self.config_file, 'w') as f:
                 yaml.dump(self.config, f, default_flow_style=False)
             
+            # Drop the parsed copy so a same-size rewrite within the filesystem's
+            # mtime granularity can't be mistaken for the old file
+            try:
+                _yaml_cache_file(self.config_file, self.yaml_cache_dir).unlink()
+            except OSError:
+                pass
+            
             # Set secure file permissions
             PermissionManager.ensure_file_permissions(self.config_file)
             
@@ -267,6 +328,13 @@ class ConfigManager:
         self.config["api_keys"][provider] = api_key
         self._save_config()
     
+    def set_api_keys(self, api_keys: Dict[str, str]):
+        """Set API keys for several providers with a single config write"""
+        if not api_keys:
+            return
+        self.config["api_keys"].update(api_keys)
+        self._save_config()
+    
     def get_api_key(self, provider: str) -> Optional[str]:
         """Get API key for a provider - prioritize environment variables over config file"""
         # Environment variable mapping
@@ -610,6 +678,11 @@ class ConfigManager:
     
     def save_analysis_results(self, tech_stack: list, memory_files_created: bool = False):
         """Save analysis results to config"""
+        self.mark_analysis_dirty(tech_stack, memory_files_created)
+        self.flush_analysis()
+    
+    def mark_analysis_dirty(self, tech_stack: list, memory_files_created: bool = False):
+        """Record analysis results in memory; they are written by flush_analysis()"""
         import datetime
         
         if "analysis" not in self.config:
@@ -619,7 +692,13 @@ class ConfigManager:
         self.config["analysis"]["tech_stack"] = tech_stack
         self.config["analysis"]["memory_files_created"] = memory_files_created
         self.config["analysis"]["analysis_completed"] = True  # New field to track completion
-        self._save_config()
+        self._analysis_dirty = True
+    
+    def flush_analysis(self):
+        """Write analysis results recorded by mark_analysis_dirty(), if any"""
+        if self._analysis_dirty:
+            self._analysis_dirty = False
+            self._save_config()
     
     def should_skip_analysis(self, force_reanalyze: bool = False) -> bool:
         """Determine if analysis should be skipped"""
@@ -18,6 +18,9 @@ from .permission_manager import SessionPermissionManager
 
 console = Console()
 
+# Reads and writes larger than this show a progress bar
+PROGRESS_THRESHOLD_BYTES = 1024 * 100
+
 class FileOperationCache:
     """Cache for file operations to improve performance"""
     
@@ -79,8 +82,13 @@ class EnhancedFileHandler:
         self.operation_history: List[Dict] = []
         
     async def read_file_fast(self, file_path: Union[str, Path], 
-                           show_progress: bool = True) -> str:
-        """Fast file reading with caching and progress indication"""
+                           show_progress: bool = True,
+                           max_chars: Optional[int] = None) -> str:
+        """Fast file reading with caching and progress indication
+        
+        With max_chars, only the first max_chars characters are read; such
+        partial reads are not cached.
+        """
         file_path = Path(file_path).resolve()
         
         # Check permissions first
@@ -99,19 +107,42 @@ class EnhancedFileHandler:
         cached_content = self.cache.get_cached_content(file_path)
         if cached_content is not None:
             console.print(f"⚡ Cache hit: {file_path.name}")
-            return cached_content
+            return cached_content if max_chars is None else cached_content[:max_chars]
+        
+        if max_chars is not None:
+            return await self._read_file_head(file_path, max_chars)
         
         # Read file with progress indication
-        if show_progress and file_path.stat().st_size > 1024 * 100:  # Show progress for files > 100KB
+        if show_progress and file_path.stat().st_size > PROGRESS_THRESHOLD_BYTES:
             return await self._read_file_with_progress(file_path)
         else:
             return await self._read_file_simple(file_path)
     
+    @staticmethod
+    def _read_text(file_path: Path, max_chars: int = -1) -> str:
+        """Blocking read of a text file, whole or up to max_chars characters"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read(max_chars)
+    
+    async def _read_file_head(self, file_path: Path, max_chars: int) -> str:
+        """Read just the start of a file, e.g. for a preview"""
+        try:
+            loop = asyncio.get_running_loop()
+            content = await loop.run_in_executor(None, self._read_text, file_path, max_chars)
+            self._record_operation('read', file_path, len(content))
+            return content
+        
+        except Exception as e:
+            console.print(f"❌ Error reading {file_path}: {e}")
+            raise
+    
     async def _read_file_simple(self, file_path: Path) -> str:
         """Simple file reading for small files"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Read on a worker thread so concurrent reads overlap instead of
+            # blocking the event loop one after another
+            loop = asyncio.get_running_loop()
+            content = await loop.run_in_executor(None, self._read_text, file_path)
             
             # Cache the content
             self.cache.cache_content(file_path, content)
@@ -170,18 +201,7 @@ class EnhancedFileHandler:
                             show_progress: bool = True, create_backup: bool = True) -> bool:
         """Fast file writing with progress and backup options"""
         file_path = Path(file_path).resolve()
-        
-        # Check permissions
-        if not self.permission_manager.current_session:
-            self.permission_manager.create_session()
-        
-        if not self.permission_manager.current_session.has_permission(str(file_path), 'write'):
-            granted = self.permission_manager.request_permission(
-                str(file_path), 'write',
-                reason="Fast file writing operation"
-            )
-            if not granted:
-                raise PermissionError(f"Write permission denied for {file_path}")
+        self._check_write_permission(file_path)
         
         try:
             # Create backup if requested and file exists
@@ -193,7 +213,7 @@ class EnhancedFileHandler:
             
             # Write file with progress for large content
             content_size = len(content.encode('utf-8'))
-            if show_progress and content_size > 1024 * 100:  # Show progress for content > 100KB
+            if show_progress and content_size > PROGRESS_THRESHOLD_BYTES:
                 await self._write_file_with_progress(file_path, content)
             else:
                 await self._write_file_simple(file_path, content)
@@ -210,12 +230,54 @@ class EnhancedFileHandler:
             console.print(f"❌ Error writing {file_path}: {e}")
             raise
     
-    async def _write_file_simple(self, file_path: Path, content: str):
-        """Simple file writing for small files"""
+    def write_file_sync(self, file_path: Union[str, Path], content: str,
+                        create_backup: bool = True) -> bool:
+        """Write a file directly, without progress or an event loop
+        
+        For one-off small writes, where async dispatch only adds overhead.
+        """
+        file_path = Path(file_path).resolve()
+        self._check_write_permission(file_path)
+        
+        try:
+            if create_backup and file_path.exists():
+                self._backup_file(file_path)
+            
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_text(file_path, content)
+            
+            self.cache.invalidate(file_path)
+            self._record_operation('write', file_path, len(content.encode('utf-8')))
+            
+            return True
+            
+        except Exception as e:
+            console.print(f"❌ Error writing {file_path}: {e}")
+            raise
+    
+    def _check_write_permission(self, file_path: Path):
+        """Make sure the session may write file_path, asking the user if needed"""
+        if not self.permission_manager.current_session:
+            self.permission_manager.create_session()
+        
+        if not self.permission_manager.current_session.has_permission(str(file_path), 'write'):
+            granted = self.permission_manager.request_permission(
+                str(file_path), 'write',
+                reason="Fast file writing operation"
+            )
+            if not granted:
+                raise PermissionError(f"Write permission denied for {file_path}")
+    
+    def _write_text(self, file_path: Path, content: str):
+        """Blocking write of a whole text file"""
         with open(file_path, 'w', encoding='utf-8') as f:
             f.write(content)
         console.print(f"✅ Wrote {file_path.name} ({self._format_size(len(content.encode('utf-8')))})")
     
+    async def _write_file_simple(self, file_path: Path, content: str):
+        """Simple file writing for small files"""
+        self._write_text(file_path, content)
+    
     async def _write_file_with_progress(self, file_path: Path, content: str):
         """Write large files with progress indication"""
         content_bytes = content.encode('utf-8')
@@ -246,6 +308,10 @@ class EnhancedFileHandler:
     
     async def _create_backup(self, file_path: Path):
         """Create backup of existing file"""
+        self._backup_file(file_path)
+    
+    def _backup_file(self, file_path: Path):
+        """Copy file_path to a timestamped backup next to it"""
         backup_path = file_path.with_suffix(f"{file_path.suffix}.backup.{int(time.time())}")
         try:
             import shutil
@@ -270,21 +336,25 @@ class EnhancedFileHandler:
             
             task = progress.add_task("Reading files", total=len(file_paths))
             
+            # At most max_workers reads in flight; a new one starts as soon as
+            # any finishes rather than waiting for a whole batch
+            semaphore = asyncio.Semaphore(max_workers)
+            
             async def read_single_file(file_path):
-                try:
-                    content = await self.read_file_fast(file_path, show_progress=False)
-                    results[str(file_path)] = content
-                    progress.update(task, advance=1)
-                except Exception as e:
-                    failed_files.append((str(file_path), str(e)))
-                    progress.update(task, advance=1)
+                async with semaphore:
+                    try:
+                        return await self.read_file_fast(file_path, show_progress=False)
+                    except Exception as e:
+                        failed_files.append((str(file_path), str(e)))
+                        return None
+                    finally:
+                        progress.update(task, advance=1)
             
-            # Process files in batches to avoid overwhelming the system
-            batch_size = max_workers
-            for i in range(0, len(file_paths), batch_size):
-                batch = file_paths[i:i + batch_size]
-                tasks = [read_single_file(fp) for fp in batch]
-                await asyncio.gather(*tasks, return_exceptions=True)
+            contents = await asyncio.gather(*(read_single_file(fp) for fp in file_paths))
+            # Keep results in the order the paths were given
+            for file_path, content in zip(file_paths, contents):
+                if content is not None:
+                    results[str(file_path)] = content
         
         if failed_files:
             console.print(f"⚠️ {len(failed_files)} files failed to read:")
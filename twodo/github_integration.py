@@ -4,6 +4,7 @@ GitHub Integration - Handles GitHub repository operations, issues, and pull requ
 
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 from github import Github, GithubException
@@ -121,6 +122,42 @@ class GitHubIntegration:
             console.print(f"❌ Failed to create issue: {e}")
             return None
     
+    def create_issues_bulk(self, owner: str, repo_name: str, issue_specs: List[Dict],
+                           concurrency: int = 8) -> List[Optional[Dict]]:
+        """Create several issues concurrently
+        
+        Each spec holds 'title', 'body' and optionally 'labels'. Results line up
+        with issue_specs; a failed issue gives None. Concurrency is kept low to
+        stay clear of GitHub's secondary rate limits.
+        """
+        if not issue_specs:
+            return []
+        if not self.github:
+            console.print("❌ GitHub connection not available")
+            return [None] * len(issue_specs)
+        
+        try:
+            repo = self.github.get_repo(f"{owner}/{repo_name}")
+        except GithubException as e:
+            console.print(f"❌ Failed to create issues: {e}")
+            return [None] * len(issue_specs)
+        
+        def create(spec):
+            try:
+                issue = repo.create_issue(title=spec['title'], body=spec['body'], labels=spec.get('labels') or [])
+                return {
+                    'number': issue.number,
+                    'title': issue.title,
+                    'url': issue.html_url,
+                    'created_at': issue.created_at.isoformat()
+                }
+            except GithubException as e:
+                console.print(f"❌ Failed to create issue: {e}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(issue_specs))) as pool:
+            return list(pool.map(create, issue_specs))
+    
     def create_branch_for_issue(self, repo_path: str, issue_number: int, issue_title: str) -> bool:
         """Create a new branch for working on an issue"""
         try:
@@ -237,17 +274,17 @@ class GitHubIntegration:
             console.print("📝 No issues found")
             return []
         
-        todo_ids = []
-        for issue in issues:
-            # Create todo from issue
-            todo_id = todo_manager.add_todo(
-                title=f"GitHub Issue #{issue['number']}: {issue['title']}",
-                description=f"Work on GitHub issue in {owner}/{repo_name}",
-                todo_type="code",
-                priority=priority,
-                content=f"Issue URL: {issue['url']}\nLabels: {', '.join(issue['labels'])}\n\n{issue['body'][:500]}"
-            )
-            todo_ids.append(todo_id)
+        # Create one todo per issue with a single save
+        todo_ids = todo_manager.add_todos_bulk([
+            {
+                "title": f"GitHub Issue #{issue['number']}: {issue['title']}",
+                "description": f"Work on GitHub issue in {owner}/{repo_name}",
+                "todo_type": "code",
+                "priority": priority,
+                "content": f"Issue URL: {issue['url']}\nLabels: {', '.join(issue['labels'])}\n\n{issue['body'][:500]}"
+            }
+            for issue in issues
+        ])
         
         console.print(f"✅ Created {len(todo_ids)} todos from GitHub issues")
         return todo_ids
@@ -362,8 +399,7 @@ class GitHubIntegration:
             sub_tasks = todo_manager.get_sub_tasks(todo['id'])
             if sub_tasks:
                 parent_body += f"\n**Sub-tasks ({len(sub_tasks)} items):**\n"
-                for i, sub_task in enumerate(sub_tasks, 1):
-                    parent_body += f"{i}. {sub_task['title']}\n"
+                parent_body += "".join(f"{i}. {sub_task['title']}\n" for i, sub_task in enumerate(sub_tasks, 1))
                 parent_body += "\n*Note: Sub-tasks will be created as separate linked issues.*"
             
             # Create parent issue
@@ -5,6 +5,7 @@ Image Handler - Manages clipboard image operations and preview functionality
 
 import io
 import os
+import sys
 import tempfile
 import base64
 from pathlib import Path
@@ -16,7 +17,6 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
-
 class ImageHandler:
     """Handles clipboard image operations and preview functionality"""
     
@@ -35,9 +35,39 @@ class ImageHandler:
                 # Final fallback - use system temp directly
                 self.temp_dir = Path(tempfile.gettempdir())
                 self.console.print("⚠️ Cannot create dedicated image temp directory, using system temp")
+        
+        # Last clipboard check: the clipboard sequence number at the time (None
+        # where the platform has none) and the image it found
+        self._clipboard_sequence = None
+        self._clipboard_image = None
     
     def check_clipboard_for_image(self) -> Optional[Image.Image]:
-        """Check if clipboard contains an image and return it"""
+        """Check if clipboard contains an image and return it
+        
+        On Windows the result is reused while the clipboard sequence number shows
+        the clipboard unchanged; elsewhere the clipboard is read on every call.
+        """
+        sequence = self._get_clipboard_sequence()
+        if sequence is not None and sequence == self._clipboard_sequence:
+            return self._clipboard_image
+        
+        self._clipboard_image = self._read_clipboard_image()
+        self._clipboard_sequence = sequence
+        return self._clipboard_image
+    
+    @staticmethod
+    def _get_clipboard_sequence() -> Optional[int]:
+        """Clipboard change counter where the OS offers a cheap one (Windows), else None"""
+        if sys.platform != "win32":
+            return None
+        try:
+            import ctypes
+            return ctypes.windll.user32.GetClipboardSequenceNumber()
+        except Exception:
+            return None
+    
+    def _read_clipboard_image(self) -> Optional[Image.Image]:
+        """Read the clipboard and return its image, if any"""
         try:
             # Try to get image from clipboard
             # Note: This approach works mainly on Windows/Mac with proper clipboard support
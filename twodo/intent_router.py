@@ -5,6 +5,7 @@ Determines user intent from natural language input and routes to appropriate act
 """
 
 import re
+import random
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
@@ -15,11 +16,104 @@ class IntentMatch:
     confidence: float
     extracted_params: Dict = None
 
+# Friendly confirmation messages per intent; one is picked at random per call
+_CONFIRMATION_MESSAGES = {
+    "add-todo": [
+        "🎯 Got it! Looks like you want to track a new task.",
+        "✨ I see you've got something new to work on - let me help you organize it!",
+        "📝 Perfect! I'll help you capture this task so you don't forget.",
+        "🚀 Awesome! Let's get this new task properly documented.",
+    ],
+    "list-todos": [
+        "📋 Sure thing! Let me show you everything on your plate right now.",
+        "👀 Of course! Here's your current workload at a glance.",
+        "📊 Absolutely! Let's see what you're juggling these days.",
+        "🔍 No problem! Here are all the tasks waiting for your attention.",
+    ],
+    "create-subtasks": [
+        "🔨 Great idea! Let's break that big task into bite-sized pieces.",
+        "🧩 Smart thinking! I'll help make that complex todo more manageable.",
+        "📏 Excellent! Breaking it down will make it much easier to tackle.",
+    ],
+    "multitask": [
+        "🚀 I love the productivity mindset! Let's get multiple AI agents working for you.",
+        "⚡ Perfect! Time to unleash the power of parallel processing on your todos.",
+        "🎯 Fantastic choice! Multiple tasks at once - that's how we get things done.",
+        "💪 Yes! Let's show those todos what teamwork looks like.",
+    ],
+    "run-all": [
+        "🔥 WOW! Going for the full productivity blitz - I'm impressed!",
+        "⚡ LOVE the ambition! Let's get ALL your todos handled with multiple AI agents!",
+        "🚀 This is what I call maximum efficiency! Every pending task will get attention.",
+        "💥 You're not messing around! Full power mode with up to 5 AI agents at once!",
+        "🎯 THE ULTIMATE MOVE! I'll coordinate multiple AI agents to handle everything.",
+    ],
+    "github-issues": [
+        "🐙 Absolutely! Let's see what's brewing in your GitHub repository.",
+        "📋 Great! Time to sync up with your repository and see what needs attention.",
+        "🔍 Perfect! I'll help you manage your GitHub issues like a pro.",
+    ],
+    "create-github-issue": [
+        "🐛 Good thinking! Let's document that issue properly in GitHub.",
+        "📝 Smart approach! I'll help you create a detailed GitHub issue.",
+        "🎯 Excellent! Proper issue tracking is key to good development.",
+    ],
+    "export-todos-to-github": [
+        "📤 Brilliant idea! Let's get your local todos synced with GitHub.",
+        "🔄 Perfect! Moving your work to GitHub will improve visibility and tracking.",
+        "🚀 Smart workflow! GitHub integration makes collaboration so much easier.",
+    ],
+    "parse-markdown": [
+        "📖 Clever! Let me extract all the tasks hiding in your markdown files.",
+        "🔍 Great idea! I'll scan through your docs and find all the TODOs.",
+        "📋 Perfect! Your documentation probably has tons of actionable items.",
+    ],
+    "browser-integration": [
+        "🌐 Excellent! Let's get your development environment supercharged.",
+        "⚡ Smart move! Browser integration makes development so much smoother.",
+        "🚀 Love it! Real-time feedback while you work is a game-changer.",
+    ],
+    "remove-todo": [
+        "🗑️ No problem! Let's clean up your task list.",
+        "✂️ Absolutely! Sometimes we need to declutter our workload.",
+        "🧹 Sure thing! I'll help you remove that task.",
+        "❌ Got it! Let's get rid of what you don't need anymore.",
+    ],
+    "remove-completed-todos": [
+        "🧽 Great idea! Nothing like a clean slate to feel accomplished.",
+        "✨ Perfect timing for some organizational housekeeping!",
+        "🗂️ Smart! Archiving completed work gives you a clear view of what's next.",
+        "🎉 Love it! Celebrating completed work by clearing the deck!",
+    ],
+    "mcp-management": [
+        "🔌 Excellent! Let's optimize your development tools and server setup.",
+        "⚙️ Perfect! Proper MCP configuration will supercharge your workflow.",
+        "🛠️ Smart thinking! Good tool setup saves hours of development time.",
+    ],
+    "chat": [
+        "💬 Of course! I'm here to help with whatever's on your mind.",
+        "🤔 Great question! Let me think about that with you.",
+        "💡 I love helping with problems - what's up?",
+        "🧠 Perfect! Let's put our heads together on this.",
+    ],
+    "quit": [
+        "👋 Thanks for working with me today! Take care!",
+        "😊 It was great helping you out! See you next time!",
+        "🎉 Good session! Hope I helped you get things done!",
+        "💪 Keep up the great work! I'll be here when you need me!",
+    ]
+}
+
+# Upper bound on remembered analyze_intent results
+_INTENT_CACHE_SIZE = 256
+
 class IntentRouter:
     """Routes natural language input to appropriate 2DO actions"""
     
     def __init__(self):
         self.intent_patterns = self._initialize_intent_patterns()
+        # Exact user input -> IntentMatch, so repeated commands skip the pattern scan
+        self._intent_cache: Dict[str, IntentMatch] = {}
         
     def _initialize_intent_patterns(self) -> Dict[str, List[Dict]]:
         """Initialize patterns for different intents"""
@@ -235,6 +329,18 @@ class IntentRouter:
         if not user_input or not user_input.strip():
             return IntentMatch("add-todo", 0.5)  # Default to adding todo
         
+        cached = self._intent_cache.get(user_input)
+        if cached is not None:
+            return cached
+        
+        if len(self._intent_cache) >= _INTENT_CACHE_SIZE:
+            # Evict the oldest entry
+            del self._intent_cache[next(iter(self._intent_cache))]
+        match = self._intent_cache[user_input] = self._analyze_intent(user_input)
+        return match
+    
+    def _analyze_intent(self, user_input: str) -> IntentMatch:
+        """Run the pattern scan behind analyze_intent"""
         user_input_lower = user_input.lower().strip()
         
         # Track all matches with confidence scores
@@ -326,96 +432,8 @@ class IntentRouter:
     
     def get_friendly_confirmation(self, intent: str, extracted_params: Dict = None) -> str:
         """Get a friendly, human colleague-like confirmation message for the detected intent"""
-        messages = {
-            "add-todo": [
-                "🎯 Got it! Looks like you want to track a new task.",
-                "✨ I see you've got something new to work on - let me help you organize it!",
-                "📝 Perfect! I'll help you capture this task so you don't forget.",
-                "🚀 Awesome! Let's get this new task properly documented.",
-            ],
-            "list-todos": [
-                "📋 Sure thing! Let me show you everything on your plate right now.",
-                "👀 Of course! Here's your current workload at a glance.",
-                "📊 Absolutely! Let's see what you're juggling these days.",
-                "🔍 No problem! Here are all the tasks waiting for your attention.",
-            ],
-            "create-subtasks": [
-                "🔨 Great idea! Let's break that big task into bite-sized pieces.",
-                "🧩 Smart thinking! I'll help make that complex todo more manageable.",
-                "📏 Excellent! Breaking it down will make it much easier to tackle.",
-            ],
-            "multitask": [
-                "🚀 I love the productivity mindset! Let's get multiple AI agents working for you.",
-                "⚡ Perfect! Time to unleash the power of parallel processing on your todos.",
-                "🎯 Fantastic choice! Multiple tasks at once - that's how we get things done.",
-                "💪 Yes! Let's show those todos what teamwork looks like.",
-            ],
-            "run-all": [
-                "🔥 WOW! Going for the full productivity blitz - I'm impressed!",
-                "⚡ LOVE the ambition! Let's get ALL your todos handled with multiple AI agents!",
-                "🚀 This is what I call maximum efficiency! Every pending task will get attention.",
-                "💥 You're not messing around! Full power mode with up to 5 AI agents at once!",
-                "🎯 THE ULTIMATE MOVE! I'll coordinate multiple AI agents to handle everything.",
-            ],
-            "github-issues": [
-                "🐙 Absolutely! Let's see what's brewing in your GitHub repository.",
-                "📋 Great! Time to sync up with your repository and see what needs attention.",
-                "🔍 Perfect! I'll help you manage your GitHub issues like a pro.",
-            ],
-            "create-github-issue": [
-                "🐛 Good thinking! Let's document that issue properly in GitHub.",
-                "📝 Smart approach! I'll help you create a detailed GitHub issue.",
-                "🎯 Excellent! Proper issue tracking is key to good development.",
-            ],
-            "export-todos-to-github": [
-                "📤 Brilliant idea! Let's get your local todos synced with GitHub.",
-                "🔄 Perfect! Moving your work to GitHub will improve visibility and tracking.",
-                "🚀 Smart workflow! GitHub integration makes collaboration so much easier.",
-            ],
-            "parse-markdown": [
-                "📖 Clever! Let me extract all the tasks hiding in your markdown files.",
-                "🔍 Great idea! I'll scan through your docs and find all the TODOs.",
-                "📋 Perfect! Your documentation probably has tons of actionable items.",
-            ],
-            "browser-integration": [
-                "🌐 Excellent! Let's get your development environment supercharged.",
-                "⚡ Smart move! Browser integration makes development so much smoother.",
-                "🚀 Love it! Real-time feedback while you work is a game-changer.",
-            ],
-            "remove-todo": [
-                "🗑️ No problem! Let's clean up your task list.",
-                "✂️ Absolutely! Sometimes we need to declutter our workload.",
-                "🧹 Sure thing! I'll help you remove that task.",
-                "❌ Got it! Let's get rid of what you don't need anymore.",
-            ],
-            "remove-completed-todos": [
-                "🧽 Great idea! Nothing like a clean slate to feel accomplished.",
-                "✨ Perfect timing for some organizational housekeeping!",
-                "🗂️ Smart! Archiving completed work gives you a clear view of what's next.",
-                "🎉 Love it! Celebrating completed work by clearing the deck!",
-            ],
-            "mcp-management": [
-                "🔌 Excellent! Let's optimize your development tools and server setup.",
-                "⚙️ Perfect! Proper MCP configuration will supercharge your workflow.",
-                "🛠️ Smart thinking! Good tool setup saves hours of development time.",
-            ],
-            "chat": [
-                "💬 Of course! I'm here to help with whatever's on your mind.",
-                "🤔 Great question! Let me think about that with you.",
-                "💡 I love helping with problems - what's up?",
-                "🧠 Perfect! Let's put our heads together on this.",
-            ],
-            "quit": [
-                "👋 Thanks for working with me today! Take care!",
-                "😊 It was great helping you out! See you next time!",
-                "🎉 Good session! Hope I helped you get things done!",
-                "💪 Keep up the great work! I'll be here when you need me!",
-            ]
-        }
-        
         # Get a random message for variety, or fallback
-        import random
-        intent_messages = messages.get(intent, ["🤖 Let me help you with that!"])
+        intent_messages = _CONFIRMATION_MESSAGES.get(intent, ["🤖 Let me help you with that!"])
         selected_message = random.choice(intent_messages)
         
         # Add extracted parameter context if available
@@ -2,13 +2,19 @@
 Markdown Parser - Extracts tasks and todos from markdown files
 """
 
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Tuple
 from rich.console import Console
 
 console = Console()
 
+# Directories that are never searched for markdown files
+RESTRICTED_DIRS = frozenset({'vendor', 'node_modules', '.git', '__pycache__', '.pytest_cache'})
+MARKDOWN_SUFFIXES = ('.md', '.markdown')
+
 class MarkdownTaskParser:
     """Parses markdown files to extract tasks and todos"""
     
@@ -110,16 +116,25 @@ class MarkdownTaskParser:
                 return True
         return False
     
-    def _is_restricted_path(self, file_path: Path) -> bool:
-        """Check if path is in restricted directories (vendor, node_modules, etc.)"""
-        path_parts = [part.lower() for part in file_path.parts]
-        restricted_dirs = {'vendor', 'node_modules', '.git', '__pycache__', '.pytest_cache'}
-        
-        # Check if any part of the path is a restricted directory
-        for part in path_parts:
-            if part in restricted_dirs:
-                return True
-        return False
+    def _find_markdown_files(self, directory_path: Path) -> List[Path]:
+        """Recursively list markdown files, never descending into restricted or hidden directories"""
+        markdown_files = []
+        pending_dirs = [str(directory_path)]
+        while pending_dirs:
+            try:
+                with os.scandir(pending_dirs.pop()) as entries:
+                    for entry in entries:
+                        # Skip hidden files and directories
+                        if entry.name.startswith('.'):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name.lower() not in RESTRICTED_DIRS:
+                                pending_dirs.append(entry.path)
+                        elif entry.name.endswith(MARKDOWN_SUFFIXES):
+                            markdown_files.append(Path(entry.path))
+            except OSError:
+                continue
+        return sorted(markdown_files)
     
     def parse_directory(self, directory_path: str) -> List[Dict]:
         """Parse all markdown files in a directory"""
@@ -129,25 +144,18 @@ class MarkdownTaskParser:
             console.print(f"❌ Directory not found: {directory_path}")
             return []
         
-        all_tasks = []
-        markdown_files = list(directory_path.rglob("*.md")) + list(directory_path.rglob("*.markdown"))
-        
-        # Filter out files in restricted directories
-        filtered_files = []
-        for md_file in markdown_files:
-            if not self._is_restricted_path(md_file):
-                filtered_files.append(md_file)
-        
-        console.print(f"📄 Found {len(filtered_files)} markdown files (filtered {len(markdown_files) - len(filtered_files)} from restricted directories)")
+        markdown_files = self._find_markdown_files(directory_path)
+        console.print(f"📄 Found {len(markdown_files)} markdown files (skipping hidden and restricted directories)")
+        if not markdown_files:
+            return []
         
-        for md_file in filtered_files:
-            # Skip hidden files
-            if any(part.startswith('.') for part in md_file.parts):
-                continue
-                
-            console.print(f"📄 Parsing: {md_file.relative_to(directory_path)}")
-            file_tasks = self.parse_file(str(md_file))
-            all_tasks.extend(file_tasks)
+        # Files are read and parsed on a thread pool; results come back in file order
+        all_tasks = []
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(markdown_files))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for md_file, file_tasks in zip(markdown_files, pool.map(self.parse_file, markdown_files)):
+                console.print(f"📄 Parsing: {md_file.relative_to(directory_path)}")
+                all_tasks.extend(file_tasks)
         
         return all_tasks
     
@@ -164,17 +172,14 @@ class MarkdownTaskParser:
     
     def create_todos_from_tasks(self, tasks: List[Dict], todo_manager, priority: str = "medium") -> List[str]:
         """Create todo items from parsed tasks"""
-        todo_ids = []
-        
-        for task in tasks:
-            if task['status'] == 'pending':  # Only create todos for pending tasks
-                todo_id = todo_manager.add_todo(
-                    title=task['title'],
-                    description=f"From {task['section']} in {Path(task['source_file']).name}",
-                    todo_type="text",
-                    priority=priority,
-                    content=f"Source: {task['source_file']}:{task['line_number']}\nOriginal: {task['original_line']}"
-                )
-                todo_ids.append(todo_id)
-        
-        return todo_ids
\ No newline at end of file
+        return todo_manager.add_todos_bulk([
+            {
+                "title": task['title'],
+                "description": f"From {task['section']} in {Path(task['source_file']).name}",
+                "todo_type": "text",
+                "priority": priority,
+                "content": f"Source: {task['source_file']}:{task['line_number']}\nOriginal: {task['original_line']}"
+            }
+            for task in tasks
+            if task['status'] == 'pending'  # Only create todos for pending tasks
+        ])
\ No newline at end of file
@@ -116,7 +116,7 @@ class Multitasker:
         if todo.get("parent_id"):
             base_prompt += "NOTE: This is a sub-task that is part of a larger project.\n"
             base_prompt += "Focus on this specific component while keeping the broader context in mind.\n"
-        elif todo.get("sub_task_ids") and len(todo.get("sub_task_ids", [])) > 0:
+        elif todo.get("sub_task_ids"):
             base_prompt += f"NOTE: This is a parent task with {len(todo['sub_task_ids'])} sub-tasks.\n"
             base_prompt += "Provide a high-level approach that can guide the individual sub-tasks.\n"
         
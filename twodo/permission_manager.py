@@ -492,6 +492,16 @@ class SessionPermissionManager:
         if not self.current_session:
             return {}
         
+        session = self.current_session
+        # "RWX"-style flags per path and pattern, looked up against the sets
+        # rather than the lists returned below
+        access_modes = {
+            entry: ("R" if entry in session.read_permissions else "-") +
+                   ("W" if entry in session.write_permissions else "-") +
+                   ("X" if entry in session.execute_permissions else "-")
+            for entry in session.allowed_paths | session.allowed_patterns
+        }
+        
         return {
             'session_id': self.current_session.session_id,
             'created_at': self.current_session.created_at,
@@ -501,6 +511,7 @@ class SessionPermissionManager:
             'read_permissions': list(self.current_session.read_permissions),
             'write_permissions': list(self.current_session.write_permissions),
             'execute_permissions': list(self.current_session.execute_permissions),
+            'access_modes': access_modes,
         }
     
     def clear_session(self, session_id: str = None):
@@ -9,7 +9,7 @@ import re
 import json
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from rich.console import Console
 
 console = Console()
@@ -38,6 +38,13 @@ class ProjectAnalysis:
     architecture_patterns: List[str]
     potential_issues: List[Dict]
     recommendations: List[str]
+    # Per-file columns derived once from file_analyses, in the same order
+    file_names: Tuple[str, ...] = field(init=False)
+    has_test_files: bool = field(init=False)
+    
+    def __post_init__(self):
+        self.file_names = tuple(os.path.basename(fa.file_path) for fa in self.file_analyses)
+        self.has_test_files = any('test' in fa.file_path.lower() for fa in self.file_analyses)
 
 class SmartCodeAnalyzer:
     """Advanced code analysis for intelligent development assistance"""
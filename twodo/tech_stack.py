@@ -5,13 +5,17 @@ Tech Stack Detector - Analyzes repositories to detect technology stack and creat
 import os
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Set
+from typing import List, Dict, Optional, Set
 from rich.console import Console
 from .permission_manager import PermissionManager
 
 console = Console()
 
+# Suffixes whose contents are checked for Kubernetes manifests
+YAML_SUFFIXES = ('.yaml', '.yml')
+
 class TechStackDetector:
     """Detects technology stack from repository analysis"""
     
@@ -73,8 +77,14 @@ class TechStackDetector:
         }
         return dir_name.lower() in restricted_dirs or dir_name.startswith('.')
     
-    def analyze_repo(self, repo_path: str, force_reanalyze: bool = False) -> List[str]:
-        """Analyze repository to detect technology stack"""
+    def analyze_repo(self, repo_path: str, force_reanalyze: bool = False,
+                     max_workers: Optional[int] = None) -> List[str]:
+        """Analyze repository to detect technology stack
+        
+        File names are matched while walking; YAML files, the only ones whose
+        contents are read, are scanned for Kubernetes manifests on a thread pool
+        of max_workers threads (the executor default when None).
+        """
         repo_path = Path(repo_path)
         
         if not repo_path.exists():
@@ -82,6 +92,7 @@ class TechStackDetector:
             return []
         
         detected_techs = set()
+        yaml_files = []
         
         # Walk through repository files
         for root, dirs, files in os.walk(repo_path):
@@ -90,7 +101,14 @@ class TechStackDetector:
             
             for file in files:
                 file_path = Path(root) / file
-                self._analyze_file(file_path, detected_techs)
+                self._match_file_patterns(file_path, detected_techs)
+                if file_path.suffix in YAML_SUFFIXES:
+                    yaml_files.append(file_path)
+        
+        if yaml_files:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                if any(pool.map(self._is_kubernetes_manifest, yaml_files)):
+                    detected_techs.add('kubernetes')
         
         # Special analysis for package.json content
         package_json = repo_path / "package.json"
@@ -119,8 +137,8 @@ class TechStackDetector:
                 
         return sorted(tech_stack)
     
-    def _analyze_file(self, file_path: Path, detected_techs: Set[str]):
-        """Analyze a single file to detect technologies"""
+    def _match_file_patterns(self, file_path: Path, detected_techs: Set[str]):
+        """Detect technologies from a file's name alone"""
         file_name = file_path.name
         file_suffix = file_path.suffix
         
@@ -130,16 +148,16 @@ class TechStackDetector:
                 if file_name == pattern or file_name.endswith(pattern) or file_suffix == pattern:
                     detected_techs.add(tech)
                     break
-        
-        # Special cases for Kubernetes YAML files
-        if file_suffix in ['.yaml', '.yml']:
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    if any(k8s_keyword in content for k8s_keyword in ['apiVersion:', 'kind:', 'metadata:', 'spec:']):
-                        detected_techs.add('kubernetes')
-            except Exception:
-                pass
+    
+    @staticmethod
+    def _is_kubernetes_manifest(file_path: Path) -> bool:
+        """Check whether a YAML file looks like a Kubernetes manifest"""
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+            return any(k8s_keyword in content for k8s_keyword in ['apiVersion:', 'kind:', 'metadata:', 'spec:'])
+        except Exception:
+            return False
     
     def _analyze_package_json(self, package_json_path: Path, detected_techs: Set[str]):
         """Analyze package.json for specific frameworks"""
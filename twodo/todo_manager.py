@@ -2,15 +2,35 @@
 Todo Manager - Manages todo lists for codebases and projects
 """
 
+import heapq
 import json
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, asdict
 from rich.console import Console
 from .permission_manager import PermissionManager
 
+# Sort rank per priority; unknown priorities sort with "medium"
+PRIORITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+# Words suggesting a todo spans a lot of work; matched as substrings
+COMPLEXITY_KEYWORDS = (
+    "comprehensive", "complete", "full", "entire", "all", "multiple", "various",
+    "implement", "create", "build", "develop", "design", "architect",
+    "refactor", "migrate", "upgrade", "overhaul", "rewrite",
+    "system", "application", "platform", "framework", "infrastructure"
+)
+
+# Whole words joining several distinct actions in one todo
+ACTION_CONNECTORS = frozenset({"and", "also", "then", "plus", "additionally", "furthermore"})
+
+def todo_sort_key(todo: Dict):
+    """Order todos by priority, then creation time"""
+    # A missing or unknown priority sorts as medium (2)
+    return (PRIORITY_ORDER.get(todo.get("priority"), 2), todo.get("created_at", ""))
+
 @dataclass
 class Todo:
     """Represents a single todo item"""
@@ -67,6 +87,9 @@ class TodoManager:
         PermissionManager.ensure_directory_permissions(self.todo_dir)
         
         self.todos = self._load_todos()
+        # Derived views of self.todos (filtered/sorted lists, stats), rebuilt on demand
+        # after any change; every mutation goes through _save_todos
+        self._views = {}
     
     def _load_todos(self) -> List[Dict]:
         """Load todos from file"""
@@ -75,8 +98,15 @@ class TodoManager:
                 return json.load(f)
         return []
     
+    def _view(self, name, build):
+        """Return the cached view called name, building it if todos changed"""
+        if name not in self._views:
+            self._views[name] = build()
+        return self._views[name]
+    
     def _save_todos(self):
         """Save todos to file with enhanced permission handling"""
+        self._views.clear()
         try:
             # Ensure directory and file permissions
             PermissionManager.ensure_directory_permissions(self.todo_file.parent)
@@ -110,11 +140,33 @@ class TodoManager:
     
     def add_todo(self, title: str, description: str, todo_type: str, priority: str, content: Optional[str] = None) -> str:
         """Add a new todo item"""
-        todo_id = str(uuid.uuid4())[:8]
+        todo = self._new_todo(title, description, todo_type, priority, content)
+        
+        self.todos.append(todo)
+        self._save_todos()
+        return todo["id"]
+    
+    def add_todos_bulk(self, specs: List[Dict]) -> List[str]:
+        """Add several todos with a single save
+        
+        Each spec holds add_todo's keyword arguments, plus an optional parent_id.
+        Returns the new IDs in spec order.
+        """
         now = datetime.now().isoformat()
+        new_todos = [self._new_todo(now=now, **spec) for spec in specs]
         
-        todo = {
-            "id": todo_id,
+        if new_todos:
+            self.todos.extend(new_todos)
+            self._save_todos()
+        return [todo["id"] for todo in new_todos]
+    
+    def _new_todo(self, title: str, description: str, todo_type: str, priority: str,
+                  content: Optional[str] = None, parent_id: Optional[str] = None,
+                  now: Optional[str] = None) -> Dict:
+        """Build a new pending todo record"""
+        now = now or datetime.now().isoformat()
+        return {
+            "id": str(uuid.uuid4())[:8],
             "title": title,
             "description": description,
             "todo_type": todo_type,
@@ -125,40 +177,72 @@ class TodoManager:
             "updated_at": now,
             "assigned_model": None,
             "result": None,
-            "parent_id": None,
+            "parent_id": parent_id,
             "sub_task_ids": []
         }
-        
-        self.todos.append(todo)
-        self._save_todos()
-        return todo_id
     
     def get_todos(self) -> List[Dict]:
         """Get all todos"""
         return self.todos
     
     def get_pending_todos(self) -> List[Dict]:
-        """Get only pending todos"""
-        return [todo for todo in self.todos if todo["status"] == "pending"]
+        """Get only pending todos (a shared, cached list - do not modify it)"""
+        return self.get_todos_by_status("pending")
+    
+    def get_completed_todos(self) -> List[Dict]:
+        """Get only completed todos (a shared, cached list - do not modify it)"""
+        return self.get_todos_by_status("completed")
+    
+    def get_todos_by_status(self, status: str) -> List[Dict]:
+        """Get todos with the given status (a shared, cached list - do not modify it)"""
+        by_status = self._view("by_status", self._index_statuses)
+        return by_status[status] if status in by_status else []
+    
+    def _index_statuses(self) -> Dict[str, List[Dict]]:
+        """Group todos by status in a single pass"""
+        by_status = {}
+        for todo in self.todos:
+            by_status.setdefault(todo.get("status"), []).append(todo)
+        return by_status
+    
+    def get_sorted_todos(self) -> List[Dict]:
+        """Get all todos by priority, then creation time (a shared, cached list - do not modify it)"""
+        return self._view("sorted", lambda: sorted(self.todos, key=todo_sort_key))
+    
+    def get_top_todos(self, count: int) -> List[Dict]:
+        """Get the first count todos in get_sorted_todos() order without sorting them all"""
+        if "sorted" in self._views:
+            return self._views["sorted"][:count]
+        return heapq.nsmallest(count, self.todos, key=todo_sort_key)
     
     def get_todo_by_id(self, todo_id: str) -> Optional[Dict]:
         """Get a specific todo by ID"""
-        for todo in self.todos:
-            if todo["id"] == todo_id:
-                return todo
-        return None
+        # Built from the end so the first todo wins if an ID was ever duplicated
+        return self._view("by_id", lambda: {todo["id"]: todo for todo in reversed(self.todos)}).get(todo_id)
     
     def update_todo_status(self, todo_id: str, status: str, result: Optional[str] = None, assigned_model: Optional[str] = None):
         """Update todo status and result"""
+        todo = self.get_todo_by_id(todo_id)
+        if todo is not None:
+            todo["status"] = status
+            todo["updated_at"] = datetime.now().isoformat()
+            if result is not None:
+                todo["result"] = result
+            if assigned_model is not None:
+                todo["assigned_model"] = assigned_model
+        self._save_todos()
+    
+    def update_todos_bulk(self, updates: List[Tuple[str, str, Optional[str]]]):
+        """Apply several (todo_id, status, result) updates with a single save"""
+        by_id = {todo_id: (status, result) for todo_id, status, result in updates}
+        now = datetime.now().isoformat()
         for todo in self.todos:
-            if todo["id"] == todo_id:
-                todo["status"] = status
-                todo["updated_at"] = datetime.now().isoformat()
-                if result is not None:
-                    todo["result"] = result
-                if assigned_model is not None:
-                    todo["assigned_model"] = assigned_model
-                break
+            update = by_id.get(todo["id"])
+            if update is not None:
+                todo["status"] = update[0]
+                todo["updated_at"] = now
+                if update[1] is not None:
+                    todo["result"] = update[1]
         self._save_todos()
     
     def delete_todo(self, todo_id: str) -> bool:
@@ -171,6 +255,17 @@ class TodoManager:
             return True
         return False
     
+    def delete_todos(self, todo_ids: List[str]) -> int:
+        """Delete several todos by ID with a single save; returns how many were removed"""
+        ids = set(todo_ids)
+        original_length = len(self.todos)
+        self.todos = [todo for todo in self.todos if todo["id"] not in ids]
+        
+        removed = original_length - len(self.todos)
+        if removed:
+            self._save_todos()
+        return removed
+    
     def get_todos_by_type(self, todo_type: str) -> List[Dict]:
         """Get todos by type"""
         return [todo for todo in self.todos if todo["todo_type"] == todo_type]
@@ -181,18 +276,13 @@ class TodoManager:
     
     def get_completion_stats(self) -> Dict[str, int]:
         """Get completion statistics"""
-        stats = {
-            "total": len(self.todos),
-            "pending": 0,
-            "in_progress": 0,
-            "completed": 0,
-            "failed": 0
-        }
-        
-        for todo in self.todos:
-            status = todo["status"]
-            if status in stats:
-                stats[status] += 1
+        return dict(self._view("stats", self._count_statuses))
+    
+    def _count_statuses(self) -> Dict[str, int]:
+        """Count todos per status"""
+        stats = {"total": len(self.todos)}
+        for status in ("pending", "in_progress", "completed", "failed"):
+            stats[status] = len(self.get_todos_by_status(status))
         
         return stats
     
@@ -235,35 +325,35 @@ class TodoManager:
     
     def is_todo_too_large(self, todo: Dict) -> bool:
         """Analyze if a todo is too large and should be broken down into sub-tasks"""
-        
-        # Calculate total content length
-        total_content_length = len(todo.get("title", "") + todo.get("description", "") + (todo.get("content") or ""))
-        
-        # Check for complexity indicators
-        content_text = (todo.get("title", "") + " " + todo.get("description", "") + " " + (todo.get("content") or "")).lower()
-        
-        complexity_keywords = [
-            "comprehensive", "complete", "full", "entire", "all", "multiple", "various",
-            "implement", "create", "build", "develop", "design", "architect",
-            "refactor", "migrate", "upgrade", "overhaul", "rewrite",
-            "system", "application", "platform", "framework", "infrastructure"
-        ]
-        
-        complexity_score = sum(1 for keyword in complexity_keywords if keyword in content_text)
+        title = todo.get("title", "")
+        description = todo.get("description", "")
+        content = todo.get("content") or ""
         
         # Large todo criteria:
         # 1. Content length > 500 characters
         # 2. High complexity score (3+ complexity keywords)
         # 3. Multiple distinct actions indicated
-        multiple_actions = len([word for word in content_text.split() if word in ["and", "also", "then", "plus", "additionally", "furthermore"]])
+        # Each check stops as soon as its threshold is reached.
+        if len(title) + len(description) + len(content) > 500:
+            return True
         
-        is_large = (
-            total_content_length > 500 or
-            complexity_score >= 3 or
-            multiple_actions >= 2
-        )
+        content_text = f"{title} {description} {content}".lower()
         
-        return is_large
+        complexity_score = 0
+        for keyword in COMPLEXITY_KEYWORDS:
+            if keyword in content_text:
+                complexity_score += 1
+                if complexity_score >= 3:
+                    return True
+        
+        multiple_actions = 0
+        for word in content_text.split():
+            if word in ACTION_CONNECTORS:
+                multiple_actions += 1
+                if multiple_actions >= 2:
+                    return True
+        
+        return False
     
     def create_sub_tasks_from_todo(self, parent_todo_id: str, ai_router=None) -> List[str]:
         """Create sub-tasks from a large todo using AI analysis"""
@@ -335,22 +425,19 @@ class TodoManager:
                 json_str = ai_response[start_idx:end_idx]
                 sub_tasks_data = json.loads(json_str)
                 
-                sub_task_ids = []
-                for i, sub_task in enumerate(sub_tasks_data, 1):
-                    # Create each sub-task with the parent's type and adjusted priority
-                    sub_priority = "medium" if parent_todo['priority'] in ["high", "critical"] else "low"
-                    
-                    sub_task_id = self.add_todo(
-                        title=f"{i}. {sub_task['title']}",
-                        description=sub_task['description'],
-                        todo_type=parent_todo['todo_type'],
-                        priority=sub_priority,
-                        content=None,
-                        parent_id=parent_todo['id']
-                    )
-                    sub_task_ids.append(sub_task_id)
-                
-                return sub_task_ids
+                # Create each sub-task with the parent's type and adjusted priority
+                sub_priority = "medium" if parent_todo['priority'] in ["high", "critical"] else "low"
+                return self.add_todos_bulk([
+                    {
+                        "title": f"{i}. {sub_task['title']}",
+                        "description": sub_task['description'],
+                        "todo_type": parent_todo['todo_type'],
+                        "priority": sub_priority,
+                        "content": None,
+                        "parent_id": parent_todo['id']
+                    }
+                    for i, sub_task in enumerate(sub_tasks_data, 1)
+                ])
                 
         except Exception as e:
             console = Console()
@@ -362,8 +449,6 @@ class TodoManager:
     
     def _generate_subtasks_simple(self, parent_todo: Dict) -> List[str]:
         """Generate sub-tasks using simple rule-based approach"""
-        sub_task_ids = []
-        
         # Create generic sub-tasks based on todo type
         if parent_todo['todo_type'] == 'code':
             subtasks = [
@@ -387,27 +472,34 @@ class TodoManager:
                 ("Review Phase", "Review and validate the results")
             ]
         
-        for title, description in subtasks:
-            sub_task_id = self.add_todo(
-                title=f"{parent_todo['title']} - {title}",
-                description=description,
-                todo_type=parent_todo['todo_type'],
-                priority=parent_todo['priority'],
-                content=f"Sub-task of: {parent_todo['title']}"
-            )
-            
-            # Set parent relationship
-            sub_task = self.get_todo_by_id(sub_task_id)
-            if sub_task:
-                sub_task["parent_id"] = parent_todo["id"]
-                sub_task_ids.append(sub_task_id)
-        
-        self._save_todos()
-        return sub_task_ids
+        return self.add_todos_bulk([
+            {
+                "title": f"{parent_todo['title']} - {title}",
+                "description": description,
+                "todo_type": parent_todo['todo_type'],
+                "priority": parent_todo['priority'],
+                "content": f"Sub-task of: {parent_todo['title']}",
+                "parent_id": parent_todo["id"]
+            }
+            for title, description in subtasks
+        ])
     
     def get_sub_tasks(self, parent_todo_id: str) -> List[Dict]:
         """Get all sub-tasks for a parent todo"""
-        return [todo for todo in self.todos if todo.get("parent_id") == parent_todo_id]
+        return list(self.get_subtasks_by_parent().get(parent_todo_id, ()))
+    
+    def get_subtasks_by_parent(self) -> Dict[str, List[Dict]]:
+        """Map each parent todo ID to its sub-tasks (a shared, cached dict - do not modify it)"""
+        return self._view("by_parent", self._index_sub_tasks)
+    
+    def _index_sub_tasks(self) -> Dict[str, List[Dict]]:
+        """Group sub-tasks by parent ID in a single pass"""
+        by_parent = {}
+        for todo in self.todos:
+            parent_id = todo.get("parent_id")
+            if parent_id:
+                by_parent.setdefault(parent_id, []).append(todo)
+        return by_parent
     
     def get_parent_todo(self, sub_task_id: str) -> Optional[Dict]:
         """Get the parent todo for a sub-task"""